@@ -0,0 +1,100 @@
+import hashlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from app.core.constants import RESPONSE_CACHE_MAX_BODY_BYTES, RESPONSE_CACHE_SIZE
+from app.services.table_versions import TableVersions, table_versions
+
+__all__ = ["strong_etag", "conditional_response", "ResponseCache", "response_cache"]
+
+_JSON = "application/json"
+
+
+def strong_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    return header.strip() == "*" or etag in (candidate.strip() for candidate in header.split(","))
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    etag: str | None = None,
+    media_type: str = _JSON,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Answer with ``body`` and a strong ETag, or with an empty 304 when the client already holds that ETag."""
+
+    etag = etag or strong_etag(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", **(headers or {})}
+    if _matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(body, media_type=media_type, headers=headers)
+
+
+class ResponseCache:
+    """
+    Serialized responses of read endpoints keyed by request and the versions of the tables they read.
+
+    A request whose key is cached is answered from memory, a 304 when ``If-None-Match`` matches and the stored body
+    otherwise, without touching the database or serializing anything. Any write to one of the tables changes the key,
+    so stale entries are never served and simply age out of the LRU. When table versions are unknown the endpoint
+    runs normally and only the strong ETag is added.
+
+    ``load`` must read from the primary: a lagging replica could return data older than the versions it is keyed by.
+    """
+
+    def __init__(self, versions: TableVersions = table_versions, maxsize: int = RESPONSE_CACHE_SIZE) -> None:
+        self._versions = versions
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[str, bytes]] = OrderedDict()
+
+    async def respond(
+        self,
+        request: Request,
+        tables: tuple[str, ...],
+        adapter: TypeAdapter,
+        load: Callable[[], Awaitable[Any]],
+        vary: Hashable = None,
+    ) -> Response:
+        """
+        Args:
+            request: Incoming request; its path and query string are part of the key
+            tables: Every table the response is built from
+            adapter: Serializer of the value returned by ``load``
+            load: Builds the response value from the database
+            vary: Anything else the response depends on, such as the caller's identity
+        """
+
+        # Versions are read before loading, so a stored body is never older than the versions it is keyed by.
+        versions = self._versions.get(*tables)
+        key = None
+        if versions is not None:
+            key = (request.url.path, request.url.query, tables, versions, vary)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return conditional_response(request, entry[1], etag=entry[0])
+
+        body = adapter.dump_json(await load())
+        etag = strong_etag(body)
+        if key is not None and self._versions.get(*tables) == versions and len(body) <= RESPONSE_CACHE_MAX_BODY_BYTES:
+            self._entries[key] = (etag, body)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return conditional_response(request, body, etag=etag)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+response_cache = ResponseCache()
@@ -1,12 +1,105 @@
+import secrets
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import Depends
+from fastapi import Depends, Query, WebSocketException, status
+from fastapi.requests import HTTPConnection
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBasic, HTTPBasicCredentials, HTTPBearer
 
+from app.core import settings
+from app.core.exc import NotAuthorizedException
+from app.enums import UserRoleInOrgEnum
+from app.schemas.auth import Principal
+from app.services.access import AccessService
 from app.uow.base import ABCUnitOfWork
-from app.uow.sql import SQLUnitOfWork
+from app.uow.sql import ReadOnlySQLUnitOfWork, SQLUnitOfWork
+from app.utils.token_manager import jwt_token_manager
 
 __all__ = [
     "SQLUnitOfWorkDep",
+    "ReadOnlySQLUnitOfWorkDep",
+    "AdminDep",
+    "CurrentPrincipalDep",
+    "ConnectionPrincipalDep",
+    "require_organization_role",
 ]
 
 SQLUnitOfWorkDep = Annotated[ABCUnitOfWork, Depends(SQLUnitOfWork)]
+ReadOnlySQLUnitOfWorkDep = Annotated[ABCUnitOfWork, Depends(ReadOnlySQLUnitOfWork)]
+
+
+def _verify_admin(credentials: Annotated[HTTPBasicCredentials, Depends(HTTPBasic())]) -> None:
+    username_ok = secrets.compare_digest(credentials.username.encode(), settings.admin.USERNAME.encode())
+    password_ok = secrets.compare_digest(credentials.password.encode(), settings.admin.PASSWORD.encode())
+    if not (username_ok and password_ok):
+        raise NotAuthorizedException()
+
+
+AdminDep = Depends(_verify_admin)
+
+
+def _principal_from_token(token: str | None) -> Principal:
+    if token is None:
+        raise NotAuthorizedException()
+
+    payload = jwt_token_manager.decode_token(token)
+    if payload is None:
+        raise NotAuthorizedException()
+
+    try:
+        user_id = UUID(payload["sub"])
+    except (TypeError, ValueError):
+        raise NotAuthorizedException()
+
+    expires_at = payload.get("exp")
+    return Principal(
+        user_id=user_id,
+        expires_at=datetime.fromtimestamp(expires_at, timezone.utc) if expires_at is not None else None,
+    )
+
+
+def _get_current_principal(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(HTTPBearer(auto_error=False))],
+) -> Principal:
+    return _principal_from_token(credentials.credentials if credentials is not None else None)
+
+
+def _get_connection_principal(
+    connection: HTTPConnection, access_token: Annotated[str | None, Query()] = None
+) -> Principal:
+    """
+    Principal of a WebSocket or server-sent events connection.
+
+    Browsers cannot set headers on ``WebSocket`` and ``EventSource``, so the token may also come in the
+    ``access_token`` query parameter; a bearer ``Authorization`` header takes precedence. A refused WebSocket
+    handshake is closed with a policy violation.
+    """
+
+    scheme, _, token = connection.headers.get("Authorization", "").partition(" ")
+    try:
+        return _principal_from_token(token if scheme.lower() == "bearer" and token else access_token)
+    except NotAuthorizedException:
+        if connection.scope["type"] == "websocket":
+            raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+        raise
+
+
+# FastAPI resolves a dependency once per request, so every consumer of the principal shares one lookup.
+CurrentPrincipalDep = Annotated[Principal, Depends(_get_current_principal)]
+ConnectionPrincipalDep = Annotated[Principal, Depends(_get_connection_principal)]
+
+
+def require_organization_role(minimum: UserRoleInOrgEnum) -> Callable[..., Awaitable[Principal]]:
+    """
+    Build a dependency that admits principals holding at least ``minimum`` in the ``organization_id`` of the path.
+
+    Roles are read from the membership cache, so authorization costs no query while the user's entry is fresh.
+    """
+
+    async def _require_role(organization_id: UUID, principal: CurrentPrincipalDep) -> Principal:
+        await AccessService.authorize_organizations(principal, (organization_id,), minimum)
+        return principal
+
+    return _require_role
@@ -0,0 +1,100 @@
+import math
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import settings
+from app.core.config.db import DataBaseConfig
+from app.core.constants import LAST_WRITE_COOKIE
+from app.infra.database import ReplicaRouter, replica_router
+from app.utils.metrics import HTTP_REQUEST_DURATION
+
+__all__ = ["MetricsMiddleware", "ReadYourWritesMiddleware"]
+
+
+class MetricsMiddleware:
+    """
+    Records request latency per route template.
+
+    A plain ASGI middleware rather than ``BaseHTTPMiddleware``, so responses are not re-wrapped and streaming
+    endpoints are unaffected. Requests that match no route share one label to keep the series count bounded.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"], route.path if route is not None else "unmatched", str(status_code)
+            ).observe(time.perf_counter() - started)
+
+
+class ReadYourWritesMiddleware:
+    """
+    Carries the time of a client's last committed write between requests in the ``LAST_WRITE_COOKIE`` cookie.
+
+    Each request starts a write fence from the cookie, so its reads only go to replicas that have replayed that
+    write, whichever worker or node served it. A request that commits sets the cookie to the new commit time. It
+    expires after ``REPLICA_MAX_LAG_SECONDS``, past which every replica eligible for reads has replayed the write.
+    """
+
+    def __init__(
+        self, app: ASGIApp, router: ReplicaRouter = replica_router, config: DataBaseConfig = settings.db
+    ) -> None:
+        self.app = app
+        self._router = router
+        self._max_age = math.ceil(config.REPLICA_MAX_LAG_SECONDS)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        received = self._read_cookie(scope)
+        fence = self._router.begin(received)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and fence.written_at != received:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Set-Cookie",
+                    f"{LAST_WRITE_COOKIE}={fence.written_at:.6f}; Max-Age={self._max_age}; Path=/; HttpOnly; "
+                    "SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _read_cookie(self, scope: Scope) -> float | None:
+        value = HTTPConnection(scope).cookies.get(LAST_WRITE_COOKIE)
+        if value is None:
+            return None
+        try:
+            written_at = float(value)
+        except ValueError:
+            return None
+
+        now = time.time()
+        if not math.isfinite(written_at) or written_at < now - self._max_age:
+            return None
+        # A fence in the future would pin the client to the primary; it cannot be later than now.
+        return min(written_at, now)
@@ -0,0 +1,45 @@
+from fastapi import APIRouter
+
+from app.api.dependencies import AdminDep, SQLUnitOfWorkDep
+from app.schemas.storage import ChunkRead, ChunksDrop, ChunksDropResult, RetentionResult, StoragePolicies
+from app.services.storage import StorageService
+
+__all__ = ["router"]
+
+router = APIRouter(prefix="/admin/storage", tags=["Admin"], dependencies=[AdminDep])
+
+
+@router.get("/chunks")
+async def get_chunks(uow: SQLUnitOfWorkDep) -> list[ChunkRead]:
+    async with uow:
+        return await StorageService.get_chunks(uow)
+
+
+@router.post("/chunks/{chunk_name}/compress")
+async def compress_chunk(chunk_name: str, uow: SQLUnitOfWorkDep, recompress: bool = False) -> ChunkRead:
+    async with uow:
+        return await StorageService.compress_chunk(uow, chunk_name, recompress)
+
+
+@router.post("/chunks/{chunk_name}/decompress")
+async def decompress_chunk(chunk_name: str, uow: SQLUnitOfWorkDep) -> ChunkRead:
+    async with uow:
+        return await StorageService.decompress_chunk(uow, chunk_name)
+
+
+@router.post("/chunks/drop")
+async def drop_chunks(data: ChunksDrop, uow: SQLUnitOfWorkDep) -> ChunksDropResult:
+    async with uow:
+        return await StorageService.drop_chunks(uow, data)
+
+
+@router.post("/policies/sync")
+async def sync_policies(uow: SQLUnitOfWorkDep) -> StoragePolicies:
+    async with uow:
+        return await StorageService.sync_policies(uow)
+
+
+@router.post("/retention/organizations")
+async def apply_organization_retention(uow: SQLUnitOfWorkDep) -> RetentionResult:
+    async with uow:
+        return await StorageService.apply_organization_retention(uow)
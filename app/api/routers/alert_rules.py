@@ -0,0 +1,48 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Query, Request, Response, status
+from pydantic import TypeAdapter
+
+from app.api.caching import response_cache
+from app.api.dependencies import CurrentPrincipalDep, SQLUnitOfWorkDep
+from app.schemas.alert import AlertRuleCreate, AlertRuleRead, AlertRulesQuery
+from app.services.access import AccessService
+from app.services.alert_rule import AlertRuleService
+
+__all__ = ["router"]
+
+router = APIRouter(prefix="/alert-rules", tags=["Alert rules"])
+
+_ALERT_RULES = TypeAdapter(list[AlertRuleRead])
+
+
+@router.get("", response_model=list[AlertRuleRead])
+async def get_alert_rules(
+    request: Request,
+    query: Annotated[AlertRulesQuery, Query()],
+    uow: SQLUnitOfWorkDep,
+    principal: CurrentPrincipalDep,
+) -> Response:
+    # Members may list rules; checked before the cache, which is shared by every caller of the same URL.
+    await AccessService.authorize_sensors(principal, (query.sensor_id,))
+
+    async def load() -> list[AlertRuleRead]:
+        async with uow:
+            return await AlertRuleService.get_multi(uow, query)
+
+    return await response_cache.respond(request, ("alert_rules",), _ALERT_RULES, load)
+
+
+@router.post("", status_code=status.HTTP_201_CREATED)
+async def create_alert_rule(
+    data: AlertRuleCreate, uow: SQLUnitOfWorkDep, principal: CurrentPrincipalDep
+) -> AlertRuleRead:
+    async with uow:
+        return await AlertRuleService.create(uow, data, principal)
+
+
+@router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_alert_rule(rule_id: UUID, uow: SQLUnitOfWorkDep, principal: CurrentPrincipalDep) -> None:
+    async with uow:
+        await AlertRuleService.delete(uow, rule_id, principal)
@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from app.api.dependencies import CurrentPrincipalDep, ReadOnlySQLUnitOfWorkDep
+from app.schemas.alert import AlertRead, AlertsPageQuery
+from app.schemas.base import CursorPage
+from app.services.access import AccessService
+from app.services.alert import AlertService
+
+__all__ = ["router"]
+
+router = APIRouter(prefix="/alerts", tags=["Alerts"])
+
+
+@router.get("")
+async def get_alerts(
+    query: Annotated[AlertsPageQuery, Query()], uow: ReadOnlySQLUnitOfWorkDep, principal: CurrentPrincipalDep
+) -> CursorPage[AlertRead]:
+    if query.sensor_id is not None:
+        await AccessService.authorize_sensors(principal, (query.sensor_id,))
+    if query.organization_id is not None:
+        await AccessService.authorize_organizations(principal, (query.organization_id,))
+    async with uow:
+        return await AlertService.get_page(uow, query)
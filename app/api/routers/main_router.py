@@ -1,5 +1,14 @@
 from fastapi import APIRouter
 
+from app.api.routers import admin, alert_rules, alerts, readings, sensors, stream
+
 __all__ = ["router"]
 
 router = APIRouter(prefix="/api/v1")
+
+router.include_router(admin.router)
+router.include_router(alerts.router)
+router.include_router(alert_rules.router)
+router.include_router(readings.router)
+router.include_router(sensors.router)
+router.include_router(stream.router)
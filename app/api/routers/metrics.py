@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from app.utils.metrics import generate_metrics
+
+__all__ = ["router"]
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False, response_class=Response)
+def get_metrics() -> Response:
+    return Response(generate_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,102 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query, status
+from fastapi.responses import Response, StreamingResponse
+
+from app.api.dependencies import CurrentPrincipalDep, ReadOnlySQLUnitOfWorkDep
+from app.schemas.base import CursorPage
+from app.schemas.reading import (
+    ReadingRead,
+    ReadingsDownsampled,
+    ReadingsDownsampleQuery,
+    ReadingsExportQuery,
+    ReadingsGapfill,
+    ReadingsGapfillQuery,
+    ReadingsIngest,
+    ReadingsIngestResult,
+    ReadingsMatrix,
+    ReadingsMatrixQuery,
+    ReadingsPageQuery,
+    ReadingsSeries,
+    ReadingsSeriesQuery,
+)
+from app.services.access import AccessService
+from app.services.reading import ReadingService
+from app.utils.columnar import ColumnarStreamWriter
+
+__all__ = ["router"]
+
+router = APIRouter(prefix="/readings", tags=["Readings"])
+
+
+@router.get("")
+async def get_readings(
+    query: Annotated[ReadingsPageQuery, Query()], uow: ReadOnlySQLUnitOfWorkDep, principal: CurrentPrincipalDep
+) -> CursorPage[ReadingRead]:
+    await AccessService.authorize_sensors(principal, (query.sensor_id,))
+    async with uow:
+        return await ReadingService.get_page(uow, query)
+
+
+@router.post("/ingest", status_code=status.HTTP_202_ACCEPTED)
+async def ingest_readings(data: ReadingsIngest, principal: CurrentPrincipalDep) -> ReadingsIngestResult:
+    await AccessService.authorize_sensors(principal, (item.sensor_id for item in data.items))
+    return await ReadingService.ingest(data)
+
+
+@router.get("/series")
+async def get_readings_series(
+    query: Annotated[ReadingsSeriesQuery, Query()], uow: ReadOnlySQLUnitOfWorkDep, principal: CurrentPrincipalDep
+) -> ReadingsSeries:
+    await AccessService.authorize_sensors(principal, query.sensor_ids)
+    async with uow:
+        return await ReadingService.get_series(uow, query)
+
+
+@router.get("/gapfill")
+async def get_readings_gapfill(
+    query: Annotated[ReadingsGapfillQuery, Query()], uow: ReadOnlySQLUnitOfWorkDep, principal: CurrentPrincipalDep
+) -> ReadingsGapfill:
+    await AccessService.authorize_sensors(principal, query.sensor_ids)
+    async with uow:
+        return await ReadingService.get_gapfilled(uow, query)
+
+
+@router.get(
+    "/matrix",
+    response_model=ReadingsMatrix,
+    responses={200: {"content": {media_type: {} for media_type in ColumnarStreamWriter.MEDIA_TYPES.values()}}},
+)
+async def get_readings_matrix(
+    query: Annotated[ReadingsMatrixQuery, Query()], uow: ReadOnlySQLUnitOfWorkDep, principal: CurrentPrincipalDep
+) -> Response:
+    if query.opc_server_id is not None:
+        await AccessService.authorize_opc_server(principal, query.opc_server_id)
+    if query.sensor_ids is not None:
+        await AccessService.authorize_sensors(principal, query.sensor_ids)
+    async with uow:
+        body = await ReadingService.get_matrix(uow, query)
+    media_type = ColumnarStreamWriter.MEDIA_TYPES[query.format] if query.format else "application/json"
+    return Response(body, media_type=media_type)
+
+
+@router.get("/downsampled", response_model=ReadingsDownsampled)
+async def get_readings_downsampled(
+    query: Annotated[ReadingsDownsampleQuery, Query()], uow: ReadOnlySQLUnitOfWorkDep, principal: CurrentPrincipalDep
+) -> Response:
+    await AccessService.authorize_sensors(principal, query.sensor_ids)
+    async with uow:
+        body = await ReadingService.get_downsampled(uow, query)
+    return Response(body, media_type="application/json")
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_readings(
+    query: Annotated[ReadingsExportQuery, Query()], uow: ReadOnlySQLUnitOfWorkDep, principal: CurrentPrincipalDep
+) -> StreamingResponse:
+    await AccessService.authorize_sensors(principal, query.sensor_ids)
+    return StreamingResponse(
+        ReadingService.export(uow, query),
+        media_type=ColumnarStreamWriter.MEDIA_TYPES[query.format],
+        headers={"Content-Disposition": f'attachment; filename="readings.{query.format}"'},
+    )
@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from app.api.dependencies import CurrentPrincipalDep
+from app.schemas.sensor import SensorLatestQuery, SensorLatestRead
+from app.services.access import AccessService
+from app.services.sensor import SensorService
+
+__all__ = ["router"]
+
+router = APIRouter(prefix="/sensors", tags=["Sensors"])
+
+
+@router.get("/latest")
+async def get_latest_values(
+    query: Annotated[SensorLatestQuery, Query()], principal: CurrentPrincipalDep
+) -> list[SensorLatestRead]:
+    if query.opc_server_id is not None:
+        await AccessService.authorize_opc_server(principal, query.opc_server_id)
+    if query.organization_id is not None:
+        await AccessService.authorize_organizations(principal, (query.organization_id,))
+    if query.sensor_ids is not None:
+        await AccessService.authorize_sensors(principal, query.sensor_ids)
+    return SensorService.get_latest(query)
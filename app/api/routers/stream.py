@@ -0,0 +1,30 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query, WebSocket
+from fastapi.responses import StreamingResponse
+
+from app.api.dependencies import ConnectionPrincipalDep
+from app.schemas.stream import StreamQuery
+from app.services.stream import StreamService
+
+__all__ = ["router"]
+
+router = APIRouter(prefix="/stream", tags=["Stream"])
+
+
+@router.websocket("/ws")
+async def stream_websocket(
+    websocket: WebSocket, query: Annotated[StreamQuery, Query()], principal: ConnectionPrincipalDep
+) -> None:
+    await StreamService.serve_websocket(websocket, query, principal)
+
+
+@router.get("/sse", response_class=StreamingResponse)
+async def stream_server_sent_events(
+    query: Annotated[StreamQuery, Query()], principal: ConnectionPrincipalDep
+) -> StreamingResponse:
+    return StreamingResponse(
+        await StreamService.server_sent_events(query, principal),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+import functools
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from starlette.status import HTTP_401_UNAUTHORIZED
 
+from app.api.caching import conditional_response, strong_etag
 from app.core.config import settings
 
 __all__ = ["router"]
@@ -33,16 +37,23 @@ async def get_redoc() -> HTMLResponse:
     )
 
 
+@functools.cache
+def _openapi_document() -> tuple[bytes, str]:
+    """The routes are fixed once the app is built, so the schema is generated and serialized once per process."""
+    from app.api.routers.main_router import router
+
+    body = orjson.dumps(get_openapi(version="1.0.0", title="Control System OpenApi", routes=router.routes))
+    return body, strong_etag(body)
+
+
 @router.get(
     "/openapi.json",
     include_in_schema=False,
     response_class=JSONResponse,
 )
-async def get_openapi_json(creds: HTTPBasicCredentials = Depends(security)) -> JSONResponse:
-    from app.api.routers.main_router import router
-
+async def get_openapi_json(request: Request, creds: HTTPBasicCredentials = Depends(security)) -> Response:
     if creds.username != settings.swagger.USERNAME or creds.password != settings.swagger.PASSWORD:
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED)
 
-    openapi_schema = get_openapi(version="1.0.0", title="Control System OpenApi", routes=router.routes)
-    return JSONResponse(openapi_schema)
+    body, etag = _openapi_document()
+    return conditional_response(request, body, etag=etag)
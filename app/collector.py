@@ -0,0 +1,16 @@
+import asyncio
+
+from app.infra.database.db import engine
+from app.services.collector import CollectorService
+from app.services.collector_shards import CollectorShards
+
+
+async def main() -> None:
+    try:
+        await CollectorService(shards=CollectorShards()).run()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
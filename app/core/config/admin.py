@@ -0,0 +1,8 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class AdminConfig(BaseConfig):
+    USERNAME: str = Field(..., alias="ADMIN_USERNAME")
+    PASSWORD: str = Field(..., alias="ADMIN_PASSWORD")
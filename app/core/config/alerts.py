@@ -0,0 +1,7 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class AlertsConfig(BaseConfig):
+    RULES_REFRESH_INTERVAL_SECONDS: float = Field(30.0, alias="ALERTS_RULES_REFRESH_INTERVAL_SECONDS")
@@ -9,3 +9,5 @@ class AuthConfig(BaseConfig):
     ACCESS_TOKEN_EXPIRE_HOURS: int = Field(24, alias="AUTH_ACCESS_TOKEN_EXPIRE_HOURS")
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(14, alias="AUTH_REFRESH_TOKEN_EXPIRE_DAYS")
     VERIFICATION_EXPIRE_MINUTES: int = Field(60, alias="AUTH_VERIFICATION_EXPIRE_MINUTES")
+    TOKEN_CACHE_SIZE: int = Field(10_000, alias="AUTH_TOKEN_CACHE_SIZE")
+    TOKEN_CACHE_MAX_TTL_SECONDS: float = Field(300.0, alias="AUTH_TOKEN_CACHE_MAX_TTL_SECONDS")
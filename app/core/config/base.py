@@ -4,4 +4,5 @@ __all__ = ["BaseConfig"]
 
 
 class BaseConfig(BaseSettings):
-    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, extra="ignore")
+    # Blank values, as in a copy of .env.sample, fall back to the defaults.
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, extra="ignore", env_ignore_empty=True)
@@ -0,0 +1,20 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class CollectorConfig(BaseConfig):
+    # Collector processes sharing the database across all nodes, counted in the connection budget of ``pool_limits``.
+    NODES: int = Field(1, alias="COLLECTOR_NODES", ge=0)
+    PUBLISHING_INTERVAL_MS: int = Field(1000, alias="COLLECTOR_PUBLISHING_INTERVAL_MS")
+    REQUEST_TIMEOUT_SECONDS: float = Field(10.0, alias="COLLECTOR_REQUEST_TIMEOUT_SECONDS")
+    HEALTH_CHECK_INTERVAL_SECONDS: float = Field(5.0, alias="COLLECTOR_HEALTH_CHECK_INTERVAL_SECONDS")
+    RECONNECT_MIN_SECONDS: float = Field(1.0, alias="COLLECTOR_RECONNECT_MIN_SECONDS")
+    RECONNECT_MAX_SECONDS: float = Field(60.0, alias="COLLECTOR_RECONNECT_MAX_SECONDS")
+    REFRESH_INTERVAL_SECONDS: float = Field(30.0, alias="COLLECTOR_REFRESH_INTERVAL_SECONDS")
+    HEARTBEAT_INTERVAL_SECONDS: float = Field(5.0, alias="COLLECTOR_HEARTBEAT_INTERVAL_SECONDS", gt=0)
+    LEASE_TTL_SECONDS: float = Field(15.0, alias="COLLECTOR_LEASE_TTL_SECONDS", gt=0)
+    CERTIFICATE_PATH: str | None = Field(None, alias="COLLECTOR_CERTIFICATE_PATH")
+    PRIVATE_KEY_PATH: str | None = Field(None, alias="COLLECTOR_PRIVATE_KEY_PATH")
+    # Comma separated Fernet keys for OPC server passwords; the first one encrypts, all of them decrypt.
+    PASSWORD_ENCRYPTION_KEYS: str | None = Field(None, alias="COLLECTOR_PASSWORD_ENCRYPTION_KEYS")
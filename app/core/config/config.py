@@ -1,6 +1,18 @@
+from pydantic import Field, model_validator
+
+from app.core.config.admin import AdminConfig
+from app.core.config.alerts import AlertsConfig
 from app.core.config.base import BaseConfig
 from app.core.config.db import DataBaseConfig
 from app.core.config.auth import AuthConfig
+from app.core.config.collector import CollectorConfig
+from app.core.config.ingest import IngestConfig
+from app.core.config.latest_values import LatestValuesConfig
+from app.core.config.membership import MembershipConfig
+from app.core.config.metrics import MetricsConfig
+from app.core.config.scheduler import SchedulerConfig
+from app.core.config.storage import StorageConfig
+from app.core.config.stream import StreamConfig
 from app.core.config.swagger import SwaggerConfig
 
 __all__ = ["Settings", "settings"]
@@ -10,12 +22,28 @@ class Settings(BaseConfig):
     SERVER_HOST: str
     SERVER_PORT: int
     RELOAD: bool = False
+    WORKERS: int = Field(1, ge=1)
 
     FRONTEND_URL: list[str]
 
     db: DataBaseConfig = DataBaseConfig()
     auth: AuthConfig = AuthConfig()
+    membership: MembershipConfig = MembershipConfig()
     swagger: SwaggerConfig = SwaggerConfig()
+    admin: AdminConfig = AdminConfig()
+    collector: CollectorConfig = CollectorConfig()
+    ingest: IngestConfig = IngestConfig()
+    latest_values: LatestValuesConfig = LatestValuesConfig()
+    stream: StreamConfig = StreamConfig()
+    alerts: AlertsConfig = AlertsConfig()
+    storage: StorageConfig = StorageConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    scheduler: SchedulerConfig = SchedulerConfig()
+
+    @model_validator(mode="after")
+    def _check_pool_limits(self) -> "Settings":
+        self.db.pool_limits(self.WORKERS, self.collector.NODES)
+        return self
 
 
 settings = Settings()
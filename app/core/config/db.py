@@ -1,4 +1,8 @@
-from pydantic import Field
+import json
+from typing import Annotated, Any
+
+from pydantic import AliasChoices, Field, field_validator
+from pydantic_settings import NoDecode
 
 from app.core.config.base import BaseConfig
 
@@ -11,11 +15,72 @@ class DataBaseConfig(BaseConfig):
     DB: str = Field(..., alias="POSTGRES_DB")
     DATA_VOLUME_NAME: str = "timescale_db_data"
 
-    POOL_SIZE: int = 50
-    MAX_OVERFLOW: int = 10
+    # Left unset, pool size and overflow are derived per process from ``MAX_CONNECTIONS``, see ``pool_limits``.
+    POOL_SIZE: int | None = Field(None, validation_alias=AliasChoices("POSTGRES_POOL_SIZE", "POOL_SIZE"))
+    MAX_OVERFLOW: int | None = Field(None, validation_alias=AliasChoices("POSTGRES_MAX_OVERFLOW", "MAX_OVERFLOW"))
     POOL_RECYCLE: int = 1800
+    MAX_CONNECTIONS: int = Field(100, alias="POSTGRES_MAX_CONNECTIONS")
+    RESERVED_CONNECTIONS: int = Field(10, alias="POSTGRES_RESERVED_CONNECTIONS")
+
+    # ``host`` or ``host:port`` entries, comma separated or as a JSON list.
+    REPLICA_HOSTS: Annotated[list[str], NoDecode] = Field([], alias="POSTGRES_REPLICA_HOSTS")
+    REPLICA_MAX_LAG_SECONDS: float = Field(5.0, alias="POSTGRES_REPLICA_MAX_LAG_SECONDS")
+    REPLICA_CHECK_INTERVAL_SECONDS: float = Field(2.0, alias="POSTGRES_REPLICA_CHECK_INTERVAL_SECONDS")
+
+    @field_validator("REPLICA_HOSTS", mode="before")
+    @classmethod
+    def _split_replica_hosts(cls, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        if value.lstrip().startswith("["):
+            return json.loads(value)
+        return [host.strip() for host in value.split(",") if host.strip()]
+
+    def pool_limits(self, workers: int, collectors: int) -> tuple[int, int]:
+        """
+        Pool size and max overflow of each process when the API runs ``workers`` worker processes and ``collectors``
+        collector processes run against the same database.
+
+        The connection budget, ``MAX_CONNECTIONS`` minus ``RESERVED_CONNECTIONS`` for migrations and manual sessions,
+        is split evenly between the workers and the collectors. Every process also holds one LISTEN connection and,
+        while it leads scheduled jobs or collects OPC servers, one advisory lock connection outside its pool. About a
+        fifth of each share is overflow. Explicit ``POOL_SIZE``/``MAX_OVERFLOW`` values are used as given but must fit
+        in the share.
+
+        Raises:
+            ValueError: If the pools of all processes could exceed the budget
+        """
+
+        processes = workers + collectors
+        share = (self.MAX_CONNECTIONS - self.RESERVED_CONNECTIONS) // processes - 2
+        if self.POOL_SIZE is None:
+            overflow = self.MAX_OVERFLOW if self.MAX_OVERFLOW is not None else share // 5
+            pool_size = share - overflow
+        else:
+            pool_size = self.POOL_SIZE
+            overflow = self.MAX_OVERFLOW if self.MAX_OVERFLOW is not None else max(share - pool_size, 0)
+
+        if pool_size < 1 or overflow < 0 or pool_size + overflow > share:
+            raise ValueError(
+                f"{workers} workers and {collectors} collectors with a pool of {pool_size} + {overflow} overflow "
+                f"connections, a listener and a lock connection each exceed "
+                f"POSTGRES_MAX_CONNECTIONS={self.MAX_CONNECTIONS} minus "
+                f"POSTGRES_RESERVED_CONNECTIONS={self.RESERVED_CONNECTIONS}"
+            )
+        return pool_size, overflow
 
     @property
     def url(self) -> str:
         """Constructs the SQLAlchemy URL using the database configuration."""
         return f"timescaledb+asyncpg://{self.USER}:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.DB}"
+
+    @property
+    def replica_urls(self) -> list[str]:
+        """SQLAlchemy URLs of the read replicas; hosts given without a port use ``PORT``."""
+        addresses = [host if ":" in host else f"{host}:{self.PORT}" for host in self.REPLICA_HOSTS]
+        return [f"timescaledb+asyncpg://{self.USER}:{self.PASSWORD}@{address}/{self.DB}" for address in addresses]
+
+    @property
+    def dsn(self) -> str:
+        """Plain libpq DSN for connections opened with asyncpg directly."""
+        return f"postgresql://{self.USER}:{self.PASSWORD}@{self.HOST}:{self.PORT}/{self.DB}"
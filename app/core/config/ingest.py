@@ -0,0 +1,14 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class IngestConfig(BaseConfig):
+    BATCH_SIZE: int = Field(50_000, alias="INGEST_BATCH_SIZE")
+    MAX_AGE_SECONDS: float = Field(1.0, alias="INGEST_MAX_AGE_SECONDS")
+    MAX_PENDING: int = Field(500_000, alias="INGEST_MAX_PENDING")
+    PUT_TIMEOUT_SECONDS: float = Field(5.0, alias="INGEST_PUT_TIMEOUT_SECONDS")
+    RETRY_MIN_SECONDS: float = Field(0.5, alias="INGEST_RETRY_MIN_SECONDS")
+    RETRY_MAX_SECONDS: float = Field(30.0, alias="INGEST_RETRY_MAX_SECONDS")
+    RETRY_MAX_ATTEMPTS: int = Field(10, alias="INGEST_RETRY_MAX_ATTEMPTS", ge=1)
+    DRAIN_TIMEOUT_SECONDS: float = Field(30.0, alias="INGEST_DRAIN_TIMEOUT_SECONDS")
@@ -0,0 +1,7 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class LatestValuesConfig(BaseConfig):
+    REFRESH_INTERVAL_SECONDS: float = Field(10.0, alias="LATEST_VALUES_REFRESH_INTERVAL_SECONDS")
@@ -0,0 +1,8 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class MembershipConfig(BaseConfig):
+    CACHE_TTL_SECONDS: float = Field(60.0, alias="MEMBERSHIP_CACHE_TTL_SECONDS")
+    CACHE_SIZE: int = Field(10_000, alias="MEMBERSHIP_CACHE_SIZE")
@@ -0,0 +1,9 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class MetricsConfig(BaseConfig):
+    ENABLED: bool = Field(True, alias="METRICS_ENABLED")
+    # Shared directory where every worker writes its samples when WORKERS > 1; a temporary one is used if unset.
+    MULTIPROC_DIR: str | None = Field(None, alias="PROMETHEUS_MULTIPROC_DIR")
@@ -0,0 +1,10 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class SchedulerConfig(BaseConfig):
+    ENABLED: bool = Field(True, alias="SCHEDULER_ENABLED")
+    JITTER_SECONDS: float = Field(30.0, alias="SCHEDULER_JITTER_SECONDS", ge=0)
+    RETENTION_CRON: str = Field("30 3 * * *", alias="SCHEDULER_RETENTION_CRON")
+    RETENTION_TIMEOUT_SECONDS: float = Field(3600.0, alias="SCHEDULER_RETENTION_TIMEOUT_SECONDS", gt=0)
@@ -0,0 +1,8 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class StorageConfig(BaseConfig):
+    COMPRESS_AFTER_DAYS: int = Field(7, alias="STORAGE_COMPRESS_AFTER_DAYS", ge=1)
+    RETENTION_DAYS: int | None = Field(None, alias="STORAGE_RETENTION_DAYS", ge=1)
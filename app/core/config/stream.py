@@ -0,0 +1,12 @@
+from pydantic import Field
+
+from app.core.config.base import BaseConfig
+
+
+class StreamConfig(BaseConfig):
+    COALESCE_SECONDS: float = Field(0.25, alias="STREAM_COALESCE_SECONDS")
+    HEARTBEAT_SECONDS: float = Field(15.0, alias="STREAM_HEARTBEAT_SECONDS")
+    SEND_TIMEOUT_SECONDS: float = Field(5.0, alias="STREAM_SEND_TIMEOUT_SECONDS")
+    SLOW_CONSUMER_SECONDS: float = Field(10.0, alias="STREAM_SLOW_CONSUMER_SECONDS")
+    MAX_PENDING_ALERTS: int = Field(1000, alias="STREAM_MAX_PENDING_ALERTS")
+    LISTEN_RECONNECT_MAX_SECONDS: float = Field(30.0, alias="STREAM_LISTEN_RECONNECT_MAX_SECONDS")
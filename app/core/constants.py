@@ -0,0 +1,56 @@
+# Readings ingestion
+READINGS_COPY_BATCH_SIZE = 50_000
+READINGS_STAGING_TABLE = "_readings_staging"
+
+# Readings queries
+READINGS_AGGREGATE_VIEWS = {
+    "1m": ("readings_1m", 60),
+    "1h": ("readings_1h", 3600),
+    "1d": ("readings_1d", 86400),
+}
+READINGS_RAW_INTERVAL_SECONDS = 1
+READINGS_DEFAULT_MAX_POINTS = 1000
+READINGS_MAX_POINTS_LIMIT = 10_000
+# Bucket widths gap-filled series snap to; all divide a week, so buckets stay aligned across requests.
+READINGS_GAPFILL_STEPS_SECONDS = (
+    *(1, 2, 5, 10, 15, 30),
+    *(60 * minutes for minutes in (1, 2, 5, 10, 15, 30)),
+    *(3600 * hours for hours in (1, 2, 3, 6, 12)),
+    86400,
+    7 * 86400,
+)
+
+# Latest values
+SENSOR_LATEST_UPSERT_BATCH_SIZE = 10_000
+
+# Alerts
+ALERTS_INSERT_BATCH_SIZE = 5_000
+
+# Streaming
+READINGS_CHANNEL = "readings"
+ALERTS_CHANNEL = "alerts"
+MEMBERSHIPS_CHANNEL = "memberships"
+TABLE_VERSIONS_CHANNEL = "table_versions"
+# Keep every NOTIFY payload well under the 8000 byte limit of Postgres.
+NOTIFY_READINGS_BATCH_SIZE = 64
+# Alerts vary in size with their message, so they are packed by encoded length instead of by count.
+NOTIFY_PAYLOAD_MAX_BYTES = 7900
+
+# Readings export
+READINGS_EXPORT_CHUNK_SIZE = 100_000
+
+# Read replicas
+# Wall-clock time of the caller's last committed write, so later requests on any worker read it back.
+LAST_WRITE_COOKIE = "last_write_at"
+
+# Repositories
+REPOSITORY_STATEMENT_CACHE_SIZE = 1024
+REPOSITORY_UPSERT_BATCH_SIZE = 10_000
+
+# Response cache
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_MAX_BODY_BYTES = 1_048_576
+
+# Collector sharding
+# Virtual nodes per collector on the hash ring; more of them even out the share of servers each node gets.
+COLLECTOR_HASH_RING_REPLICAS = 128
@@ -5,6 +5,7 @@ from app.core.exc.base.exceptions import (
     NotAuthorizedException,
     ForbiddenException,
     BadRequestException,
+    ServiceUnavailableException,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "NotAuthorizedException",
     "ForbiddenException",
     "BadRequestException",
+    "ServiceUnavailableException",
 ]
@@ -5,6 +5,7 @@ __all__ = [
     "NotAuthorizedException",
     "ForbiddenException",
     "BadRequestException",
+    "ServiceUnavailableException",
 ]
 
 from app.enums import MessageException
@@ -76,3 +77,14 @@ class BadRequestException(Exception):
         self.message = message
         super().__init__(self.message)
         self.alias = alias if alias else {}
+
+
+class ServiceUnavailableException(Exception):
+    """
+    Exception raised when the service is temporarily overloaded and the client should retry later.
+    """
+
+    def __init__(self, message: str = MessageException.service_unavailable, retry_after: int = 1) -> None:
+        self.message = message
+        super().__init__(self.message)
+        self.alias = {"retry_after": retry_after}
@@ -11,6 +11,7 @@ __all__ = [
     "handle_not_authorized_exception",
     "handle_forbidden_exception",
     "handle_bad_request_exception",
+    "handle_service_unavailable_exception",
     "handle_validation_error",
 ]
 
@@ -39,5 +40,13 @@ def handle_bad_request_exception(_: Request, e: exc.BadRequestException) -> JSON
     return JSONResponse(content={"message": str(e)}, status_code=status.HTTP_400_BAD_REQUEST)
 
 
+def handle_service_unavailable_exception(_: Request, e: exc.ServiceUnavailableException) -> JSONResponse:
+    return JSONResponse(
+        content={"message": str(e)},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(e.alias["retry_after"])},
+    )
+
+
 def handle_validation_error(_: Request, e: ValidationError) -> JSONResponse:
     return JSONResponse(content={"message": str(e)}, status_code=status.HTTP_400_BAD_REQUEST)
@@ -1,5 +1,24 @@
+from app.enums.alert import AlertRuleKindEnum
 from app.enums.exceptions import MessageException
 from app.enums.opc_server import AuthMethodEnum, SecurityPolicyEnum
+from app.enums.pagination import CountModeEnum
+from app.enums.reading import (
+    ReadingDownsampleEnum,
+    ReadingExportFormatEnum,
+    ReadingFillEnum,
+    ReadingResolutionEnum,
+)
 from app.enums.user import UserRoleInOrgEnum
 
-__all__ = ["MessageException", "AuthMethodEnum", "SecurityPolicyEnum", "UserRoleInOrgEnum"]
+__all__ = [
+    "AlertRuleKindEnum",
+    "MessageException",
+    "AuthMethodEnum",
+    "SecurityPolicyEnum",
+    "CountModeEnum",
+    "ReadingResolutionEnum",
+    "ReadingExportFormatEnum",
+    "ReadingFillEnum",
+    "ReadingDownsampleEnum",
+    "UserRoleInOrgEnum",
+]
@@ -0,0 +1,13 @@
+from app.enums.base import BaseStrEnum
+
+__all__ = ["AlertRuleKindEnum"]
+
+
+class AlertRuleKindEnum(BaseStrEnum):
+    """
+    Enum representing the condition an alert rule watches for.
+    """
+
+    ABOVE = "above"
+    BELOW = "below"
+    RATE_ABOVE = "rate_above"
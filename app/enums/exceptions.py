@@ -11,3 +11,4 @@ class MessageException(BaseStrEnum):
     not_authorized = "not_authorized"
     forbidden = "forbidden"
     bad_request = "bad_request"
+    service_unavailable = "service_unavailable"
@@ -0,0 +1,13 @@
+from app.enums.base import BaseStrEnum
+
+__all__ = ["CountModeEnum"]
+
+
+class CountModeEnum(BaseStrEnum):
+    """
+    Enum representing how the total count is computed for a page of results.
+    """
+
+    NONE = "none"
+    ESTIMATED = "estimated"
+    EXACT = "exact"
@@ -0,0 +1,42 @@
+from app.enums.base import BaseStrEnum
+
+__all__ = ["ReadingResolutionEnum", "ReadingExportFormatEnum", "ReadingFillEnum", "ReadingDownsampleEnum"]
+
+
+class ReadingResolutionEnum(BaseStrEnum):
+    """
+    Enum representing the granularity readings are served at, from raw rows to continuous aggregates.
+    """
+
+    RAW = "raw"
+    MINUTE = "1m"
+    HOUR = "1h"
+    DAY = "1d"
+
+
+class ReadingExportFormatEnum(BaseStrEnum):
+    """
+    Enum representing columnar formats readings can be exported in.
+    """
+
+    ARROW = "arrow"
+    PARQUET = "parquet"
+
+
+class ReadingFillEnum(BaseStrEnum):
+    """
+    Enum representing how empty buckets of a gap-filled series are filled.
+    """
+
+    NONE = "none"
+    LOCF = "locf"
+    INTERPOLATE = "interpolate"
+
+
+class ReadingDownsampleEnum(BaseStrEnum):
+    """
+    Enum representing algorithms that reduce raw readings to a bounded number of visually faithful points.
+    """
+
+    LTTB = "lttb"
+    MINMAX = "minmax"
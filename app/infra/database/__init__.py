@@ -1,3 +1,13 @@
-from app.infra.database.db import get_session_maker
+from app.infra.database.db import get_read_only_session_maker, get_session_maker
+from app.infra.database.listener import NotificationListener, notification_listener
+from app.infra.database.replicas import ReplicaRouter, WriteFence, replica_router
 
-__all__ = ["get_session_maker"]
+__all__ = [
+    "get_session_maker",
+    "get_read_only_session_maker",
+    "NotificationListener",
+    "notification_listener",
+    "ReplicaRouter",
+    "WriteFence",
+    "replica_router",
+]
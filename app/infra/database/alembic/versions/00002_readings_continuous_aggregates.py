@@ -0,0 +1,81 @@
+"""Readings continuous aggregates
+
+Revision ID: 00002
+Revises: 00001
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "00002"
+down_revision: str | None = "00001"
+branch_labels: Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (view, bucket width, source, refresh start offset, refresh end offset, schedule interval)
+AGGREGATES = (
+    ("readings_1m", "1 minute", "readings", "1 day", "1 minute", "1 minute"),
+    ("readings_1h", "1 hour", "readings_1m", "7 days", "1 hour", "30 minutes"),
+    ("readings_1d", "1 day", "readings_1h", "60 days", "1 day", "1 hour"),
+)
+
+
+def upgrade() -> None:
+    # The minute aggregate reads the hypertable; coarser ones roll up the previous level through sum/count.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW readings_1m
+        WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+        SELECT
+            time_bucket(INTERVAL '1 minute', time) AS bucket,
+            sensor_id,
+            avg(value) AS avg_value,
+            min(value) AS min_value,
+            max(value) AS max_value,
+            sum(value) AS sum_value,
+            count(*) AS count
+        FROM readings
+        GROUP BY time_bucket(INTERVAL '1 minute', time), sensor_id
+        WITH NO DATA
+        """
+    )
+    for view, width, source, *_ in AGGREGATES[1:]:
+        op.execute(
+            f"""
+            CREATE MATERIALIZED VIEW {view}
+            WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+            SELECT
+                time_bucket(INTERVAL '{width}', bucket) AS bucket,
+                sensor_id,
+                sum(sum_value) / sum(count) AS avg_value,
+                min(min_value) AS min_value,
+                max(max_value) AS max_value,
+                sum(sum_value) AS sum_value,
+                sum(count)::bigint AS count
+            FROM {source}
+            GROUP BY time_bucket(INTERVAL '{width}', bucket), sensor_id
+            WITH NO DATA
+            """
+        )
+
+    for view, _, _, start_offset, end_offset, schedule_interval in AGGREGATES:
+        op.execute(f"CREATE INDEX ix_{view}_sensor_id_bucket ON {view} (sensor_id, bucket DESC)")
+        op.execute(
+            f"""
+            SELECT add_continuous_aggregate_policy(
+                '{view}',
+                start_offset => INTERVAL '{start_offset}',
+                end_offset => INTERVAL '{end_offset}',
+                schedule_interval => INTERVAL '{schedule_interval}'
+            )
+            """
+        )
+
+
+def downgrade() -> None:
+    for view, *_ in reversed(AGGREGATES):
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view}")
@@ -0,0 +1,44 @@
+"""Sensor latest values
+
+Revision ID: 00003
+Revises: 00002
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "00003"
+down_revision: str | None = "00002"
+branch_labels: Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sensor_latest",
+        sa.Column("sensor_id", sa.UUID(), nullable=False),
+        sa.Column("time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("value", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["sensor_id"], ["sensors.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("sensor_id"),
+    )
+    # One-off backfill; afterwards the table is kept current by the ingest path.
+    op.execute(
+        """
+        INSERT INTO sensor_latest (sensor_id, time, value)
+        SELECT sensors.id, latest.time, latest.value
+        FROM sensors
+        CROSS JOIN LATERAL (
+            SELECT time, value FROM readings WHERE readings.sensor_id = sensors.id ORDER BY time DESC LIMIT 1
+        ) AS latest
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sensor_latest")
@@ -0,0 +1,54 @@
+"""Alert rules
+
+Revision ID: 00004
+Revises: 00003
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "00004"
+down_revision: str | None = "00003"
+branch_labels: Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "alert_rules",
+        sa.Column("sensor_id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("kind", sa.Enum("ABOVE", "BELOW", "RATE_ABOVE", name="alertrulekindenum"), nullable=False),
+        sa.Column("threshold", sa.Float(), nullable=False),
+        sa.Column("hysteresis", sa.Float(), nullable=False),
+        sa.Column("duration_seconds", sa.Float(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["sensor_id"], ["sensors.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_alert_rules_created_at"), "alert_rules", ["created_at"], unique=False)
+    op.create_index(op.f("ix_alert_rules_id"), "alert_rules", ["id"], unique=False)
+    op.create_index(op.f("ix_alert_rules_sensor_id"), "alert_rules", ["sensor_id"], unique=False)
+
+    op.add_column("alerts", sa.Column("rule_id", sa.UUID(), nullable=True))
+    op.create_foreign_key("alerts_rule_id_fkey", "alerts", "alert_rules", ["rule_id"], ["id"], ondelete="SET NULL")
+    op.create_index("uq_alerts_rule_id_created_at", "alerts", ["rule_id", "created_at"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_alerts_rule_id_created_at", table_name="alerts")
+    op.drop_constraint("alerts_rule_id_fkey", "alerts", type_="foreignkey")
+    op.drop_column("alerts", "rule_id")
+
+    op.drop_index(op.f("ix_alert_rules_sensor_id"), table_name="alert_rules")
+    op.drop_index(op.f("ix_alert_rules_id"), table_name="alert_rules")
+    op.drop_index(op.f("ix_alert_rules_created_at"), table_name="alert_rules")
+    op.drop_table("alert_rules")
+    sa.Enum(name="alertrulekindenum").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,40 @@
+"""Readings compression and organization retention
+
+Revision ID: 00005
+Revises: 00004
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "00005"
+down_revision: str | None = "00004"
+branch_labels: Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Policies (compress_after, drop_after) are owned by the application settings and synced on startup.
+    op.execute(
+        """
+        ALTER TABLE readings SET (
+            timescaledb.compress,
+            timescaledb.compress_segmentby = 'sensor_id',
+            timescaledb.compress_orderby = 'time DESC'
+        )
+        """
+    )
+    op.add_column("organizations", sa.Column("readings_retention_days", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("organizations", "readings_retention_days")
+    op.execute("SELECT remove_retention_policy('readings', if_exists => true)")
+    op.execute("SELECT remove_compression_policy('readings', if_exists => true)")
+    op.execute("SELECT decompress_chunk(chunk, if_compressed => true) FROM show_chunks('readings') AS chunk")
+    op.execute("ALTER TABLE readings SET (timescaledb.compress = false)")
@@ -0,0 +1,48 @@
+"""Membership change notifications
+
+Revision ID: 00006
+Revises: 00005
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "00006"
+down_revision: str | None = "00005"
+branch_labels: Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Announce every membership change so each worker can drop the cached roles of the affected user.
+    op.execute(
+        """
+        CREATE FUNCTION notify_membership_change() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM pg_notify('memberships', OLD.user_id::text);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM pg_notify('memberships', NEW.user_id::text);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_user_organization_association_notify
+        AFTER INSERT OR UPDATE OR DELETE ON user_organization_association
+        FOR EACH ROW EXECUTE FUNCTION notify_membership_change()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_user_organization_association_notify ON user_organization_association")
+    op.execute("DROP FUNCTION IF EXISTS notify_membership_change()")
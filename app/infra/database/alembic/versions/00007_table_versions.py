@@ -0,0 +1,65 @@
+"""Table versions
+
+Revision ID: 00007
+Revises: 00006
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "00007"
+down_revision: str | None = "00006"
+branch_labels: Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Low-write tables whose read responses are cached by version; readings and alerts change far too often.
+VERSIONED_TABLES = ("organizations", "opc_servers", "sensors", "alert_rules")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "table_versions",
+        sa.Column("table_name", sa.String(length=63), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+    op.bulk_insert(
+        sa.table("table_versions", sa.column("table_name"), sa.column("version")),
+        [{"table_name": name, "version": 0} for name in VERSIONED_TABLES],
+    )
+
+    # One bump per statement rather than per row, announced so every worker can move on to the new version.
+    op.execute(
+        """
+        CREATE FUNCTION bump_table_version() RETURNS trigger AS $$
+        DECLARE
+            new_version bigint;
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = TG_TABLE_NAME
+            RETURNING version INTO new_version;
+            PERFORM pg_notify('table_versions', TG_TABLE_NAME || ':' || new_version);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for name in VERSIONED_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER trg_{name}_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {name}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+            """
+        )
+
+
+def downgrade() -> None:
+    for name in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{name}_version ON {name}")
+    op.execute("DROP FUNCTION IF EXISTS bump_table_version()")
+    op.drop_table("table_versions")
@@ -0,0 +1,35 @@
+"""Collector nodes
+
+Revision ID: 00008
+Revises: 00007
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "00008"
+down_revision: str | None = "00007"
+branch_labels: Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collector_nodes",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("hostname", sa.String(length=255), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_collector_nodes_heartbeat_at"), "collector_nodes", ["heartbeat_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_collector_nodes_heartbeat_at"), table_name="collector_nodes")
+    op.drop_table("collector_nodes")
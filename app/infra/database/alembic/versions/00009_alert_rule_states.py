@@ -0,0 +1,36 @@
+"""Alert rule states
+
+Revision ID: 00009
+Revises: 00008
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "00009"
+down_revision: str | None = "00008"
+branch_labels: Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "alert_rule_states",
+        sa.Column("rule_id", sa.UUID(), nullable=False),
+        sa.Column("active", sa.Boolean(), nullable=False),
+        sa.Column("since", sa.Float(), nullable=False),
+        sa.Column("fired", sa.Boolean(), nullable=False),
+        sa.Column("last_time", sa.Float(), nullable=True),
+        sa.Column("last_value", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(["rule_id"], ["alert_rules.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("rule_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("alert_rule_states")
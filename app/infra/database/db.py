@@ -3,17 +3,36 @@ import functools
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 from app.core import settings
+from app.infra.database.instrumentation import InstrumentedQueuePool, instrument_engine
 
-__all__ = ["get_session_maker", "engine"]
+__all__ = ["get_session_maker", "get_read_only_session_maker", "create_replica_engines", "engine"]
+
+
+def _build_engine(url: str, **kwargs) -> AsyncEngine:
+    metrics_enabled = settings.metrics.ENABLED
+    pool_size, max_overflow = settings.db.pool_limits(settings.WORKERS, settings.collector.NODES)
+    engine_instance = create_async_engine(
+        url,
+        poolclass=InstrumentedQueuePool if metrics_enabled else None,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=settings.db.POOL_RECYCLE,
+        **kwargs,
+    )
+    if metrics_enabled:
+        instrument_engine(engine_instance)
+    return engine_instance
 
 
 @functools.lru_cache
 def create_engine() -> AsyncEngine:
-    return create_async_engine(
-        settings.db.url,
-        pool_size=settings.db.POOL_SIZE,
-        max_overflow=settings.db.MAX_OVERFLOW,
-        pool_recycle=settings.db.POOL_RECYCLE,
+    return _build_engine(settings.db.url)
+
+
+@functools.lru_cache
+def create_replica_engines() -> tuple[AsyncEngine, ...]:
+    return tuple(
+        _build_engine(url, execution_options={"postgresql_readonly": True}) for url in settings.db.replica_urls
     )
 
 
@@ -28,4 +47,11 @@ def get_session_maker() -> async_sessionmaker:
     return create_sessionmaker(engine_instance)
 
 
+@functools.lru_cache
+def get_read_only_session_maker() -> async_sessionmaker:
+    """Sessions on the primary pool whose transactions are opened ``READ ONLY``."""
+    engine_instance = create_engine().execution_options(postgresql_readonly=True)
+    return create_sessionmaker(engine_instance)
+
+
 engine = create_engine()
@@ -0,0 +1,48 @@
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.utils.metrics import POOL_WAIT_DURATION, SQL_STATEMENT_DURATION
+
+__all__ = ["InstrumentedQueuePool", "instrument_engine"]
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits for a connection."""
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_WAIT_DURATION.observe(time.perf_counter() - started)
+
+
+def _operation(statement: str) -> str:
+    # The leading keyword keeps the label set small no matter how many distinct statements run.
+    keyword = statement.lstrip().split(None, 1)
+    return keyword[0].upper() if keyword else "EMPTY"
+
+
+def _before_cursor_execute(
+    _connection: Connection, _cursor: Any, _statement: str, _parameters: Any, context: ExecutionContext, _many: bool
+) -> None:
+    context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(
+    _connection: Connection, _cursor: Any, statement: str, _parameters: Any, context: ExecutionContext, _many: bool
+) -> None:
+    started = getattr(context, "_metrics_started", None)
+    if started is not None:
+        SQL_STATEMENT_DURATION.labels(_operation(statement)).observe(time.perf_counter() - started)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    sync_engine: Engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,105 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+
+import asyncpg
+from loguru import logger
+
+from app.core import settings
+from app.core.config.stream import StreamConfig
+
+__all__ = ["NotificationListener", "notification_listener"]
+
+NotificationHandler = Callable[[str], None]
+ConnectHandler = Callable[[], Awaitable[None]]
+DisconnectHandler = Callable[[], None]
+
+_KEEPALIVE_SECONDS = 10.0
+
+
+class NotificationListener:
+    """
+    One dedicated Postgres connection per process that LISTENs on every registered channel.
+
+    Handlers run on the event loop for each payload and must not block. The connection is re-established with
+    exponential backoff; ``on_connect`` handlers run after every (re)connect so callers can catch up on
+    notifications that were missed while disconnected, and ``on_disconnect`` handlers as soon as a connection is lost.
+    """
+
+    def __init__(self, dsn: str = settings.db.dsn, config: StreamConfig = settings.stream) -> None:
+        self._dsn = dsn
+        self._config = config
+        self._handlers: defaultdict[str, list[NotificationHandler]] = defaultdict(list)
+        self._connect_handlers: list[ConnectHandler] = []
+        self._disconnect_handlers: list[DisconnectHandler] = []
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, channel: str, handler: NotificationHandler) -> None:
+        self._handlers[channel].append(handler)
+
+    def on_connect(self, handler: ConnectHandler) -> None:
+        self._connect_handlers.append(handler)
+
+    def on_disconnect(self, handler: DisconnectHandler) -> None:
+        self._disconnect_handlers.append(handler)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="notification-listener")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def _dispatch(self, _connection: asyncpg.Connection, _pid: int, channel: str, payload: str) -> None:
+        for handler in self._handlers.get(channel, ()):
+            try:
+                handler(payload)
+            except Exception as e:
+                logger.exception("Failed to handle notification on {channel}: {e}", channel=channel, e=e)
+
+    def _disconnected(self) -> None:
+        for handler in self._disconnect_handlers:
+            try:
+                handler()
+            except Exception as e:
+                logger.exception("Failed to handle listener disconnect: {e}", e=e)
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while True:
+            connection: asyncpg.Connection | None = None
+            try:
+                connection = await asyncpg.connect(self._dsn)
+                for channel in self._handlers:
+                    await connection.add_listener(channel, self._dispatch)
+                logger.info("Listening on {channels}", channels=list(self._handlers))
+                delay = 1.0
+
+                for handler in self._connect_handlers:
+                    await handler()
+
+                while not connection.is_closed():
+                    await asyncio.sleep(_KEEPALIVE_SECONDS)
+                    await connection.execute("SELECT 1")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Notification listener disconnected: {e!r}", e=e)
+            finally:
+                if connection is not None:
+                    self._disconnected()
+                    if not connection.is_closed():
+                        with suppress(Exception):
+                            await connection.close(timeout=1)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._config.LISTEN_RECONNECT_MAX_SECONDS)
+
+
+notification_listener = NotificationListener()
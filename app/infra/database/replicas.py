@@ -0,0 +1,157 @@
+import asyncio
+import contextvars
+import itertools
+import time
+from collections.abc import Sequence
+from contextlib import suppress
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from app.core import settings
+from app.core.config.db import DataBaseConfig
+from app.infra.database.db import create_replica_engines, create_sessionmaker, get_read_only_session_maker
+
+__all__ = ["ReplicaRouter", "WriteFence", "replica_router"]
+
+# Replay lag in seconds. A replica that has replayed everything it received counts as caught up even when the
+# primary has been idle and the last replayed transaction is old, but only while its WAL receiver is streaming:
+# a stopped or reconnecting receiver has received nothing new, so equal LSNs say nothing about the primary. Without
+# pg_read_all_stats the receiver status reads as NULL and the lag falls back to the replay timestamp.
+_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+            AND EXISTS (SELECT FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 'Infinity')
+    END
+    """
+)
+
+
+class WriteFence:
+    """Wall-clock time of the newest committed write that reads in the current request or task must see."""
+
+    __slots__ = ("written_at",)
+
+    def __init__(self, written_at: float | None = None) -> None:
+        self.written_at = written_at
+
+
+_write_fence: contextvars.ContextVar[WriteFence | None] = contextvars.ContextVar("write_fence", default=None)
+
+
+class _Replica:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.session_maker = create_sessionmaker(engine)
+        self.name = engine.url.render_as_string(hide_password=True)
+        self.lag: float | None = None
+        self.checked_at = 0.0
+
+    def lag_now(self, now: float) -> float | None:
+        """Upper bound of the current lag: the measured lag plus the time since it was measured."""
+
+        return None if self.lag is None else self.lag + (now - self.checked_at)
+
+
+class ReplicaRouter:
+    """
+    Picks the session factory for read-only units of work.
+
+    Replica lag is polled every ``REPLICA_CHECK_INTERVAL_SECONDS``. A read goes to a replica, round robin, only when
+    its lag is under ``REPLICA_MAX_LAG_SECONDS`` and shorter than the time since the write fence of the current
+    request or task, so the replica has already replayed that write. Otherwise, or when no replica answers, reads fall
+    back to read-only transactions on the primary.
+
+    The fence is the later of the caller's previous write, carried between requests by ``ReadYourWritesMiddleware``,
+    and any write committed earlier in the same request or task. It is wall-clock time, so it holds across workers
+    and nodes as long as their clocks agree to well within ``REPLICA_MAX_LAG_SECONDS``.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine] = create_replica_engines(),
+        primary: async_sessionmaker = get_read_only_session_maker(),
+        config: DataBaseConfig = settings.db,
+    ) -> None:
+        self._replicas = [_Replica(engine) for engine in engines]
+        self._primary = primary
+        self._config = config
+        self._turn = itertools.count()
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._task is not None or not self._replicas:
+            return
+        await self.check()
+        self._task = asyncio.create_task(self._run(), name="replica-lag")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for replica in self._replicas:
+            await replica.engine.dispose()
+
+    @staticmethod
+    def begin(written_at: float | None = None) -> WriteFence:
+        """Start a write fence for the current request, at the time of a write the caller made before it."""
+
+        fence = WriteFence(written_at)
+        _write_fence.set(fence)
+        return fence
+
+    @staticmethod
+    def mark_write() -> None:
+        fence = _write_fence.get()
+        if fence is None:
+            fence = ReplicaRouter.begin()
+        fence.written_at = time.time()
+
+    def session_maker(self) -> async_sessionmaker:
+        if not self._replicas:
+            return self._primary
+
+        now = time.monotonic()
+        fence = _write_fence.get()
+        max_lag = self._config.REPLICA_MAX_LAG_SECONDS
+        if fence is not None and fence.written_at is not None:
+            max_lag = min(max_lag, time.time() - fence.written_at)
+
+        candidates = [
+            replica for replica in self._replicas if (lag := replica.lag_now(now)) is not None and lag < max_lag
+        ]
+        if not candidates:
+            return self._primary
+        return candidates[next(self._turn) % len(candidates)].session_maker
+
+    async def check(self) -> None:
+        await asyncio.gather(*(self._check(replica) for replica in self._replicas))
+
+    async def _check(self, replica: _Replica) -> None:
+        try:
+            async with asyncio.timeout(self._config.REPLICA_CHECK_INTERVAL_SECONDS):
+                async with replica.engine.connect() as connection:
+                    lag = float((await connection.execute(_LAG_QUERY)).scalar())
+        except Exception as e:
+            if replica.lag is not None:
+                logger.warning("Replica {name} is unavailable: {e!r}", name=replica.name, e=e)
+            replica.lag = None
+            return
+
+        if replica.lag is None:
+            logger.info("Replica {name} is available, lag {lag:.3f}s", name=replica.name, lag=lag)
+        replica.lag, replica.checked_at = lag, time.monotonic()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._config.REPLICA_CHECK_INTERVAL_SECONDS)
+            await self.check()
+
+
+replica_router = ReplicaRouter()
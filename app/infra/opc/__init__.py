@@ -0,0 +1,3 @@
+from app.infra.opc.client import AsyncuaSession, DataChangeCallback, OpcSession, OpcSessionFactory
+
+__all__ = ["AsyncuaSession", "DataChangeCallback", "OpcSession", "OpcSessionFactory"]
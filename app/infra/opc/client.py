@@ -0,0 +1,128 @@
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from contextlib import suppress
+from datetime import datetime, timezone
+
+from asyncua import Client, Node, ua
+from asyncua.crypto import security_policies
+from loguru import logger
+
+from app.core import settings
+from app.core.config.collector import CollectorConfig
+from app.enums import AuthMethodEnum, SecurityPolicyEnum
+from app.schemas.collector import CollectorTarget
+
+__all__ = ["OpcSession", "OpcSessionFactory", "AsyncuaSession", "DataChangeCallback"]
+
+DataChangeCallback = Callable[[str, datetime, float], None]
+
+_SECURITY_POLICIES = {
+    SecurityPolicyEnum.AES256_SHA256_RSAPSS: security_policies.SecurityPolicyAes256Sha256RsaPss,
+    SecurityPolicyEnum.AES128_SHA256_RSAOAEP: security_policies.SecurityPolicyAes128Sha256RsaOaep,
+    SecurityPolicyEnum.BASIC256_SHA256: security_policies.SecurityPolicyBasic256Sha256,
+    SecurityPolicyEnum.BASIC256: security_policies.SecurityPolicyBasic256,
+    SecurityPolicyEnum.BASIC128_RSA15: security_policies.SecurityPolicyBasic128Rsa15,
+}
+
+
+class OpcSession(ABC):
+    """
+    A single connection to an OPC UA server holding one data-change subscription.
+    """
+
+    @abstractmethod
+    async def connect(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def subscribe(self, node_ids: Sequence[str], callback: DataChangeCallback) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def check_connection(self) -> None:
+        """Raise if the connection to the server has been lost."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def disconnect(self) -> None:
+        raise NotImplementedError
+
+
+OpcSessionFactory = Callable[[CollectorTarget], OpcSession]
+
+
+class _DataChangeHandler:
+    def __init__(self, callback: DataChangeCallback) -> None:
+        self._callback = callback
+        self.node_ids: dict[ua.NodeId, str] = {}
+
+    def datachange_notification(self, node: Node, val: any, data: any) -> None:
+        node_id = self.node_ids.get(node.nodeid)
+        if node_id is None:
+            return
+
+        try:
+            value = float(val)
+        except (TypeError, ValueError):
+            logger.debug("Skipping non-numeric value {val!r} of node {node_id}", val=val, node_id=node_id)
+            return
+
+        data_value = data.monitored_item.Value
+        timestamp = data_value.SourceTimestamp or data_value.ServerTimestamp
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+        elif timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+        self._callback(node_id, timestamp, value)
+
+    def status_change_notification(self, status: any) -> None:
+        logger.warning("Subscription status changed: {status}", status=status)
+
+
+class AsyncuaSession(OpcSession):
+    def __init__(self, target: CollectorTarget, config: CollectorConfig = settings.collector) -> None:
+        self._target = target
+        self._config = config
+        self._client = Client(url=target.url, timeout=config.REQUEST_TIMEOUT_SECONDS)
+
+    async def connect(self) -> None:
+        if self._target.authentication_method == AuthMethodEnum.USERNAME:
+            self._client.set_user(self._target.username)
+            self._client.set_password(self._target.password)
+
+        if self._target.security_policy != SecurityPolicyEnum.NONE:
+            await self._client.set_security(
+                _SECURITY_POLICIES[self._target.security_policy],
+                certificate=self._config.CERTIFICATE_PATH,
+                private_key=self._config.PRIVATE_KEY_PATH,
+                mode=ua.MessageSecurityMode.SignAndEncrypt,
+            )
+
+        await self._client.connect()
+
+    async def subscribe(self, node_ids: Sequence[str], callback: DataChangeCallback) -> None:
+        handler = _DataChangeHandler(callback)
+        subscription = await self._client.create_subscription(self._config.PUBLISHING_INTERVAL_MS, handler)
+
+        nodes = [self._client.get_node(node_id) for node_id in node_ids]
+        handler.node_ids = {node.nodeid: node_id for node, node_id in zip(nodes, node_ids)}
+
+        handles = await subscription.subscribe_data_change(nodes)
+        for node_id, handle in zip(node_ids, handles):
+            if isinstance(handle, ua.StatusCode):
+                logger.error(
+                    "Cannot monitor node {node_id} on {url}: {status}",
+                    node_id=node_id,
+                    url=self._target.url,
+                    status=handle,
+                )
+
+    async def check_connection(self) -> None:
+        await self._client.check_connection()
+
+    async def disconnect(self) -> None:
+        with suppress(Exception):
+            async with asyncio.timeout(self._config.REQUEST_TIMEOUT_SECONDS):
+                await self._client.disconnect()
@@ -1,13 +1,95 @@
+import functools
+import os
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from loguru import logger
 from pydantic import ValidationError
 
-from app.api.routers import main_router, swagger
+from app.api.middleware import MetricsMiddleware, ReadYourWritesMiddleware
+from app.api.routers import main_router, metrics, swagger
 from app.core import exc
 from app.core import settings
 from app.core.exc import handlers
+from app.infra.database import notification_listener, replica_router
+from app.infra.database.db import create_engine
+from app.repositories.statement_cache import statement_cache
+from app.services.alert_engine import alert_engine
+from app.services.ingest_buffer import ingest_buffer
+from app.services.latest_values import latest_values
+from app.services.membership import membership_cache
+from app.services.scheduler import CronTrigger, scheduler
+from app.services.storage import StorageService
+from app.services.stream import stream_hub
+from app.services.table_versions import table_versions
+from app.uow.sql import SQLUnitOfWork
+from app.utils.metrics import PoolCollector, StatementCacheCollector, mark_process_dead, register_scrape_collector
+
+
+async def _sync_storage_policies() -> None:
+    try:
+        async with SQLUnitOfWork() as uow:
+            await StorageService.sync_policies(uow)
+    except Exception as e:
+        logger.exception("Failed to sync readings storage policies: {e}", e=e)
+
+
+async def _apply_organization_retention() -> None:
+    async with SQLUnitOfWork() as uow:
+        await StorageService.apply_organization_retention(uow)
+
+
+@functools.cache
+def _schedule_jobs() -> None:
+    scheduler.add_job(
+        "organization-retention",
+        _apply_organization_retention,
+        CronTrigger(settings.scheduler.RETENTION_CRON),
+        jitter_seconds=settings.scheduler.JITTER_SECONDS,
+        timeout_seconds=settings.scheduler.RETENTION_TIMEOUT_SECONDS,
+    )
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """
+    Start the process-wide components and stop them in reverse order, also when a later one fails to start.
+
+    The shared notification listener starts only after every component subscribed to it, since channels and connect
+    handlers are registered on its connection when it connects.
+    """
+
+    async with AsyncExitStack() as stack:
+        stack.callback(mark_process_dead)
+        stack.push_async_callback(create_engine().dispose)
+
+        await replica_router.start()
+        stack.push_async_callback(replica_router.stop)
+        await _sync_storage_policies()
+        await latest_values.start()
+        stack.push_async_callback(latest_values.stop)
+        await alert_engine.start()
+        stack.push_async_callback(alert_engine.stop)
+        await ingest_buffer.start()
+        stack.push_async_callback(ingest_buffer.stop)
+
+        await membership_cache.start()
+        await table_versions.start()
+        await stream_hub.start()
+        stack.push_async_callback(stream_hub.stop)
+        await notification_listener.start()
+        stack.push_async_callback(notification_listener.stop)
+
+        if settings.scheduler.ENABLED:
+            _schedule_jobs()
+            await scheduler.start()
+            stack.push_async_callback(scheduler.stop)
+        yield
 
 
 def _include_router(app: FastAPI) -> None:
@@ -16,6 +98,8 @@ def _include_router(app: FastAPI) -> None:
 
 
 def _add_middleware(app: FastAPI) -> None:
+    if settings.db.REPLICA_HOSTS:
+        app.add_middleware(ReadYourWritesMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.FRONTEND_URL if settings.FRONTEND_URL else ["*"],
@@ -25,6 +109,20 @@ def _add_middleware(app: FastAPI) -> None:
     )
 
 
+@functools.cache
+def _register_collectors() -> None:
+    register_scrape_collector(PoolCollector(lambda: create_engine().pool))
+    register_scrape_collector(StatementCacheCollector(statement_cache))
+
+
+def _add_metrics(app: FastAPI) -> None:
+    if not settings.metrics.ENABLED:
+        return
+    _register_collectors()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics.router)
+
+
 def _add_handlers(app: FastAPI) -> None:
     app.add_exception_handler(exc.GoneException, handlers.handle_gone_exception)
     app.add_exception_handler(exc.NotAuthorizedException, handlers.handle_not_authorized_exception)
@@ -32,24 +130,70 @@ def _add_handlers(app: FastAPI) -> None:
     app.add_exception_handler(exc.ObjectNotFoundException, handlers.handle_object_not_found)
     app.add_exception_handler(exc.ForbiddenException, handlers.handle_forbidden_exception)
     app.add_exception_handler(exc.BadRequestException, handlers.handle_bad_request_exception)
+    app.add_exception_handler(exc.ServiceUnavailableException, handlers.handle_service_unavailable_exception)
     app.add_exception_handler(ValidationError, handlers.handle_validation_error)
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None, default_response_class=ORJSONResponse)
+    app = FastAPI(
+        docs_url=None,
+        redoc_url=None,
+        openapi_url=None,
+        default_response_class=ORJSONResponse,
+        lifespan=_lifespan,
+    )
 
     _include_router(app)
     _add_middleware(app)
+    _add_metrics(app)
     _add_handlers(app)
 
     return app
 
 
-if __name__ == "__main__":
+def _prepare_multiprocess_metrics() -> None:
+    """
+    Point every worker at one directory for its metric samples, so a scrape answered by any worker covers all of them.
+
+    Must run before the workers start: prometheus_client picks its storage when it is first imported. Samples left by
+    a previous run are removed, or their counters would be added to the new ones.
+    """
+
+    directory = settings.metrics.MULTIPROC_DIR or tempfile.mkdtemp(prefix="prometheus-")
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        if name.endswith(".db"):
+            os.remove(os.path.join(directory, name))
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = directory
+
+
+def run() -> None:
+    """
+    Serve the API.
+
+    With ``RELOAD`` a single auto-reloading process is started for development; otherwise ``WORKERS`` processes on
+    uvloop and httptools, each with its own lifespan, pools and LISTEN connection. Several workers share their metrics
+    through prometheus_client's multiprocess mode.
+    """
+
+    if settings.RELOAD:
+        uvicorn.run(
+            "app.main:create_app", factory=True, host=settings.SERVER_HOST, port=settings.SERVER_PORT, reload=True
+        )
+        return
+
+    if settings.metrics.ENABLED and settings.WORKERS > 1:
+        _prepare_multiprocess_metrics()
     uvicorn.run(
         "app.main:create_app",
         factory=True,
         host=settings.SERVER_HOST,
         port=settings.SERVER_PORT,
-        reload=settings.RELOAD,
+        workers=settings.WORKERS,
+        loop="uvloop",
+        http="httptools",
     )
+
+
+if __name__ == "__main__":
+    run()
@@ -1,6 +1,8 @@
 from app.models.user import User, UserOrganizationAssociation
 from app.models.organization import Organization
-from app.models.opc_server import OpcServer, Sensor, Reading, Alert
+from app.models.opc_server import OpcServer, Sensor, Reading, SensorLatest, AlertRule, AlertRuleState, Alert
+from app.models.table_version import TableVersion
+from app.models.collector_node import CollectorNode
 
 __all__ = [
     "User",
@@ -9,5 +11,10 @@ __all__ = [
     "OpcServer",
     "Sensor",
     "Reading",
+    "SensorLatest",
+    "AlertRule",
+    "AlertRuleState",
     "Alert",
+    "TableVersion",
+    "CollectorNode",
 ]
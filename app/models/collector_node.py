@@ -0,0 +1,20 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+__all__ = ["CollectorNode"]
+
+
+class CollectorNode(Base):
+    """Lease of a running collector process; the node counts as live while its heartbeat is recent."""
+
+    __tablename__ = "collector_nodes"
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    hostname: Mapped[str] = mapped_column(String(255), nullable=False)
+    started_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
+    heartbeat_at: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False, index=True)
@@ -1,13 +1,13 @@
 import datetime
 import uuid
 
-from sqlalchemy import String, Text, ForeignKey, UUID, Enum, UniqueConstraint, Float
+from sqlalchemy import Boolean, String, Text, ForeignKey, UUID, Enum, UniqueConstraint, Float, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.enums import SecurityPolicyEnum, AuthMethodEnum
+from app.enums import AlertRuleKindEnum, SecurityPolicyEnum, AuthMethodEnum
 from app.models.base import Base, UUIDMixin, CreatedAtMixin, SoftDeleteMixin
 
-__all__ = ["OpcServer", "Sensor", "Reading", "Alert"]
+__all__ = ["OpcServer", "Sensor", "Reading", "SensorLatest", "AlertRule", "AlertRuleState", "Alert"]
 
 
 class OpcServer(Base, UUIDMixin, CreatedAtMixin, SoftDeleteMixin):
@@ -29,8 +29,10 @@ class OpcServer(Base, UUIDMixin, CreatedAtMixin, SoftDeleteMixin):
     username: Mapped[str | None] = mapped_column(String(255), nullable=True)
     encrypted_password: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
-    organization = relationship("Organization", back_populates="opc_servers", lazy="subquery")
-    sensors = relationship("Sensor", back_populates="opc_server", cascade="all, delete-orphan", lazy="subquery")
+    organization = relationship("Organization", back_populates="opc_servers", lazy="raise_on_sql")
+    sensors = relationship(
+        "Sensor", back_populates="opc_server", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
+    )
 
     __table_args__ = (UniqueConstraint("organization_id", "name", name="uq_opc_server_organization_name"),)
 
@@ -46,9 +48,16 @@ class Sensor(Base, UUIDMixin, CreatedAtMixin, SoftDeleteMixin):
     node_id: Mapped[str] = mapped_column(String(255), nullable=False)
     units: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
-    opc_server = relationship("OpcServer", back_populates="sensors", lazy="subquery")
-    readings = relationship("Reading", back_populates="sensor", cascade="all, delete-orphan")
-    alerts = relationship("Alert", back_populates="sensor", cascade="all, delete-orphan")
+    opc_server = relationship("OpcServer", back_populates="sensors", lazy="raise_on_sql")
+    readings = relationship(
+        "Reading", back_populates="sensor", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
+    )
+    alerts = relationship(
+        "Alert", back_populates="sensor", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
+    )
+    alert_rules = relationship(
+        "AlertRule", back_populates="sensor", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
+    )
 
     __table_args__ = (UniqueConstraint("opc_server_id", "name", name="uq_sensor_opc_server_name"),)
 
@@ -62,7 +71,7 @@ class Reading(Base):
     )
     value: Mapped[float] = mapped_column(Float, nullable=False)
 
-    sensor = relationship("Sensor", back_populates="readings", lazy="subquery")
+    sensor = relationship("Sensor", back_populates="readings", lazy="raise_on_sql")
 
     __table_args__ = (
         {
@@ -71,13 +80,65 @@ class Reading(Base):
     )
 
 
+class SensorLatest(Base):
+    """Most recent reading of each sensor, maintained on ingest so lookups never touch the hypertable."""
+
+    __tablename__ = "sensor_latest"
+
+    sensor_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("sensors.id", ondelete="CASCADE"), primary_key=True
+    )
+    time: Mapped[datetime.datetime] = mapped_column(nullable=False)
+    value: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+class AlertRule(Base, UUIDMixin, CreatedAtMixin):
+    __tablename__ = "alert_rules"
+
+    sensor_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("sensors.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    kind: Mapped[AlertRuleKindEnum] = mapped_column(Enum(AlertRuleKindEnum), nullable=False)
+    threshold: Mapped[float] = mapped_column(Float, nullable=False)
+    hysteresis: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    duration_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+
+    sensor = relationship("Sensor", back_populates="alert_rules", lazy="raise_on_sql")
+    alerts = relationship("Alert", back_populates="rule", passive_deletes=True, lazy="raise_on_sql")
+
+
+class AlertRuleState(Base):
+    """Evaluation state of an alert rule, shared by every process that ingests readings of its sensor."""
+
+    __tablename__ = "alert_rule_states"
+
+    rule_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("alert_rules.id", ondelete="CASCADE"), primary_key=True
+    )
+    active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    # Times are Unix epoch seconds, as the alert engine evaluates them.
+    since: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    fired: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    last_time: Mapped[float | None] = mapped_column(Float, nullable=True)
+    last_value: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+
 class Alert(Base, UUIDMixin, CreatedAtMixin):
     __tablename__ = "alerts"
 
     sensor_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("sensors.id", ondelete="CASCADE"), nullable=False
     )
+    rule_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("alert_rules.id", ondelete="SET NULL"), nullable=True
+    )
     message: Mapped[str] = mapped_column(Text, nullable=False)
     triggered_value: Mapped[float] = mapped_column(Float, nullable=False)
 
-    sensor = relationship("Sensor", back_populates="alerts", lazy="subquery")
+    sensor = relationship("Sensor", back_populates="alerts", lazy="raise_on_sql")
+    rule = relationship("AlertRule", back_populates="alerts", lazy="raise_on_sql")
+
+    # Rule alerts carry the reading time in created_at, so a reading replayed by another process cannot fire twice.
+    __table_args__ = (Index("uq_alerts_rule_id_created_at", "rule_id", "created_at", unique=True),)
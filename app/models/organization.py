@@ -1,5 +1,5 @@
-from sqlalchemy import String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Integer, String, Text
+from sqlalchemy.orm import Mapped, backref, mapped_column, relationship
 
 from app.models.base import Base, UUIDMixin, CreatedAtMixin, SoftDeleteMixin
 
@@ -11,8 +11,20 @@ class Organization(Base, UUIDMixin, CreatedAtMixin, SoftDeleteMixin):
 
     name: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Shorter retention for this organization's readings; the global retention policy still applies on top.
+    readings_retention_days: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    users = relationship("User", secondary="user_organization_association", backref="organizations", lazy="subquery")
+    users = relationship(
+        "User",
+        secondary="user_organization_association",
+        backref=backref("organizations", passive_deletes=True, lazy="raise_on_sql"),
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
     opc_servers = relationship(
-        "OpcServer", back_populates="organization", cascade="all, delete-orphan", lazy="subquery"
+        "OpcServer",
+        back_populates="organization",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
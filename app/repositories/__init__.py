@@ -0,0 +1,26 @@
+from app.repositories.alert import AlertRepository, AlertRuleRepository, AlertRuleStateRepository
+from app.repositories.base import BaseRepository, UpsertResult
+from app.repositories.collector_node import CollectorNodeRepository
+from app.repositories.organization import OrganizationRepository
+from app.repositories.opc_server import OpcServerRepository, SensorRepository
+from app.repositories.reading import ReadingRepository, ReadingRecord
+from app.repositories.sensor_latest import SensorLatestRepository
+from app.repositories.table_version import TableVersionRepository
+from app.repositories.user import UserOrganizationRepository
+
+__all__ = [
+    "AlertRepository",
+    "AlertRuleRepository",
+    "AlertRuleStateRepository",
+    "BaseRepository",
+    "UpsertResult",
+    "CollectorNodeRepository",
+    "OrganizationRepository",
+    "OpcServerRepository",
+    "SensorRepository",
+    "ReadingRepository",
+    "ReadingRecord",
+    "SensorLatestRepository",
+    "TableVersionRepository",
+    "UserOrganizationRepository",
+]
@@ -0,0 +1,74 @@
+import itertools
+from collections.abc import Iterable, Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.constants import ALERTS_INSERT_BATCH_SIZE
+from app.models import Alert, AlertRule, AlertRuleState
+from app.repositories.base import BaseRepository
+
+__all__ = ["AlertRepository", "AlertRuleRepository", "AlertRuleStateRepository"]
+
+
+class AlertRepository(BaseRepository[Alert]):
+    model = Alert
+
+    async def insert_many(self, obj_in: Sequence[dict[str, Any]]) -> list[Alert]:
+        """
+        Insert rule alerts in multi-row batches, skipping any that an identical ``(rule_id, created_at)`` already has.
+
+        Returns:
+            The alerts that were actually inserted
+        """
+
+        inserted: list[Alert] = []
+        for batch in itertools.batched(obj_in, ALERTS_INSERT_BATCH_SIZE):
+            statement = (
+                pg_insert(self.model)
+                .values(batch)
+                .on_conflict_do_nothing(index_elements=[self.model.rule_id, self.model.created_at])
+                .returning(self.model)
+            )
+            result = await self._session.execute(statement)
+            inserted.extend(result.scalars().all())
+        return inserted
+
+
+class AlertRuleRepository(BaseRepository[AlertRule]):
+    model = AlertRule
+
+
+class AlertRuleStateRepository(BaseRepository[AlertRuleState]):
+    model = AlertRuleState
+
+    _STATE_COLUMNS = ("active", "since", "fired", "last_time", "last_value")
+
+    async def lock(self, rule_ids: Iterable[UUID]) -> dict[UUID, Row]:
+        """
+        Lock the state rows of ``rule_ids`` until the transaction ends, creating missing ones, and return them.
+
+        Rows are created and locked in id order, so transactions locking overlapping rules cannot deadlock; a
+        concurrent writer of the same rules waits for this transaction and then reads its result.
+        """
+
+        rule_ids = sorted(set(rule_ids))
+        if not rule_ids:
+            return {}
+
+        # Selected from alert_rules so a rule deleted meanwhile is skipped instead of failing the whole batch.
+        rules = select(AlertRule.id).where(AlertRule.id.in_(rule_ids)).order_by(AlertRule.id)
+        await self._session.execute(pg_insert(self.model).from_select(["rule_id"], rules).on_conflict_do_nothing())
+        query = (
+            select(self.model.rule_id, *(self.model.__table__.c[name] for name in self._STATE_COLUMNS))
+            .where(self.model.rule_id.in_(rule_ids))
+            .order_by(self.model.rule_id)
+            .with_for_update()
+        )
+        result = await self._session.execute(query)
+        return {row.rule_id: row for row in result.all()}
+
+    async def save(self, states: Sequence[dict[str, Any]]) -> None:
+        await self.bulk_upsert(states, ["rule_id"], self._STATE_COLUMNS)
@@ -1,14 +1,24 @@
+import enum
+import itertools
+import json
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from typing import TypeVar, Generic, Any
+from collections.abc import Iterable, Sequence
+from typing import TypeVar, Generic, Any, NamedTuple
 
-from sqlalchemy import select, and_, ColumnElement, func, delete, desc, asc, update
-from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import select, and_, ColumnElement, func, delete, desc, asc, update, text, tuple_, Table, Select, Text
+from sqlalchemy import Column, Enum, Integer, String, bindparam, cast, literal_column
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import Insert, insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm import InstrumentedAttribute, load_only
+from sqlalchemy.orm.interfaces import ORMOption
 
-from app.core.exc import ObjectAlreadyExistsException, ObjectNotFoundException
+from app.core.constants import REPOSITORY_UPSERT_BATCH_SIZE
+from app.core.exc import BadRequestException, ObjectAlreadyExistsException, ObjectNotFoundException
+from app.enums import CountModeEnum
+from app.repositories.statement_cache import statement_cache
+from app.utils.cursor import decode_cursor, encode_cursor
 
 T = TypeVar("T")
 action_map = {
@@ -24,6 +34,29 @@ action_map = {
     "ilike": "ilike",
     "is_not": "is_not",
 }
+_EXPANDING_ACTIONS = {"in_", "notin_"}
+# ``IS NOT`` cannot take a bound parameter in Postgres, so its value becomes part of the cached statement.
+_LITERAL_ACTION_SUFFIXES = ("__is_not",)
+_BOUND = ...
+
+
+class UpsertResult(NamedTuple):
+    inserted: int
+    updated: int
+
+
+class _FilterPlan(NamedTuple):
+    clauses: tuple[ColumnElement, ...]
+    param_names: tuple[str | None, ...]
+
+    def params(self, filters: dict[str, Any]) -> dict[str, Any]:
+        return {name: value for name, value in zip(self.param_names, filters.values()) if name is not None}
+
+
+def _array_value(value: Any) -> Any:
+    """Element of a column array; enum members are sent by name, the way SQLAlchemy stores them."""
+
+    return value.name if isinstance(value, enum.Enum) else value
 
 
 class AbstractRepositoryMixin(ABC, Generic[T]):
@@ -41,19 +74,46 @@ class AbstractRepositoryMixin(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    async def get(self, filters: dict[str, Any]) -> T | None:
+    async def get(
+        self, filters: dict[str, Any], options: Sequence[ORMOption] = (), columns: Sequence[str] | None = None
+    ) -> T | None:
         pass
 
     @abstractmethod
-    async def get_multi_without_pagination(self, order_by: str | None = None, **filters: Any) -> Sequence[T]:
+    async def get_multi_without_pagination(
+        self,
+        order_by: str | None = None,
+        options: Sequence[ORMOption] = (),
+        columns: Sequence[str] | None = None,
+        **filters: Any,
+    ) -> Sequence[T]:
         pass
 
     @abstractmethod
     async def get_multi(
-        self, offset: int = 0, limit: int = 10, order_by: str | None = None, **filters: Any
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        order_by: str | None = None,
+        options: Sequence[ORMOption] = (),
+        columns: Sequence[str] | None = None,
+        **filters: Any,
     ) -> tuple[Sequence[T], int]:
         pass
 
+    @abstractmethod
+    async def get_multi_by_cursor(
+        self,
+        limit: int = 10,
+        order_by: str | None = None,
+        cursor: str | None = None,
+        count_mode: CountModeEnum = CountModeEnum.NONE,
+        options: Sequence[ORMOption] = (),
+        columns: Sequence[str] | None = None,
+        **filters: Any,
+    ) -> tuple[Sequence[T], str | None, int | None]:
+        pass
+
     @abstractmethod
     def get_where_clauses(self, filters: dict[str, Any]) -> list[T]:
         pass
@@ -92,11 +152,8 @@ class BaseRepository(AbstractRepositoryMixin[T]):
 
     async def create_or_update(
         self, obj_in: dict[str, Any], conflict_columns: list[str], update_columns: list[str]
-    ) -> None:
-        statement = pg_insert(self.model).values(obj_in)
-        update_dict = {col: getattr(statement.excluded, col) for col in update_columns if col in obj_in}
-        statement = statement.on_conflict_do_update(index_elements=conflict_columns, set_=update_dict)
-        await self._session.execute(statement)
+    ) -> UpsertResult:
+        return await self.bulk_upsert([obj_in], conflict_columns, [col for col in update_columns if col in obj_in])
 
     async def create_many(self, obj_in: list[dict[str, Any]]) -> None:
         try:
@@ -108,34 +165,105 @@ class BaseRepository(AbstractRepositoryMixin[T]):
 
     async def create_many_or_update(
         self, obj_in: list[dict[str, Any]], conflict_columns: list[str], update_columns: list[str]
-    ) -> None:
-        statement = pg_insert(self.model).values(obj_in)
-        update_dict = {col: getattr(statement.excluded, col) for col in update_columns}
-        statement = statement.on_conflict_do_update(index_elements=conflict_columns, set_=update_dict)
-        await self._session.execute(statement)
+    ) -> UpsertResult:
+        return await self.bulk_upsert(obj_in, conflict_columns, update_columns)
+
+    async def bulk_upsert(
+        self,
+        rows: Sequence[dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str] = (),
+        batch_size: int = REPOSITORY_UPSERT_BATCH_SIZE,
+    ) -> UpsertResult:
+        """
+        Insert ``rows`` and update the ones that conflict, sending one array parameter per column.
 
-    async def get(self, filters: dict[str, Any]) -> T | None:
-        query = select(self.model).where(and_(*[getattr(self.model, k) == v for k, v in filters.items()]))
-        result = await self._session.execute(query)
+        Rows are merged with ``INSERT ... SELECT ... FROM unnest(...) ON CONFLICT``, so a statement has as many
+        parameters as the table has columns regardless of the batch size, and one compiled statement serves every
+        batch. Rows repeating a conflict key are reduced to the last one, which a single statement requires.
+
+        Args:
+           rows: Column values per row; every row must have the same keys
+           conflict_columns: Columns of the unique index that detects conflicts
+           update_columns: Columns overwritten on conflict; conflicting rows are skipped when empty
+           batch_size: Rows sent per statement
+
+        Returns:
+           Number of rows inserted and number of existing rows updated
+        """
+
+        if not rows:
+            return UpsertResult(0, 0)
+
+        names = tuple(rows[0])
+        if any(row.keys() != rows[0].keys() for row in rows):
+            raise ValueError(f"Rows upserted into {self.model.__name__} must all have the same columns")
+        if all(name in names for name in conflict_columns):
+            rows = list({tuple(row[name] for name in conflict_columns): row for row in rows}.values())
+
+        # Callable defaults such as ``uuid4`` would be evaluated once per statement, so they are generated per row.
+        table: Table = self.model.__table__
+        generated = tuple(
+            column
+            for column in table.columns
+            if column.key not in names and column.default is not None and column.default.is_callable
+        )
+        statement = statement_cache.get_or_build(
+            (self.model, "bulk_upsert", names, tuple(conflict_columns), tuple(update_columns)),
+            lambda: self._build_upsert_statement(
+                [table.c[name] for name in names] + list(generated), conflict_columns, update_columns
+            ),
+        )
+
+        inserted = updated = 0
+        for batch in itertools.batched(rows, batch_size):
+            params = {f"column_{index}": [_array_value(row[name]) for row in batch] for index, name in enumerate(names)}
+            for index, column in enumerate(generated, start=len(names)):
+                params[f"column_{index}"] = [column.default.arg(None) for _ in batch]
+
+            result = await self._session.execute(statement, params)
+            flags = result.scalars().all()
+            inserted += sum(flags)
+            updated += len(flags) - sum(flags)
+        return UpsertResult(inserted, updated)
+
+    async def get(
+        self, filters: dict[str, Any], options: Sequence[ORMOption] = (), columns: Sequence[str] | None = None
+    ) -> T | None:
+        shape = self._filter_shape(filters)
+        plan = self._filter_plan(shape)
+        query = statement_cache.get_or_build(
+            (self.model, "get", shape), lambda: select(self.model).where(*plan.clauses).limit(1)
+        )
+        query = self._apply_loading(query, options, columns)
+        result = await self._session.execute(query, plan.params(filters))
         obj = result.scalars().first()
         return obj
 
     async def get_multi(
-        self, offset: int = 0, limit: int = 10, order_by: str | None = None, **filters: Any
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        order_by: str | None = None,
+        options: Sequence[ORMOption] = (),
+        columns: Sequence[str] | None = None,
+        **filters: Any,
     ) -> tuple[Sequence[T], int]:
-        statement = (
-            select(self.model, func.count().over().label("total_count"))
-            .where(*self.get_where_clauses(filters))
-            .offset(offset)
-            .limit(limit)
+        shape = self._filter_shape(filters)
+        plan = self._filter_plan(shape)
+        statement = statement_cache.get_or_build(
+            (self.model, "get_multi", shape, order_by),
+            lambda: self._order(
+                select(self.model, func.count().over().label("total_count"))
+                .where(*plan.clauses)
+                .offset(bindparam("offset", type_=Integer))
+                .limit(bindparam("limit", type_=Integer)),
+                order_by,
+            ),
         )
-        if order_by:
-            if order_by.startswith("-"):
-                statement = statement.order_by(desc(getattr(self.model, order_by[1:])).nulls_last())
-            else:
-                statement = statement.order_by(asc(getattr(self.model, order_by)))
+        statement = self._apply_loading(statement, options, columns)
 
-        result = await self._session.execute(statement)
+        result = await self._session.execute(statement, {**plan.params(filters), "offset": offset, "limit": limit})
         rows = result.all()
 
         if rows:
@@ -147,34 +275,194 @@ class BaseRepository(AbstractRepositoryMixin[T]):
 
         return objs, total_count
 
-    async def get_multi_without_pagination(self, order_by: str | None = None, **filters: Any) -> Sequence[T]:
-        statement = select(self.model).where(*self.get_where_clauses(filters))
-        if order_by:
-            if order_by.startswith("-"):
-                statement = statement.order_by(desc(getattr(self.model, order_by[1:])).nulls_last())
-            else:
-                statement = statement.order_by(asc(getattr(self.model, order_by)))
+    async def get_multi_by_cursor(
+        self,
+        limit: int = 10,
+        order_by: str | None = None,
+        cursor: str | None = None,
+        count_mode: CountModeEnum = CountModeEnum.NONE,
+        options: Sequence[ORMOption] = (),
+        columns: Sequence[str] | None = None,
+        **filters: Any,
+    ) -> tuple[Sequence[T], str | None, int | None]:
+        """
+        Keyset pagination over ``order_by`` plus the primary key.
+
+        Unlike ``get_multi`` the cost of a page does not depend on its depth and the filtered set is never counted
+        unless asked for.
+
+        Args:
+           limit: Page size
+           order_by: Column name, prefixed with ``-`` for descending order; defaults to the primary key
+           cursor: ``next_cursor`` returned with the previous page
+           count_mode: Whether to return no total, a planner estimate or an exact count
+           options: Loader options such as ``selectinload`` or ``joinedload`` for relationships to fetch
+           columns: Attribute names to load, the key columns are always added
+           filters: Same ``column__action`` filters as ``get_multi``
+
+        Returns:
+           Page of objects, cursor of the next page or None on the last page, and the total count if requested
+        """
 
-        result = await self._session.execute(statement)
+        descending = bool(order_by) and order_by.startswith("-")
+        key_columns = statement_cache.get_or_build((self.model, "keyset", order_by), lambda: self._keyset(order_by))
+        if columns:
+            columns = [*columns, *[c.key for c in key_columns if c.key not in columns]]
+
+        shape = self._filter_shape(filters)
+        plan = self._filter_plan(shape)
+        statement = statement_cache.get_or_build(
+            (self.model, "get_multi_by_cursor", shape, order_by, cursor is not None),
+            lambda: self._build_keyset_statement(plan, key_columns, descending, cursor is not None),
+        )
+        statement = self._apply_loading(statement, options, columns)
+
+        params = {**plan.params(filters), "limit": limit + 1}
+        if cursor is not None:
+            values = decode_cursor(cursor, order_by or "", key_columns)
+            params.update({f"key_{index}": value for index, value in enumerate(values)})
+
+        result = await self._session.execute(statement, params)
+        objs = result.scalars().all()
+
+        next_cursor = None
+        if len(objs) > limit:
+            objs = objs[:limit]
+            next_cursor = encode_cursor(order_by or "", [getattr(objs[-1], c.key) for c in key_columns])
+
+        total_count = None
+        if count_mode == CountModeEnum.EXACT:
+            total_count = await self.count(filters)
+        elif count_mode == CountModeEnum.ESTIMATED:
+            total_count = await self.estimate_count(filters)
+
+        return objs, next_cursor, total_count
+
+    async def get_multi_without_pagination(
+        self,
+        order_by: str | None = None,
+        options: Sequence[ORMOption] = (),
+        columns: Sequence[str] | None = None,
+        **filters: Any,
+    ) -> Sequence[T]:
+        shape = self._filter_shape(filters)
+        plan = self._filter_plan(shape)
+        statement = statement_cache.get_or_build(
+            (self.model, "get_multi_without_pagination", shape, order_by),
+            lambda: self._order(select(self.model).where(*plan.clauses), order_by),
+        )
+        statement = self._apply_loading(statement, options, columns)
+
+        result = await self._session.execute(statement, plan.params(filters))
         objs = result.scalars().all()
 
         return objs
 
-    def get_where_clauses(self, filters: dict[str, Any]) -> list[ColumnElement]:
+    def _build_upsert_statement(
+        self, columns: Sequence[Column], conflict_columns: Sequence[str], update_columns: Sequence[str]
+    ) -> Insert:
+        # Enum arrays are sent as text and cast per element, since the driver cannot encode arrays of named enums.
+        names = [f"column_{index}" for index in range(len(columns))]
+        arrays = [
+            bindparam(name, type_=ARRAY(String() if isinstance(column.type, Enum) else column.type))
+            for name, column in zip(names, columns)
+        ]
+        source = func.unnest(*arrays).table_valued(*names).render_derived()
+        selected = [
+            cast(source.c[name], column.type) if isinstance(column.type, Enum) else source.c[name]
+            for name, column in zip(names, columns)
+        ]
+
+        statement = pg_insert(self.model.__table__).from_select([column.key for column in columns], select(*selected))
+        if update_columns:
+            statement = statement.on_conflict_do_update(
+                index_elements=list(conflict_columns), set_={col: statement.excluded[col] for col in update_columns}
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=list(conflict_columns))
+        # ``xmax`` of a freshly inserted row is 0; a row updated by ON CONFLICT DO UPDATE carries the updating xid.
+        return statement.returning(literal_column("xmax = 0").label("inserted"))
+
+    def _apply_loading(self, statement: Select, options: Sequence[ORMOption], columns: Sequence[str] | None) -> Select:
+        """
+        Attach per-call loading strategies.
+
+        Relationships are not loaded unless requested through ``options``; ``columns`` restricts the loaded
+        attributes and makes access to any other one raise instead of emitting a lazy load.
+        """
+
+        if columns:
+            statement = statement.options(load_only(*[self._get_column(name) for name in columns], raiseload=True))
+        if options:
+            statement = statement.options(*options)
+        return statement
+
+    def _get_column(self, column_name: str) -> InstrumentedAttribute:
+        if column_name not in self.model.__mapper__.column_attrs:
+            raise BadRequestException(alias={"column": column_name, "model_name": self.model.__name__})
+        return getattr(self.model, column_name)
+
+    def _order(self, statement: Select, order_by: str | None) -> Select:
+        if not order_by:
+            return statement
+        if order_by.startswith("-"):
+            return statement.order_by(desc(self._get_column(order_by[1:])).nulls_last())
+        return statement.order_by(asc(self._get_column(order_by)))
+
+    def _keyset(self, order_by: str | None) -> list[Column]:
+        key_columns = list(self.model.__mapper__.primary_key)
+        if not order_by:
+            return key_columns
+        order_column = self._get_column(order_by.lstrip("-")).property.columns[0]
+        return [order_column, *[c for c in key_columns if c.key != order_column.key]]
+
+    def _build_keyset_statement(
+        self, plan: _FilterPlan, key_columns: list[Column], descending: bool, after_cursor: bool
+    ) -> Select:
+        statement = select(self.model).where(*plan.clauses)
+        if after_cursor:
+            position = tuple_(*key_columns)
+            values = tuple_(*[bindparam(f"key_{index}", type_=c.type) for index, c in enumerate(key_columns)])
+            statement = statement.where(position < values if descending else position > values)
+        order = [desc(c) if descending else asc(c) for c in key_columns]
+        return statement.order_by(*order).limit(bindparam("limit", type_=Integer))
+
+    @staticmethod
+    def _filter_shape(filters: dict[str, Any]) -> tuple[tuple[str, Any], ...]:
+        """Hashable description of ``filters`` without their values, except the ones rendered literally."""
+
+        return tuple(
+            (key, value if value is None or key.endswith(_LITERAL_ACTION_SUFFIXES) else _BOUND)
+            for key, value in filters.items()
+        )
+
+    def _filter_plan(self, shape: tuple[tuple[str, Any], ...]) -> _FilterPlan:
+        return statement_cache.get_or_build((self.model, "filters", shape), lambda: self._build_filter_plan(shape))
+
+    def _build_filter_plan(self, shape: tuple[tuple[str, Any], ...]) -> _FilterPlan:
         clauses: list[ColumnElement] = []
-        for key, value in filters.items():
-            if "__" not in key:
-                key = f"{key}__eq"
-            column_name, action_name = key.split("__")
-            column: InstrumentedAttribute = getattr(self.model, column_name)
-            if column is None:
-                raise Exception(f"Column {column_name} not found in {self.model.__name__}")
-            action: str | None = action_map.get(action_name, None)
+        param_names: list[str | None] = []
+        for index, (key, marker) in enumerate(shape):
+            column_name, _, action_name = key.partition("__")
+            column = self._get_column(column_name)
+            action: str | None = action_map.get(action_name or "eq")
             if action is None:
-                raise Exception(f"Action {action_name} not found in action_map")
-            clause: ColumnElement = getattr(column, action)(value)
-            clauses.append(clause)
-        return clauses
+                raise BadRequestException(alias={"filter": key, "model_name": self.model.__name__})
+
+            if marker is _BOUND:
+                name = f"filter_{index}"
+                parameter = bindparam(name, type_=column.type, expanding=action in _EXPANDING_ACTIONS)
+                clauses.append(getattr(column, action)(parameter))
+                param_names.append(name)
+            else:
+                clauses.append(getattr(column, action)(marker))
+                param_names.append(None)
+        return _FilterPlan(tuple(clauses), tuple(param_names))
+
+    def get_where_clauses(self, filters: dict[str, Any]) -> list[ColumnElement]:
+        plan = self._filter_plan(self._filter_shape(filters))
+        params = plan.params(filters)
+        return [clause.params(params) for clause in plan.clauses]
 
     async def update(self, filters: dict[str, Any], updates: dict[str, Any]) -> T:
         query = update(self.model).where(and_(*self.get_where_clauses(filters))).values(**updates).returning(self.model)
@@ -210,7 +498,7 @@ class BaseRepository(AbstractRepositoryMixin[T]):
         query = delete(self.model).where(and_(*self.get_where_clauses(filters)))
         await self._session.execute(query)
 
-    async def upsert(self, obj_in: dict[str, Any], index_columns: list[str]) -> None:
+    async def upsert(self, obj_in: dict[str, Any], index_columns: list[str]) -> UpsertResult:
         """
         Insert or update database object based on index columns.
 
@@ -219,15 +507,54 @@ class BaseRepository(AbstractRepositoryMixin[T]):
            index_columns: List of column names that form the unique index
         """
 
-        update_dict = {k: v for k, v in obj_in.items() if k not in index_columns}
-
-        statement = (
-            pg_insert(self.model).values(**obj_in).on_conflict_do_update(index_elements=index_columns, set_=update_dict)
-        )
-        await self._session.execute(statement)
+        update_columns = [key for key in obj_in if key not in index_columns]
+        return await self.bulk_upsert([obj_in], index_columns, update_columns)
 
     async def count(self, filters: dict[str, Any]) -> int:
-        statement = select(func.count()).where(and_(*self.get_where_clauses(filters)))
-        result = await self._session.execute(statement)
+        shape = self._filter_shape(filters)
+        plan = self._filter_plan(shape)
+        statement = statement_cache.get_or_build(
+            (self.model, "count", shape), lambda: select(func.count()).select_from(self.model).where(*plan.clauses)
+        )
+        result = await self._session.execute(statement, plan.params(filters))
         count = result.scalar()
         return count
+
+    async def estimate_count(self, filters: dict[str, Any]) -> int:
+        """
+        Cheap row count estimate from planner statistics instead of scanning the filtered set.
+
+        Unfiltered counts come from ``pg_class.reltuples`` (``approximate_row_count`` for hypertables), filtered
+        ones from the row estimate of the query plan.
+        """
+
+        table: Table = self.model.__table__
+        if not filters:
+            if table.kwargs.get("timescaledb_hypertable"):
+                statement = text("SELECT approximate_row_count(CAST(:table_name AS text)::regclass)")
+            else:
+                statement = text(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS text)::regclass"
+                )
+            result = await self._session.execute(statement, {"table_name": table.name})
+            return max(result.scalar() or 0, 0)
+
+        statement = select(self.model).where(*self.get_where_clauses(filters))
+        compiled = statement.compile(dialect=self._session.get_bind().dialect, compile_kwargs={"literal_binds": True})
+        connection = await self._session.connection()
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def notify(self, channel: str, payloads: Iterable[str]) -> None:
+        """Queue NOTIFY messages on ``channel``; Postgres delivers them to listeners when the transaction commits."""
+
+        payloads = list(payloads)
+        if not payloads:
+            return
+        statement = text("SELECT pg_notify(:channel, payload) FROM unnest(:payloads) AS payload").bindparams(
+            bindparam("payloads", type_=ARRAY(Text))
+        )
+        await self._session.execute(statement, {"channel": channel, "payloads": payloads})
@@ -0,0 +1,32 @@
+from collections.abc import Sequence
+from datetime import timedelta
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models import CollectorNode
+from app.repositories.base import BaseRepository
+
+__all__ = ["CollectorNodeRepository"]
+
+
+class CollectorNodeRepository(BaseRepository[CollectorNode]):
+    model = CollectorNode
+
+    async def heartbeat(self, node_id: UUID, hostname: str) -> None:
+        """Create or renew the lease of a node, stamped with the database clock so node clocks never matter."""
+
+        statement = pg_insert(self.model).values(id=node_id, hostname=hostname)
+        statement = statement.on_conflict_do_update(index_elements=[self.model.id], set_={"heartbeat_at": func.now()})
+        await self._session.execute(statement)
+
+    async def get_live(self, lease_ttl: timedelta) -> Sequence[UUID]:
+        """Ids of the nodes whose lease was renewed within ``lease_ttl``, removing the expired ones."""
+
+        expired_before = func.now() - lease_ttl
+        await self._session.execute(delete(self.model).where(self.model.heartbeat_at < expired_before))
+        result = await self._session.execute(
+            select(self.model.id).where(self.model.heartbeat_at >= expired_before).order_by(self.model.id)
+        )
+        return result.scalars().all()
@@ -0,0 +1,90 @@
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import contains_eager
+
+from app.models import OpcServer, Sensor
+from app.repositories.base import BaseRepository, UpsertResult
+
+__all__ = ["OpcServerRepository", "SensorRepository"]
+
+
+class OpcServerRepository(BaseRepository[OpcServer]):
+    model = OpcServer
+
+    async def get_active_with_sensors(self) -> Sequence[OpcServer]:
+        """
+        Fetch non-deleted OPC servers that have at least one non-deleted sensor, with those sensors attached.
+        """
+
+        statement = (
+            select(self.model)
+            .join(self.model.sensors)
+            .where(self.model.is_deleted.is_(False), Sensor.is_deleted.is_(False))
+            .options(contains_eager(self.model.sensors))
+        )
+        result = await self._session.execute(statement)
+        return result.unique().scalars().all()
+
+
+class SensorRepository(BaseRepository[Sensor]):
+    model = Sensor
+
+    async def sync_definitions(self, opc_server_id: UUID, definitions: Iterable[Mapping[str, Any]]) -> UpsertResult:
+        """
+        Create or refresh the sensors of an OPC server from its address space in one bulk upsert.
+
+        Sensors are matched by name within the server; existing ones get the new node id, description and units and
+        are restored if they were deleted.
+
+        Args:
+           opc_server_id: Server the sensors belong to
+           definitions: Mappings with ``name`` and ``node_id`` and optionally ``description`` and ``units``
+        """
+
+        rows = [
+            {
+                "opc_server_id": opc_server_id,
+                "name": definition["name"],
+                "node_id": definition["node_id"],
+                "description": definition.get("description"),
+                "units": definition.get("units"),
+                "is_deleted": False,
+            }
+            for definition in definitions
+        ]
+        return await self.bulk_upsert(
+            rows,
+            conflict_columns=["opc_server_id", "name"],
+            update_columns=["node_id", "description", "units", "is_deleted"],
+        )
+
+    async def get_existing_ids(self, sensor_ids: Iterable[UUID]) -> set[UUID]:
+        """Subset of ``sensor_ids`` that exist, deleted or not, so readings can reference them."""
+
+        result = await self._session.execute(select(self.model.id).where(self.model.id.in_(set(sensor_ids))))
+        return set(result.scalars().all())
+
+    async def get_ids_by_organization(self, organization_id: UUID) -> list[UUID]:
+        """Ids of the sensors, deleted or not, of every OPC server of the organization."""
+
+        query = (
+            select(self.model.id)
+            .join(OpcServer, OpcServer.id == self.model.opc_server_id)
+            .where(OpcServer.organization_id == organization_id)
+        )
+        result = await self._session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_organization_ids(self, sensor_ids: Iterable[UUID]) -> dict[UUID, UUID]:
+        """Organization of each existing sensor of ``sensor_ids``, through its OPC server."""
+
+        query = (
+            select(self.model.id, OpcServer.organization_id)
+            .join(OpcServer, OpcServer.id == self.model.opc_server_id)
+            .where(self.model.id.in_(set(sensor_ids)))
+        )
+        result = await self._session.execute(query)
+        return dict(result.tuples().all())
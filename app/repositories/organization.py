@@ -0,0 +1,19 @@
+from collections.abc import Sequence
+
+from sqlalchemy import select
+
+from app.models import Organization
+from app.repositories.base import BaseRepository
+
+__all__ = ["OrganizationRepository"]
+
+
+class OrganizationRepository(BaseRepository[Organization]):
+    model = Organization
+
+    async def get_with_readings_retention(self) -> Sequence[Organization]:
+        statement = select(self.model).where(
+            self.model.is_deleted.is_(False), self.model.readings_retention_days.is_not(None)
+        )
+        result = await self._session.execute(statement)
+        return result.scalars().all()
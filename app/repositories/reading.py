@@ -0,0 +1,423 @@
+import itertools
+from collections.abc import AsyncIterator, Iterable, Sequence
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import (
+    DateTime,
+    Row,
+    TableClause,
+    Text,
+    bindparam,
+    cast,
+    column,
+    delete,
+    func,
+    literal,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+
+from app.core.constants import (
+    READINGS_AGGREGATE_VIEWS,
+    READINGS_COPY_BATCH_SIZE,
+    READINGS_EXPORT_CHUNK_SIZE,
+    READINGS_STAGING_TABLE,
+)
+from app.enums import ReadingFillEnum, ReadingResolutionEnum
+from app.models import OpcServer, Reading, Sensor
+from app.repositories.base import BaseRepository
+
+__all__ = ["ReadingRepository", "ReadingRecord"]
+
+ReadingRecord = tuple[datetime, UUID, float]
+
+_COLUMNS = ("time", "sensor_id", "value")
+_SENSOR_IDS_TYPE = ARRAY(PG_UUID(as_uuid=True))
+
+
+def _aggregate_view(name: str) -> TableClause:
+    return table(
+        name,
+        column("bucket"),
+        column("sensor_id"),
+        column("avg_value"),
+        column("min_value"),
+        column("max_value"),
+        column("count"),
+    )
+
+
+_AGGREGATE_VIEWS: dict[ReadingResolutionEnum, TableClause] = {
+    ReadingResolutionEnum(resolution): _aggregate_view(name)
+    for resolution, (name, _) in READINGS_AGGREGATE_VIEWS.items()
+}
+
+
+# Last reading before the range and first reading after it, so edge buckets are filled from outside the window.
+_PREVIOUS_VALUE = (
+    "(SELECT p.value FROM readings p WHERE p.sensor_id = s.sensor_id AND p.time < :start ORDER BY p.time DESC LIMIT 1)"
+)
+_PREVIOUS_POINT = (
+    "(SELECT (p.time, p.value) FROM readings p "
+    "WHERE p.sensor_id = s.sensor_id AND p.time < :start ORDER BY p.time DESC LIMIT 1)"
+)
+_NEXT_POINT = (
+    "(SELECT (n.time, n.value) FROM readings n "
+    "WHERE n.sensor_id = s.sensor_id AND n.time >= :end ORDER BY n.time LIMIT 1)"
+)
+
+
+class ReadingRepository(BaseRepository[Reading]):
+    model = Reading
+
+    async def copy_many(
+        self,
+        records: Iterable[ReadingRecord],
+        update_on_conflict: bool = False,
+        batch_size: int = READINGS_COPY_BATCH_SIZE,
+    ) -> int:
+        """
+        Bulk load readings with binary COPY through a transaction-scoped staging table.
+
+        Records are streamed into the staging table in batches and merged into the hypertable with
+        ``INSERT ... SELECT ... ON CONFLICT``, so the bind-parameter limit of multi-row ``VALUES`` never applies.
+        The staging table numbers records in arrival order, so a key repeated within a batch resolves as if the
+        records were inserted one by one: the last one wins when updating on conflict, the first one otherwise.
+
+        Args:
+            records: Iterable of ``(time, sensor_id, value)`` tuples
+            update_on_conflict: Overwrite ``value`` of existing ``(time, sensor_id)`` rows instead of skipping them
+            batch_size: Number of records copied and merged per round trip
+
+        Returns:
+            Number of rows inserted or updated in the hypertable
+        """
+
+        # Executing through the session first makes sure the driver transaction is open before COPY.
+        await self._session.execute(
+            text(
+                f"CREATE TEMP TABLE IF NOT EXISTS {READINGS_STAGING_TABLE} "
+                f"(LIKE {self.model.__tablename__} INCLUDING DEFAULTS, seq bigint GENERATED ALWAYS AS IDENTITY) "
+                f"ON COMMIT DROP"
+            )
+        )
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        if update_on_conflict:
+            conflict_action, arrival_order = "DO UPDATE SET value = EXCLUDED.value", "DESC"
+        else:
+            conflict_action, arrival_order = "DO NOTHING", "ASC"
+        merge_statement = text(
+            f"INSERT INTO {self.model.__tablename__} (time, sensor_id, value) "
+            f"SELECT DISTINCT ON (time, sensor_id) time, sensor_id, value FROM {READINGS_STAGING_TABLE} "
+            f"ORDER BY time, sensor_id, seq {arrival_order} "
+            f"ON CONFLICT (time, sensor_id) {conflict_action}"
+        )
+
+        affected = 0
+        for batch in itertools.batched(records, batch_size):
+            await driver_connection.copy_records_to_table(READINGS_STAGING_TABLE, records=batch, columns=_COLUMNS)
+            result = await self._session.execute(merge_statement)
+            affected += result.rowcount or 0
+            await self._session.execute(text(f"TRUNCATE {READINGS_STAGING_TABLE}"))
+
+        return affected
+
+    async def get_series(
+        self, sensor_ids: Sequence[UUID], start: datetime, end: datetime, resolution: ReadingResolutionEnum
+    ) -> Sequence[Row]:
+        """
+        Fetch ``(sensor_id, time, avg, min, max, count)`` rows for ``[start, end)`` ordered by sensor and time.
+
+        Aggregated resolutions read the matching continuous aggregate; raw rows are shaped the same way.
+        """
+
+        if resolution == ReadingResolutionEnum.RAW:
+            statement = select(
+                self.model.sensor_id,
+                self.model.time,
+                self.model.value.label("avg"),
+                self.model.value.label("min"),
+                self.model.value.label("max"),
+                literal(1).label("count"),
+            ).where(self.model.sensor_id.in_(sensor_ids), self.model.time >= start, self.model.time < end)
+            statement = statement.order_by(self.model.sensor_id, self.model.time)
+        else:
+            view = _AGGREGATE_VIEWS[resolution]
+            statement = select(
+                view.c.sensor_id,
+                view.c.bucket.label("time"),
+                view.c.avg_value.label("avg"),
+                view.c.min_value.label("min"),
+                view.c.max_value.label("max"),
+                view.c.count,
+            ).where(view.c.sensor_id.in_(sensor_ids), view.c.bucket >= start, view.c.bucket < end)
+            statement = statement.order_by(view.c.sensor_id, view.c.bucket)
+
+        result = await self._session.execute(statement)
+        return result.all()
+
+    async def get_gapfilled(
+        self,
+        sensor_ids: Sequence[UUID],
+        start: datetime,
+        end: datetime,
+        step_seconds: int,
+        fill: ReadingFillEnum,
+        resolution: ReadingResolutionEnum = ReadingResolutionEnum.RAW,
+    ) -> Sequence[Row]:
+        """
+        Fetch ``(sensor_id, time, value)`` rows bucketed with ``time_bucket_gapfill`` over ``[start, end)``.
+
+        Buckets average the readings they cover; aggregated resolutions re-bucket the continuous aggregate
+        weighted by each bucket's count. Empty buckets are emitted with ``value`` left NULL, carried forward
+        or linearly interpolated depending on ``fill``, seeded with the neighbouring readings outside the range.
+        Sensors without a single row in the range are not returned at all.
+        """
+
+        if resolution == ReadingResolutionEnum.RAW:
+            source, time_column, value = self.model.__tablename__, "time", "avg(s.value)"
+        else:
+            source, time_column = READINGS_AGGREGATE_VIEWS[resolution][0], "bucket"
+            value = "sum(s.avg_value * s.count) / NULLIF(sum(s.count), 0)"
+
+        if fill == ReadingFillEnum.LOCF:
+            value = f"locf({value}, {_PREVIOUS_VALUE})"
+        elif fill == ReadingFillEnum.INTERPOLATE:
+            value = f"interpolate({value}, {_PREVIOUS_POINT}, {_NEXT_POINT})"
+
+        statement = text(
+            f"""
+            SELECT
+                s.sensor_id,
+                time_bucket_gapfill(INTERVAL '{int(step_seconds)} seconds', s.{time_column}, :start, :end) AS time,
+                {value} AS value
+            FROM {source} s
+            WHERE s.sensor_id = ANY(:sensor_ids) AND s.{time_column} >= :start AND s.{time_column} < :end
+            GROUP BY s.sensor_id, 2
+            ORDER BY s.sensor_id, 2
+            """
+        ).bindparams(
+            bindparam("sensor_ids", list(sensor_ids), type_=_SENSOR_IDS_TYPE),
+            bindparam("start", start, type_=DateTime(timezone=True)),
+            bindparam("end", end, type_=DateTime(timezone=True)),
+        )
+
+        result = await self._session.execute(statement)
+        return result.all()
+
+    async def get_matrix(
+        self,
+        sensor_ids: Sequence[UUID],
+        start: datetime,
+        end: datetime,
+        step_seconds: int,
+        resolution: ReadingResolutionEnum = ReadingResolutionEnum.RAW,
+    ) -> Sequence[Row]:
+        """
+        Fetch ``(sensor_id, indexes, values)`` rows, one per sensor with readings in ``[start, end)``.
+
+        Readings are averaged per ``step_seconds`` bucket counted from ``start``; ``indexes`` holds the bucket numbers
+        and ``values`` the matching averages as arrays, so the whole matrix comes back in a handful of rows.
+        Aggregated resolutions re-bucket the continuous aggregate weighted by each bucket's count.
+        """
+
+        if resolution == ReadingResolutionEnum.RAW:
+            source, time_column, value = self.model.__tablename__, "time", "avg(s.value)"
+        else:
+            source, time_column = READINGS_AGGREGATE_VIEWS[resolution][0], "bucket"
+            value = "sum(s.avg_value * s.count) / NULLIF(sum(s.count), 0)"
+
+        statement = text(
+            f"""
+            SELECT
+                b.sensor_id,
+                array_agg(b.index ORDER BY b.index) AS indexes,
+                array_agg(b.value ORDER BY b.index) AS values
+            FROM (
+                SELECT
+                    s.sensor_id,
+                    floor(extract(epoch FROM s.{time_column} - :start) / {int(step_seconds)})::integer AS index,
+                    {value} AS value
+                FROM {source} s
+                WHERE s.sensor_id = ANY(:sensor_ids) AND s.{time_column} >= :start AND s.{time_column} < :end
+                GROUP BY 1, 2
+            ) b
+            GROUP BY b.sensor_id
+            """
+        ).bindparams(
+            bindparam("sensor_ids", list(sensor_ids), type_=_SENSOR_IDS_TYPE),
+            bindparam("start", start, type_=DateTime(timezone=True)),
+            bindparam("end", end, type_=DateTime(timezone=True)),
+        )
+
+        result = await self._session.execute(statement)
+        return result.all()
+
+    async def stream_range(
+        self,
+        sensor_ids: Sequence[UUID],
+        start: datetime,
+        end: datetime,
+        chunk_size: int = READINGS_EXPORT_CHUNK_SIZE,
+    ) -> AsyncIterator[tuple[Sequence[datetime], Sequence[str], Sequence[float]]]:
+        """
+        Yield raw readings for ``[start, end)`` as ``(times, sensor_ids, values)`` column chunks.
+
+        Rows are read through a server-side cursor, ``chunk_size`` at a time, without building ORM objects.
+        Sensor ids are cast to text in the database to skip per-row UUID construction.
+        """
+
+        statement = (
+            select(self.model.time, cast(self.model.sensor_id, Text), self.model.value)
+            .where(self.model.sensor_id.in_(sensor_ids), self.model.time >= start, self.model.time < end)
+            .order_by(self.model.sensor_id, self.model.time)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self._session.stream(statement)
+        async for partition in result.partitions():
+            yield tuple(zip(*partition))
+
+    async def stream_points(
+        self,
+        sensor_ids: Sequence[UUID],
+        start: datetime,
+        end: datetime,
+        chunk_size: int = READINGS_EXPORT_CHUNK_SIZE,
+    ) -> AsyncIterator[tuple[Sequence[int], Sequence[float], Sequence[float]]]:
+        """
+        Yield raw readings for ``[start, end)`` as ``(positions, epochs, values)`` column chunks, ordered by sensor
+        and time.
+
+        ``positions`` are 1-based indexes into ``sensor_ids`` and ``epochs`` Unix epoch seconds, both computed in the
+        database, so the chunks convert straight to numeric arrays without per-row UUID or datetime objects.
+        """
+
+        statement = (
+            select(
+                func.array_position(
+                    bindparam("sensor_ids", list(sensor_ids), type_=_SENSOR_IDS_TYPE), self.model.sensor_id
+                ),
+                func.date_part("epoch", self.model.time),
+                self.model.value,
+            )
+            .where(self.model.sensor_id.in_(sensor_ids), self.model.time >= start, self.model.time < end)
+            .order_by(self.model.sensor_id, self.model.time)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self._session.stream(statement)
+        async for partition in result.partitions():
+            yield tuple(zip(*partition))
+
+    async def get_chunks(self, chunk_name: str | None = None) -> Sequence[Row]:
+        """
+        Describe the hypertable chunks, oldest first, with their size and compression statistics.
+
+        Byte counts of uncompressed chunks are None in the ``before``/``after`` compression columns.
+        """
+
+        statement = text(
+            """
+            SELECT
+                c.chunk_schema,
+                c.chunk_name,
+                c.range_start,
+                c.range_end,
+                c.is_compressed,
+                size.total_bytes,
+                stats.before_compression_total_bytes,
+                stats.after_compression_total_bytes
+            FROM timescaledb_information.chunks AS c
+            LEFT JOIN chunks_detailed_size(CAST(:table_name AS regclass)) AS size
+                ON size.chunk_schema = c.chunk_schema AND size.chunk_name = c.chunk_name
+            LEFT JOIN chunk_compression_stats(CAST(:table_name AS regclass)) AS stats
+                ON stats.chunk_schema = c.chunk_schema AND stats.chunk_name = c.chunk_name
+            WHERE c.hypertable_name = :table_name AND (CAST(:chunk_name AS text) IS NULL OR c.chunk_name = :chunk_name)
+            ORDER BY c.range_start
+            """
+        )
+        result = await self._session.execute(
+            statement, {"table_name": self.model.__tablename__, "chunk_name": chunk_name}
+        )
+        return result.all()
+
+    async def compress_chunk(self, chunk: str, recompress: bool = False) -> None:
+        """Compress a chunk given as ``schema.name``; ``recompress`` rebuilds an already compressed one from scratch."""
+
+        if recompress:
+            await self._session.execute(
+                text("SELECT decompress_chunk(CAST(:chunk AS regclass), if_compressed => true)"), {"chunk": chunk}
+            )
+        await self._session.execute(
+            text("SELECT compress_chunk(CAST(:chunk AS regclass), if_not_compressed => true)"), {"chunk": chunk}
+        )
+
+    async def decompress_chunk(self, chunk: str) -> None:
+        await self._session.execute(
+            text("SELECT decompress_chunk(CAST(:chunk AS regclass), if_compressed => true)"), {"chunk": chunk}
+        )
+
+    async def drop_chunks(self, older_than: datetime) -> list[str]:
+        """Drop every chunk that ends before ``older_than`` and return the dropped chunk names."""
+
+        result = await self._session.execute(
+            text("SELECT drop_chunks(CAST(:table_name AS regclass), older_than => :older_than)"),
+            {"table_name": self.model.__tablename__, "older_than": older_than},
+        )
+        return list(result.scalars().all())
+
+    async def set_policies(self, compress_after_days: int, retention_days: int | None) -> None:
+        """
+        Replace the compression and retention policies of the hypertable.
+
+        A transaction-scoped advisory lock serialises concurrent calls, e.g. from several workers starting at once.
+        """
+
+        table_name = self.model.__tablename__
+        await self._session.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": f"{table_name}:policies"}
+        )
+        await self._session.execute(
+            text("SELECT remove_compression_policy(CAST(:table_name AS regclass), if_exists => true)"),
+            {"table_name": table_name},
+        )
+        await self._session.execute(
+            text(
+                "SELECT add_compression_policy(CAST(:table_name AS regclass), "
+                "compress_after => make_interval(days => :days))"
+            ),
+            {"table_name": table_name, "days": compress_after_days},
+        )
+        await self._session.execute(
+            text("SELECT remove_retention_policy(CAST(:table_name AS regclass), if_exists => true)"),
+            {"table_name": table_name},
+        )
+        if retention_days is not None:
+            await self._session.execute(
+                text(
+                    "SELECT add_retention_policy(CAST(:table_name AS regclass), "
+                    "drop_after => make_interval(days => :days))"
+                ),
+                {"table_name": table_name, "days": retention_days},
+            )
+
+    async def delete_for_organization(
+        self, organization_id: UUID, older_than: datetime, newer_than: datetime | None = None
+    ) -> int:
+        """Delete readings of every sensor of an organization in ``[newer_than, older_than)``."""
+
+        sensors = (
+            select(Sensor.id)
+            .join(OpcServer, Sensor.opc_server_id == OpcServer.id)
+            .where(OpcServer.organization_id == organization_id)
+        )
+        statement = delete(self.model).where(self.model.sensor_id.in_(sensors), self.model.time < older_than)
+        if newer_than is not None:
+            statement = statement.where(self.model.time >= newer_than)
+        result = await self._session.execute(statement)
+        return result.rowcount or 0
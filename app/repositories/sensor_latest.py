@@ -0,0 +1,70 @@
+import itertools
+from collections.abc import Iterable, Sequence
+from uuid import UUID
+
+from sqlalchemy import Row, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.constants import SENSOR_LATEST_UPSERT_BATCH_SIZE
+from app.models import OpcServer, Sensor, SensorLatest
+from app.repositories.base import BaseRepository
+from app.repositories.reading import ReadingRecord
+
+__all__ = ["SensorLatestRepository"]
+
+
+class SensorLatestRepository(BaseRepository[SensorLatest]):
+    model = SensorLatest
+
+    async def upsert_many(self, records: Iterable[ReadingRecord]) -> list[ReadingRecord]:
+        """
+        Advance the stored latest value of every sensor present in ``records``.
+
+        Records are reduced to the newest one per sensor first; rows already holding a newer reading are left alone,
+        so late or replayed batches never move a sensor backwards.
+
+        Returns:
+            The newest record of each sensor, ordered by sensor id
+        """
+
+        latest: dict[UUID, ReadingRecord] = {}
+        for record in records:
+            current = latest.get(record[1])
+            if current is None or record[0] > current[0]:
+                latest[record[1]] = record
+
+        # A stable row order keeps concurrent writers from deadlocking on each other's rows.
+        latest_records = sorted(latest.values(), key=lambda record: record[1])
+        rows = [{"sensor_id": sensor_id, "time": time, "value": value} for time, sensor_id, value in latest_records]
+        for batch in itertools.batched(rows, SENSOR_LATEST_UPSERT_BATCH_SIZE):
+            statement = pg_insert(self.model).values(batch)
+            statement = statement.on_conflict_do_update(
+                index_elements=[self.model.sensor_id],
+                set_={"time": statement.excluded.time, "value": statement.excluded.value},
+                where=self.model.time < statement.excluded.time,
+            )
+            await self._session.execute(statement)
+
+        return latest_records
+
+    async def get_snapshot(self) -> Sequence[Row]:
+        """
+        Fetch ``(sensor_id, opc_server_id, organization_id, time, value)`` for every active sensor.
+
+        Sensors without readings yet are included with ``time`` and ``value`` set to None.
+        """
+
+        statement = (
+            select(
+                Sensor.id.label("sensor_id"),
+                Sensor.opc_server_id,
+                OpcServer.organization_id,
+                self.model.time,
+                self.model.value,
+            )
+            .join(OpcServer, Sensor.opc_server_id == OpcServer.id)
+            .outerjoin(self.model, self.model.sensor_id == Sensor.id)
+            .where(Sensor.is_deleted.is_(False), OpcServer.is_deleted.is_(False))
+        )
+        result = await self._session.execute(statement)
+        return result.all()
@@ -0,0 +1,48 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from app.core.constants import REPOSITORY_STATEMENT_CACHE_SIZE
+
+__all__ = ["StatementCache", "statement_cache"]
+
+
+class StatementCache:
+    """
+    Bounded LRU cache of prebuilt SQLAlchemy statements keyed by model, filter shape and ordering.
+
+    Cached statements use bound parameters in place of filter values, so one entry serves every call with the same
+    shape and SQLAlchemy's compiled cache always hits for it.
+    """
+
+    def __init__(self, maxsize: int = REPOSITORY_STATEMENT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], Any]) -> Any:
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            entry = builder()
+            self._entries[key] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return entry
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._entries)}
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+statement_cache = StatementCache()
@@ -0,0 +1,14 @@
+from sqlalchemy import select
+
+from app.models import TableVersion
+from app.repositories.base import BaseRepository
+
+__all__ = ["TableVersionRepository"]
+
+
+class TableVersionRepository(BaseRepository[TableVersion]):
+    model = TableVersion
+
+    async def get_versions(self) -> dict[str, int]:
+        result = await self._session.execute(select(self.model.table_name, self.model.version))
+        return dict(result.tuples().all())
@@ -0,0 +1,24 @@
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.enums import UserRoleInOrgEnum
+from app.models import Organization, UserOrganizationAssociation
+from app.repositories.base import BaseRepository
+
+__all__ = ["UserOrganizationRepository"]
+
+
+class UserOrganizationRepository(BaseRepository[UserOrganizationAssociation]):
+    model = UserOrganizationAssociation
+
+    async def get_roles(self, user_id: UUID) -> dict[UUID, UserRoleInOrgEnum]:
+        """Map every non-deleted organization the user belongs to onto the user's role in it."""
+
+        statement = (
+            select(self.model.organization_id, self.model.role)
+            .join(Organization, Organization.id == self.model.organization_id)
+            .where(self.model.user_id == user_id, Organization.is_deleted.is_(False))
+        )
+        result = await self._session.execute(statement)
+        return dict(result.tuples().all())
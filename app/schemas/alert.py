@@ -0,0 +1,54 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.enums import AlertRuleKindEnum
+from app.schemas.base import CursorPageQuery, IdBase
+
+__all__ = ["AlertRead", "AlertsPageQuery", "AlertRuleCreate", "AlertRuleRead", "AlertRulesQuery"]
+
+
+class AlertRead(IdBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    sensor_id: UUID
+    rule_id: UUID | None = None
+    message: str
+    triggered_value: float
+    created_at: datetime
+
+
+class AlertsPageQuery(CursorPageQuery):
+    # Exactly one of sensor_id and organization_id selects the alerts.
+    sensor_id: UUID | None = None
+    organization_id: UUID | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
+class AlertRuleCreate(BaseModel):
+    sensor_id: UUID
+    name: str = Field(..., max_length=255)
+    kind: AlertRuleKindEnum
+    threshold: float
+    hysteresis: float = Field(0.0, ge=0)
+    duration_seconds: float = Field(0.0, ge=0)
+    is_active: bool = True
+
+
+class AlertRuleRead(IdBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    sensor_id: UUID
+    name: str
+    kind: AlertRuleKindEnum
+    threshold: float
+    hysteresis: float
+    duration_seconds: float
+    is_active: bool
+    created_at: datetime
+
+
+class AlertRulesQuery(BaseModel):
+    sensor_id: UUID
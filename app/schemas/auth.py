@@ -0,0 +1,13 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+__all__ = ["Principal"]
+
+
+class Principal(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    user_id: UUID
+    expires_at: datetime | None = None
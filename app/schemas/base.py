@@ -1,9 +1,26 @@
+from typing import Generic, TypeVar
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-__all__ = ["IdBase"]
+from app.enums import CountModeEnum
+
+__all__ = ["IdBase", "CursorPageQuery", "CursorPage"]
+
+T = TypeVar("T")
 
 
 class IdBase(BaseModel):
     id: UUID
+
+
+class CursorPageQuery(BaseModel):
+    limit: int = Field(50, ge=1, le=1000)
+    cursor: str | None = None
+    count_mode: CountModeEnum = CountModeEnum.NONE
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+    total: int | None = None
@@ -0,0 +1,23 @@
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+from app.enums import AuthMethodEnum, SecurityPolicyEnum
+
+__all__ = ["CollectorTarget"]
+
+
+class CollectorTarget(BaseModel):
+    """
+    Snapshot of an OPC server and the node ids to monitor on it.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    id: UUID
+    url: str
+    security_policy: SecurityPolicyEnum
+    authentication_method: AuthMethodEnum
+    username: str | None = None
+    password: str | None = None
+    sensors: dict[str, UUID]
@@ -0,0 +1,165 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.core.constants import READINGS_DEFAULT_MAX_POINTS, READINGS_MAX_POINTS_LIMIT
+from app.enums import ReadingDownsampleEnum, ReadingExportFormatEnum, ReadingFillEnum, ReadingResolutionEnum
+from app.schemas.base import CursorPageQuery
+
+__all__ = [
+    "ReadingCreate",
+    "ReadingsIngest",
+    "ReadingsIngestResult",
+    "ReadingsSeriesQuery",
+    "ReadingPoint",
+    "ReadingSeries",
+    "ReadingsSeries",
+    "ReadingsGapfillQuery",
+    "ReadingGapfillSeries",
+    "ReadingsGapfill",
+    "ReadingsMatrixQuery",
+    "ReadingMatrixSeries",
+    "ReadingsMatrix",
+    "ReadingsDownsampleQuery",
+    "ReadingDownsampledSeries",
+    "ReadingsDownsampled",
+    "ReadingRead",
+    "ReadingsPageQuery",
+    "ReadingsExportQuery",
+]
+
+
+class ReadingCreate(BaseModel):
+    time: datetime
+    sensor_id: UUID
+    value: float
+
+
+class ReadingsIngest(BaseModel):
+    items: list[ReadingCreate] = Field(..., min_length=1)
+
+
+class ReadingsIngestResult(BaseModel):
+    accepted: int
+
+
+class ReadingsSeriesQuery(BaseModel):
+    sensor_ids: list[UUID] = Field(..., min_length=1)
+    start: datetime
+    end: datetime
+    max_points: int = Field(READINGS_DEFAULT_MAX_POINTS, ge=1, le=READINGS_MAX_POINTS_LIMIT)
+    resolution: ReadingResolutionEnum | None = None
+
+
+class ReadingPoint(BaseModel):
+    time: datetime
+    avg: float
+    min: float
+    max: float
+    count: int
+
+
+class ReadingSeries(BaseModel):
+    sensor_id: UUID
+    points: list[ReadingPoint]
+
+
+class ReadingsSeries(BaseModel):
+    resolution: ReadingResolutionEnum
+    series: list[ReadingSeries]
+
+
+class ReadingsGapfillQuery(BaseModel):
+    sensor_ids: list[UUID] = Field(..., min_length=1)
+    start: datetime
+    end: datetime
+    points: int = Field(READINGS_DEFAULT_MAX_POINTS, ge=1, le=READINGS_MAX_POINTS_LIMIT)
+    fill: ReadingFillEnum = ReadingFillEnum.LOCF
+
+
+class ReadingGapfillSeries(BaseModel):
+    sensor_id: UUID
+    values: list[float | None]
+
+
+class ReadingsGapfill(BaseModel):
+    """
+    Fixed-step series sharing one time axis: value ``i`` of every series belongs to ``start + i * step_seconds``.
+    """
+
+    start: datetime
+    step_seconds: int
+    points: int
+    fill: ReadingFillEnum
+    series: list[ReadingGapfillSeries]
+
+
+class ReadingsMatrixQuery(BaseModel):
+    sensor_ids: list[UUID] | None = Field(None, min_length=1)
+    opc_server_id: UUID | None = None
+    start: datetime
+    end: datetime
+    step_seconds: int = Field(..., ge=1)
+    format: ReadingExportFormatEnum | None = None
+
+
+class ReadingMatrixSeries(BaseModel):
+    sensor_id: UUID
+    values: list[float | None]
+
+
+class ReadingsMatrix(BaseModel):
+    """
+    Sensors aligned on one time axis: ``timestamps`` are bucket starts in Unix epoch milliseconds and value ``i``
+    of every series is the average of that sensor's readings in bucket ``i``, null when it has none.
+    """
+
+    start: datetime
+    step_seconds: int
+    timestamps: list[int]
+    series: list[ReadingMatrixSeries]
+
+
+class ReadingsDownsampleQuery(BaseModel):
+    sensor_ids: list[UUID] = Field(..., min_length=1)
+    start: datetime
+    end: datetime
+    max_points: int = Field(READINGS_DEFAULT_MAX_POINTS, ge=3, le=READINGS_MAX_POINTS_LIMIT)
+    method: ReadingDownsampleEnum = ReadingDownsampleEnum.LTTB
+
+
+class ReadingDownsampledSeries(BaseModel):
+    """
+    Raw readings kept by the downsampler; ``timestamps`` are Unix epoch milliseconds aligned with ``values``.
+    """
+
+    sensor_id: UUID
+    timestamps: list[int]
+    values: list[float]
+
+
+class ReadingsDownsampled(BaseModel):
+    method: ReadingDownsampleEnum
+    series: list[ReadingDownsampledSeries]
+
+
+class ReadingRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    time: datetime
+    sensor_id: UUID
+    value: float
+
+
+class ReadingsPageQuery(CursorPageQuery):
+    sensor_id: UUID
+    start: datetime | None = None
+    end: datetime | None = None
+
+
+class ReadingsExportQuery(BaseModel):
+    sensor_ids: list[UUID] = Field(..., min_length=1)
+    start: datetime
+    end: datetime
+    format: ReadingExportFormatEnum = ReadingExportFormatEnum.ARROW
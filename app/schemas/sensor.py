@@ -0,0 +1,18 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+__all__ = ["SensorLatestQuery", "SensorLatestRead"]
+
+
+class SensorLatestQuery(BaseModel):
+    opc_server_id: UUID | None = None
+    organization_id: UUID | None = None
+    sensor_ids: list[UUID] | None = None
+
+
+class SensorLatestRead(BaseModel):
+    sensor_id: UUID
+    time: datetime
+    value: float
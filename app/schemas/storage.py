@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, computed_field
+
+__all__ = ["ChunkRead", "ChunksDrop", "ChunksDropResult", "RetentionResult", "StoragePolicies"]
+
+
+class ChunkRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    chunk_name: str
+    range_start: datetime
+    range_end: datetime
+    is_compressed: bool
+    total_bytes: int | None
+    before_compression_total_bytes: int | None
+    after_compression_total_bytes: int | None
+
+    @computed_field
+    @property
+    def compression_ratio(self) -> float | None:
+        if not self.before_compression_total_bytes or not self.after_compression_total_bytes:
+            return None
+        return self.before_compression_total_bytes / self.after_compression_total_bytes
+
+
+class ChunksDrop(BaseModel):
+    older_than: datetime
+
+
+class ChunksDropResult(BaseModel):
+    dropped: list[str]
+
+
+class StoragePolicies(BaseModel):
+    compress_after_days: int
+    retention_days: int | None
+
+
+class RetentionResult(BaseModel):
+    deleted: int
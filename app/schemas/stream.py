@@ -0,0 +1,18 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.schemas.alert import AlertRead
+from app.schemas.sensor import SensorLatestRead
+
+__all__ = ["StreamQuery", "StreamEvent"]
+
+
+class StreamQuery(BaseModel):
+    sensor_ids: list[UUID] | None = None
+    organization_id: UUID | None = None
+
+
+class StreamEvent(BaseModel):
+    readings: list[SensorLatestRead] = Field(default_factory=list)
+    alerts: list[AlertRead] = Field(default_factory=list)
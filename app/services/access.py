@@ -0,0 +1,78 @@
+from collections.abc import Iterable
+from uuid import UUID
+
+from app.core.exc import ForbiddenException
+from app.enums import UserRoleInOrgEnum
+from app.schemas.auth import Principal
+from app.services.latest_values import latest_values
+from app.services.membership import membership_cache
+from app.uow.sql import ReadOnlySQLUnitOfWork
+
+__all__ = ["AccessService"]
+
+_ROLE_RANKS = {
+    UserRoleInOrgEnum.MEMBER: 0,
+    UserRoleInOrgEnum.ADMIN: 1,
+    UserRoleInOrgEnum.OWNER: 2,
+}
+
+
+class AccessService:
+    @staticmethod
+    async def authorize_organizations(
+        principal: Principal, organization_ids: Iterable[UUID], minimum: UserRoleInOrgEnum = UserRoleInOrgEnum.MEMBER
+    ) -> None:
+        """
+        Raise ``ForbiddenException`` unless the principal holds at least ``minimum`` in every organization.
+
+        Roles are read from the membership cache, so a check costs no query while the user's entry is fresh.
+        """
+
+        roles = await membership_cache.get_roles(principal.user_id)
+        for organization_id in organization_ids:
+            role = roles.get(organization_id)
+            if role is None or _ROLE_RANKS[role] < _ROLE_RANKS[minimum]:
+                raise ForbiddenException()
+
+    @staticmethod
+    async def authorize_sensors(
+        principal: Principal, sensor_ids: Iterable[UUID], minimum: UserRoleInOrgEnum = UserRoleInOrgEnum.MEMBER
+    ) -> None:
+        """
+        Raise ``ForbiddenException`` unless the principal holds at least ``minimum`` in the organization of every
+        sensor.
+
+        Organizations come from the latest value store; sensors it does not know yet are looked up in one query.
+        Sensors that do not exist are refused like foreign ones, so the response does not reveal which ids exist.
+        """
+
+        organization_ids: set[UUID] = set()
+        missing: list[UUID] = []
+        for sensor_id in set(sensor_ids):
+            organization_id = latest_values.organization_of(sensor_id)
+            if organization_id is None:
+                missing.append(sensor_id)
+            else:
+                organization_ids.add(organization_id)
+
+        if missing:
+            async with ReadOnlySQLUnitOfWork() as uow:
+                found = await uow.sensors.get_organization_ids(missing)
+            if len(found) < len(missing):
+                raise ForbiddenException()
+            organization_ids.update(found.values())
+
+        await AccessService.authorize_organizations(principal, organization_ids, minimum)
+
+    @staticmethod
+    async def authorize_opc_server(
+        principal: Principal, opc_server_id: UUID, minimum: UserRoleInOrgEnum = UserRoleInOrgEnum.MEMBER
+    ) -> None:
+        """Raise ``ForbiddenException`` unless the principal holds at least ``minimum`` in the server's organization."""
+
+        async with ReadOnlySQLUnitOfWork() as uow:
+            server = await uow.opc_servers.get({"id": opc_server_id}, columns=["organization_id"])
+        if server is None:
+            raise ForbiddenException()
+
+        await AccessService.authorize_organizations(principal, (server.organization_id,), minimum)
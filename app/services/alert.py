@@ -0,0 +1,37 @@
+from app.core.exc import BadRequestException
+from app.schemas.alert import AlertRead, AlertsPageQuery
+from app.schemas.base import CursorPage
+from app.uow.base import ABCUnitOfWork
+
+__all__ = ["AlertService"]
+
+
+class AlertService:
+    @staticmethod
+    async def get_page(uow: ABCUnitOfWork, query: AlertsPageQuery) -> CursorPage[AlertRead]:
+        """Alerts of one sensor or of every sensor of one organization, newest first."""
+
+        if (query.sensor_id is None) == (query.organization_id is None):
+            raise BadRequestException(alias={"selectors": ["sensor_id", "organization_id"]})
+
+        filters = {
+            "sensor_id": query.sensor_id,
+            "sensor_id__in": (
+                await uow.sensors.get_ids_by_organization(query.organization_id)
+                if query.organization_id is not None
+                else None
+            ),
+            "created_at__ge": query.created_from,
+            "created_at__lt": query.created_to,
+        }
+        alerts, next_cursor, total = await uow.alerts.get_multi_by_cursor(
+            limit=query.limit,
+            order_by="-created_at",
+            cursor=query.cursor,
+            count_mode=query.count_mode,
+            **{key: value for key, value in filters.items() if value is not None},
+        )
+
+        return CursorPage[AlertRead](
+            items=[AlertRead.model_validate(alert) for alert in alerts], next_cursor=next_cursor, total=total
+        )
@@ -0,0 +1,256 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from contextlib import suppress
+from typing import Any, NamedTuple
+from uuid import UUID, uuid4
+
+import numpy as np
+from loguru import logger
+
+from app.core import settings
+from app.core.config.alerts import AlertsConfig
+from app.enums import AlertRuleKindEnum
+from app.models import AlertRule
+from app.repositories import ReadingRecord
+from app.uow.sql import SQLUnitOfWork
+
+__all__ = ["AlertEngine", "AlertEvaluation", "alert_engine"]
+
+RulesLoader = Callable[[], Awaitable[Sequence[AlertRule]]]
+
+
+async def _load_rules() -> Sequence[AlertRule]:
+    async with SQLUnitOfWork() as uow:
+        return await uow.alert_rules.get_multi_without_pagination(is_active=True)
+
+
+class _CompiledRules:
+    """Active rules as parallel arrays, ordered by sensor so each sensor's rules are contiguous."""
+
+    def __init__(self, rules: Sequence[AlertRule]) -> None:
+        rules = sorted(rules, key=lambda rule: rule.sensor_id)
+        self.size = len(rules)
+        self.rule_ids = [rule.id for rule in rules]
+        self.rule_indexes = {rule_id: index for index, rule_id in enumerate(self.rule_ids)}
+        self.sensor_ids = [rule.sensor_id for rule in rules]
+        self.messages = [f"{rule.name}: {rule.kind} {rule.threshold:g}" for rule in rules]
+        self.sensor_codes: dict[UUID, int] = {}
+        self.sensor_rules: dict[UUID, list[UUID]] = {}
+        for rule_id, sensor_id in zip(self.rule_ids, self.sensor_ids):
+            self.sensor_codes.setdefault(sensor_id, len(self.sensor_codes))
+            self.sensor_rules.setdefault(sensor_id, []).append(rule_id)
+
+        self.rule_sensor = np.array([self.sensor_codes[sensor_id] for sensor_id in self.sensor_ids], dtype=np.int64)
+        self.is_rate = np.array([rule.kind == AlertRuleKindEnum.RATE_ABOVE for rule in rules], dtype=bool)
+        # Conditions are evaluated as "value above threshold"; BELOW rules flip the sign of both sides.
+        self.direction = np.array([-1.0 if rule.kind == AlertRuleKindEnum.BELOW else 1.0 for rule in rules])
+        self.threshold = np.array([rule.threshold for rule in rules], dtype=np.float64)
+        self.hysteresis = np.array([rule.hysteresis for rule in rules], dtype=np.float64)
+        self.duration = np.array([rule.duration_seconds for rule in rules], dtype=np.float64)
+
+
+class _RuleState(NamedTuple):
+    active: np.ndarray
+    since: np.ndarray
+    fired: np.ndarray
+    last_time: np.ndarray
+    last_value: np.ndarray
+
+    @classmethod
+    def empty(cls, size: int) -> "_RuleState":
+        return cls(
+            active=np.zeros(size, dtype=bool),
+            since=np.zeros(size, dtype=np.float64),
+            fired=np.zeros(size, dtype=bool),
+            last_time=np.full(size, np.nan),
+            last_value=np.full(size, np.nan),
+        )
+
+    @classmethod
+    def load(cls, rules: _CompiledRules, stored: Mapping[UUID, Any]) -> "_RuleState":
+        """State of every compiled rule, taken from the stored rows of ``alert_rule_states`` where there is one."""
+
+        state = cls.empty(rules.size)
+        for rule_id, row in stored.items():
+            index = rules.rule_indexes.get(rule_id)
+            if index is None:
+                continue
+            state.active[index], state.since[index], state.fired[index] = row.active, row.since, row.fired
+            state.last_time[index] = np.nan if row.last_time is None else row.last_time
+            state.last_value[index] = np.nan if row.last_value is None else row.last_value
+        return state
+
+
+class AlertEvaluation(NamedTuple):
+    alerts: list[dict[str, Any]]
+    # New ``alert_rule_states`` rows of the rules the batch touched.
+    states: list[dict[str, Any]]
+
+
+def _shift(array: np.ndarray, first: np.ndarray, initial: np.ndarray) -> np.ndarray:
+    """Previous element within each rule segment, taking ``initial`` at the first element of a segment."""
+
+    shifted = np.empty_like(array)
+    shifted[1:] = array[:-1]
+    shifted[first] = initial
+    return shifted
+
+
+def _fill_forward(mask: np.ndarray, positions: np.ndarray, segment_start: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Index of the latest ``mask`` position at or before each element, and whether it lies in the same segment."""
+
+    latest = np.maximum.accumulate(np.where(mask, positions, -1))
+    return np.maximum(latest, 0), latest >= segment_start
+
+
+class AlertEngine:
+    """
+    Evaluates alert rules against whole readings batches with numpy instead of reading by reading.
+
+    Every (rule, reading) pair of a batch is laid out in one flat array, segmented by rule, and the threshold,
+    rate of change, hysteresis and duration conditions are computed with array operations. A rule fires once when
+    its condition has held for ``duration_seconds`` and re-arms only after the value has moved back past the
+    threshold by ``hysteresis``.
+
+    Rule state lives in ``alert_rule_states`` rather than in the process, so every API worker and collector node
+    ingesting readings of a sensor continues from the same state. A batch locks the state rows of the rules it
+    touches for the length of its transaction, which serialises concurrent batches per rule; ``evaluate`` is pure,
+    so a batch rolled back and retried starts again from the stored state. Rules are compiled in every process and
+    reloaded every ``RULES_REFRESH_INTERVAL_SECONDS``.
+    """
+
+    def __init__(self, loader: RulesLoader = _load_rules, config: AlertsConfig = settings.alerts) -> None:
+        self._loader = loader
+        self._config = config
+        self._rules = _CompiledRules(())
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.exception("Failed to load alert rules: {e}", e=e)
+        self._task = asyncio.create_task(self._run(), name="alert-rules")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def refresh(self) -> None:
+        self.load(await self._loader())
+
+    def load(self, rules: Sequence[AlertRule]) -> None:
+        self._rules = _CompiledRules(rules)
+
+    def rule_ids(self, records: Sequence[ReadingRecord]) -> list[UUID]:
+        """Ids of the rules whose state ``evaluate`` needs for ``records``."""
+
+        sensor_rules = self._rules.sensor_rules
+        return [
+            rule_id for sensor_id in {record[1] for record in records} for rule_id in sensor_rules.get(sensor_id, ())
+        ]
+
+    def evaluate(self, records: Sequence[ReadingRecord], stored: Mapping[UUID, Any]) -> AlertEvaluation:
+        """
+        Evaluate a batch from the ``stored`` state rows of the rules listed by ``rule_ids``; rules without a row
+        start from a blank state.
+        """
+
+        rules = self._rules
+        if not rules.size or not records:
+            return AlertEvaluation([], [])
+
+        sensor_codes = rules.sensor_codes
+        codes = np.fromiter((sensor_codes.get(record[1], -1) for record in records), dtype=np.int64, count=len(records))
+        matched = np.flatnonzero(codes >= 0)
+        if not matched.size:
+            return AlertEvaluation([], [])
+        state = _RuleState.load(rules, stored)
+
+        times = np.fromiter((records[i][0].timestamp() for i in matched), dtype=np.float64, count=matched.size)
+        values = np.fromiter((records[i][2] for i in matched), dtype=np.float64, count=matched.size)
+        order = np.lexsort((times, codes[matched]))
+        matched, times, values, codes = matched[order], times[order], values[order], codes[matched][order]
+
+        # Expand to one element per (rule, reading) pair, grouped into one contiguous segment per rule.
+        starts = np.searchsorted(codes, rules.rule_sensor, side="left")
+        counts = np.searchsorted(codes, rules.rule_sensor, side="right") - starts
+        total = int(counts.sum())
+        offsets = np.cumsum(counts) - counts
+        rule = np.repeat(np.arange(rules.size), counts)
+        positions = np.arange(total)
+        segment_start = np.repeat(offsets, counts)
+        reading = np.repeat(starts, counts) + positions - segment_start
+        first = positions == segment_start
+        first_rule = rule[first]
+
+        time = times[reading]
+        value = values[reading]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rate = np.abs(
+                (value - _shift(value, first, state.last_value[first_rule]))
+                / (time - _shift(time, first, state.last_time[first_rule]))
+            )
+        rate[~np.isfinite(rate)] = np.nan
+        metric = np.where(rules.is_rate[rule], rate, value) * rules.direction[rule]
+        limit = rules.threshold[rule] * rules.direction[rule]
+
+        # NaN metrics satisfy neither side and leave the state unchanged.
+        enter = metric > limit
+        leave = metric <= limit - rules.hysteresis[rule]
+        latest_change, changed_in_segment = _fill_forward(enter | leave, positions, segment_start)
+        active = np.where(changed_in_segment, enter[latest_change], state.active[rule])
+
+        started = active & ~_shift(active, first, state.active[first_rule])
+        latest_start, started_in_segment = _fill_forward(started, positions, segment_start)
+        since = np.where(started_in_segment, time[latest_start], state.since[rule])
+
+        held = active & (time - since >= rules.duration[rule])
+        fire = held & ~(_shift(held, first, state.fired[first_rule]) & ~started)
+
+        touched = np.flatnonzero(counts > 0)
+        last = (offsets + counts - 1)[touched]
+        states = [
+            {
+                "rule_id": rules.rule_ids[index],
+                "active": bool(active[position]),
+                "since": float(since[position]),
+                "fired": bool(held[position]),
+                "last_time": float(time[position]),
+                "last_value": float(value[position]),
+            }
+            for index, position in zip(touched, last)
+        ]
+
+        alerts = []
+        for position in np.flatnonzero(fire):
+            index = rule[position]
+            record = records[matched[reading[position]]]
+            alerts.append(
+                {
+                    "id": uuid4(),
+                    "sensor_id": rules.sensor_ids[index],
+                    "rule_id": rules.rule_ids[index],
+                    "message": f"{rules.messages[index]}, value {record[2]:g}",
+                    "triggered_value": record[2],
+                    "created_at": record[0],
+                }
+            )
+        return AlertEvaluation(alerts, states)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._config.RULES_REFRESH_INTERVAL_SECONDS)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.exception("Failed to refresh alert rules: {e}", e=e)
+
+
+alert_engine = AlertEngine()
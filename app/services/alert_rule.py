@@ -0,0 +1,41 @@
+from uuid import UUID
+
+from app.core.exc import ObjectNotFoundException
+from app.enums import UserRoleInOrgEnum
+from app.schemas.alert import AlertRuleCreate, AlertRuleRead, AlertRulesQuery
+from app.schemas.auth import Principal
+from app.services.access import AccessService
+from app.uow.base import ABCUnitOfWork
+
+__all__ = ["AlertRuleService"]
+
+
+class AlertRuleService:
+    """
+    Alert rule management. Running alert engines pick up changes on their next rule refresh.
+
+    Rules are changed by admins of the organization owning the rule's sensor.
+    """
+
+    @staticmethod
+    async def create(uow: ABCUnitOfWork, data: AlertRuleCreate, principal: Principal) -> AlertRuleRead:
+        await AccessService.authorize_sensors(principal, (data.sensor_id,), UserRoleInOrgEnum.ADMIN)
+        if await uow.sensors.get({"id": data.sensor_id, "is_deleted": False}, columns=["id"]) is None:
+            raise ObjectNotFoundException(data.sensor_id, "Sensor")
+
+        rule = await uow.alert_rules.create(data.model_dump())
+        return AlertRuleRead.model_validate(rule)
+
+    @staticmethod
+    async def get_multi(uow: ABCUnitOfWork, query: AlertRulesQuery) -> list[AlertRuleRead]:
+        rules = await uow.alert_rules.get_multi_without_pagination(order_by="created_at", sensor_id=query.sensor_id)
+        return [AlertRuleRead.model_validate(rule) for rule in rules]
+
+    @staticmethod
+    async def delete(uow: ABCUnitOfWork, rule_id: UUID, principal: Principal) -> None:
+        rule = await uow.alert_rules.get({"id": rule_id}, columns=["sensor_id"])
+        if rule is None:
+            raise ObjectNotFoundException(rule_id, "AlertRule")
+        await AccessService.authorize_sensors(principal, (rule.sensor_id,), UserRoleInOrgEnum.ADMIN)
+
+        await uow.alert_rules.delete({"id": rule_id})
@@ -0,0 +1,203 @@
+import asyncio
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import suppress
+from datetime import datetime
+from uuid import UUID
+
+from loguru import logger
+
+from app.core import settings
+from app.core.config.collector import CollectorConfig
+from app.infra.opc import AsyncuaSession, OpcSessionFactory
+from app.schemas.collector import CollectorTarget
+from app.services.alert_engine import AlertEngine, alert_engine
+from app.services.collector_shards import CollectorShards
+from app.services.ingest_buffer import IngestBuffer, ingest_buffer
+from app.uow.sql import SQLUnitOfWork
+from app.utils.encryption import password_cipher
+
+__all__ = ["CollectorService", "ServerCollector", "load_collector_targets"]
+
+TargetsLoader = Callable[[], Awaitable[Sequence[CollectorTarget]]]
+
+
+async def load_collector_targets() -> list[CollectorTarget]:
+    """
+    Active OPC servers with their sensors. Servers whose password cannot be decrypted are skipped and logged, since
+    connecting with a garbled password would only fail authentication.
+    """
+
+    async with SQLUnitOfWork() as uow:
+        servers = await uow.opc_servers.get_active_with_sensors()
+
+        targets = []
+        for server in servers:
+            password = None
+            if server.encrypted_password is not None:
+                try:
+                    password = password_cipher.decrypt(server.encrypted_password)
+                except ValueError as e:
+                    logger.error("Skipping OPC server {url}: cannot decrypt its password: {e}", url=server.url, e=e)
+                    continue
+
+            targets.append(
+                CollectorTarget(
+                    id=server.id,
+                    url=server.url,
+                    security_policy=server.security_policy,
+                    authentication_method=server.authentication_method,
+                    username=server.username,
+                    password=password,
+                    sensors={sensor.node_id: sensor.id for sensor in server.sensors},
+                )
+            )
+        return targets
+
+
+class ServerCollector:
+    """
+    Keeps one subscription open to a single OPC server, reconnecting with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        target: CollectorTarget,
+        session_factory: OpcSessionFactory,
+        buffer: IngestBuffer,
+        config: CollectorConfig = settings.collector,
+    ) -> None:
+        self.target = target
+        self._session_factory = session_factory
+        self._buffer = buffer
+        self._config = config
+
+    def _on_data_change(self, node_id: str, time: datetime, value: float) -> None:
+        sensor_id = self.target.sensors.get(node_id)
+        if sensor_id is not None:
+            self._buffer.offer(((time, sensor_id, value),))
+
+    async def run(self) -> None:
+        delay = self._config.RECONNECT_MIN_SECONDS
+        while True:
+            session = self._session_factory(self.target)
+            try:
+                async with asyncio.timeout(self._config.REQUEST_TIMEOUT_SECONDS):
+                    await session.connect()
+                    await session.subscribe(list(self.target.sensors), self._on_data_change)
+                logger.info("Collecting {count} nodes from {url}", count=len(self.target.sensors), url=self.target.url)
+                delay = self._config.RECONNECT_MIN_SECONDS
+
+                while True:
+                    await asyncio.sleep(self._config.HEALTH_CHECK_INTERVAL_SECONDS)
+                    await session.check_connection()
+            except Exception as e:
+                logger.warning("Connection to {url} lost: {e!r}", url=self.target.url, e=e)
+            finally:
+                await session.disconnect()
+
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            delay = min(delay * 2, self._config.RECONNECT_MAX_SECONDS)
+
+
+class CollectorService:
+    """
+    Runs one ServerCollector task per active OPC server and keeps the set in sync with the database.
+
+    With ``shards`` the servers are partitioned between all running collector nodes and this node only collects its
+    share, rebalanced every ``HEARTBEAT_INTERVAL_SECONDS``; targets are still reloaded every
+    ``REFRESH_INTERVAL_SECONDS``.
+    """
+
+    def __init__(
+        self,
+        session_factory: OpcSessionFactory = AsyncuaSession,
+        buffer: IngestBuffer = ingest_buffer,
+        targets_loader: TargetsLoader = load_collector_targets,
+        config: CollectorConfig = settings.collector,
+        engine: AlertEngine = alert_engine,
+        shards: CollectorShards | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._targets_loader = targets_loader
+        self._config = config
+        self._buffer = buffer
+        self._engine = engine
+        self._shards = shards
+        self._tasks: dict[UUID, tuple[CollectorTarget, asyncio.Task]] = {}
+
+    async def run(self) -> None:
+        await self._engine.start()
+        await self._buffer.start()
+        targets: Sequence[CollectorTarget] = ()
+        loaded_at = -math.inf
+        interval = self._config.REFRESH_INTERVAL_SECONDS
+        if self._shards is not None:
+            interval = min(interval, self._config.HEARTBEAT_INTERVAL_SECONDS)
+        try:
+            while True:
+                if time.monotonic() - loaded_at >= self._config.REFRESH_INTERVAL_SECONDS:
+                    try:
+                        targets = await self._targets_loader()
+                        loaded_at = time.monotonic()
+                    except Exception as e:
+                        logger.exception("Failed to refresh collector targets: {e}", e=e)
+                try:
+                    await self._assign(targets)
+                except Exception as e:
+                    logger.exception("Failed to assign collector targets: {e}", e=e)
+                await asyncio.sleep(interval)
+        finally:
+            await self.stop()
+            if self._shards is not None:
+                await self._shards.leave()
+            await self._buffer.stop()
+            await self._engine.stop()
+
+    async def sync(self, targets: Sequence[CollectorTarget]) -> None:
+        """Start, restart or stop server collectors so that they match ``targets``."""
+
+        wanted = {target.id: target for target in targets}
+        for server_id, (target, _) in list(self._tasks.items()):
+            if wanted.get(server_id) != target:
+                await self._stop_server(server_id)
+
+        for server_id, target in wanted.items():
+            if server_id not in self._tasks:
+                collector = ServerCollector(target, self._session_factory, self._buffer, self._config)
+                self._tasks[server_id] = (target, asyncio.create_task(collector.run(), name=f"collector-{server_id}"))
+
+    async def _assign(self, targets: Sequence[CollectorTarget]) -> None:
+        if self._shards is None:
+            await self.sync(targets)
+            return
+
+        shards = self._shards
+        await shards.verify()
+        try:
+            owned = await shards.owned(targets)
+        except Exception as e:
+            # Without a renewed lease the ring is unknown; servers still locked by this node are safe to keep.
+            logger.warning("Failed to renew collector lease: {e!r}", e=e)
+            owned = [target for target in targets if target.id in shards.held]
+
+        owned_ids = {target.id for target in owned}
+        try:
+            # Stop what moved away before its lock is released, then lock what moved here.
+            await self.sync([target for target in owned if target.id in shards.held])
+            await shards.release(shards.held - owned_ids)
+            await shards.acquire(owned_ids)
+        finally:
+            await self.sync([target for target in owned if target.id in shards.held])
+
+    async def stop(self) -> None:
+        for server_id in list(self._tasks):
+            await self._stop_server(server_id)
+
+    async def _stop_server(self, server_id: UUID) -> None:
+        _, task = self._tasks.pop(server_id)
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
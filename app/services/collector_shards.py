@@ -0,0 +1,127 @@
+import socket
+from collections.abc import Iterable, Sequence
+from contextlib import suppress
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+import asyncpg
+from loguru import logger
+
+from app.core import settings
+from app.core.config.collector import CollectorConfig
+from app.schemas.collector import CollectorTarget
+from app.uow.sql import SQLUnitOfWork
+from app.utils.hash_ring import HashRing
+
+__all__ = ["CollectorShards"]
+
+
+def _lock_key(server_id: UUID) -> int:
+    # 64 bits of the server id keep advisory lock keys of thousands of servers from colliding.
+    return int.from_bytes(server_id.bytes[:8], "big", signed=True)
+
+
+class CollectorShards:
+    """
+    Partitions OPC servers between collector nodes.
+
+    Each node renews a lease in ``collector_nodes`` every heartbeat; the nodes with a current lease form a consistent
+    hash ring that assigns each server to one of them, so servers rebalance on their own when nodes join or leave,
+    moving only the share of the node that changed.
+
+    The ring decides who should collect a server; a session advisory lock per server, held on a dedicated connection,
+    decides who may. A node collects a server only while it holds the server's lock and stops the collector before
+    releasing it, so a server is never collected twice, even while nodes briefly disagree about the ring. The new
+    owner takes the lock on its next heartbeat after the old one let go. If a node dies, its locks are released with
+    its connection and its servers move once its lease expires.
+    """
+
+    def __init__(
+        self,
+        dsn: str = settings.db.dsn,
+        config: CollectorConfig = settings.collector,
+        node_id: UUID | None = None,
+    ) -> None:
+        self.node_id = node_id or uuid4()
+        self._dsn = dsn
+        self._config = config
+        self._hostname = socket.gethostname()
+        self._connection: asyncpg.Connection | None = None
+        self._held: set[UUID] = set()
+
+    @property
+    def held(self) -> frozenset[UUID]:
+        return frozenset(self._held)
+
+    async def owned(self, targets: Sequence[CollectorTarget]) -> list[CollectorTarget]:
+        """Renew this node's lease and return the targets the ring of live nodes assigns to it."""
+
+        async with SQLUnitOfWork() as uow:
+            await uow.collector_nodes.heartbeat(self.node_id, self._hostname)
+            nodes = await uow.collector_nodes.get_live(timedelta(seconds=self._config.LEASE_TTL_SECONDS))
+
+        ring = HashRing(str(node) for node in nodes)
+        node = str(self.node_id)
+        return [target for target in targets if ring.get(str(target.id)) == node]
+
+    async def verify(self) -> None:
+        """Forget every lock if the lock session was lost, since Postgres has released them with it."""
+
+        if self._connection is None:
+            return
+        try:
+            await self._connection.execute("SELECT 1")
+        except Exception as e:
+            logger.warning("Collector lock connection lost: {e!r}", e=e)
+            await self._close()
+
+    async def acquire(self, server_ids: Iterable[UUID]) -> None:
+        """Take the locks of ``server_ids`` that no other node holds."""
+
+        keys = {_lock_key(server_id): server_id for server_id in server_ids if server_id not in self._held}
+        if not keys:
+            return
+        if self._connection is None:
+            self._connection = await asyncpg.connect(self._dsn)
+
+        try:
+            acquired = await self._connection.fetch(
+                "SELECT key FROM unnest($1::bigint[]) AS key WHERE pg_try_advisory_lock(key)", list(keys)
+            )
+        except Exception:
+            await self._close()
+            raise
+        self._held.update(keys[row["key"]] for row in acquired)
+
+    async def release(self, server_ids: Iterable[UUID]) -> None:
+        """Release the locks of ``server_ids``; their collectors must already be stopped."""
+
+        released = [server_id for server_id in server_ids if server_id in self._held]
+        if not released:
+            return
+        try:
+            await self._connection.execute(
+                "SELECT pg_advisory_unlock(key) FROM unnest($1::bigint[]) AS key",
+                [_lock_key(server_id) for server_id in released],
+            )
+        except Exception:
+            await self._close()
+            raise
+        self._held.difference_update(released)
+
+    async def leave(self) -> None:
+        """Give up every lock and the lease, so the remaining nodes take over right away."""
+
+        await self._close()
+        try:
+            async with SQLUnitOfWork() as uow:
+                await uow.collector_nodes.delete_many({"id": self.node_id})
+        except Exception as e:
+            logger.warning("Failed to remove the lease of collector node {id}: {e!r}", id=self.node_id, e=e)
+
+    async def _close(self) -> None:
+        self._held.clear()
+        if self._connection is not None and not self._connection.is_closed():
+            with suppress(Exception):
+                await self._connection.close(timeout=1)
+        self._connection = None
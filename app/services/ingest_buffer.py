@@ -0,0 +1,217 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import suppress
+
+from loguru import logger
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app.core import settings
+from app.core.config.ingest import IngestConfig
+from app.core.constants import ALERTS_CHANNEL, READINGS_CHANNEL
+from app.core.exc import BadRequestException, ServiceUnavailableException
+from app.repositories import ReadingRecord
+from app.schemas.alert import AlertRead
+from app.services.alert_engine import alert_engine
+from app.services.latest_values import latest_values
+from app.uow.sql import SQLUnitOfWork
+from app.utils.metrics import INGEST_REJECTED_READINGS
+from app.utils.notifications import encode_alerts, encode_readings
+
+__all__ = ["IngestBuffer", "ingest_buffer"]
+
+ReadingSink = Callable[[list[ReadingRecord]], Awaitable[None]]
+
+
+async def _write_readings(records: list[ReadingRecord]) -> None:
+    async with SQLUnitOfWork() as uow:
+        # Readings of unknown sensors can never be written; filter them before they fail the whole batch.
+        known = await uow.sensors.get_existing_ids(record[1] for record in records)
+        if len(known) < len({record[1] for record in records}):
+            accepted = [record for record in records if record[1] in known]
+            rejected = len(records) - len(accepted)
+            logger.warning("Dropping {count} readings of unknown sensors", count=rejected)
+            INGEST_REJECTED_READINGS.labels("unknown_sensor").inc(rejected)
+            records = accepted
+            if not records:
+                return
+
+        rule_states = await uow.alert_rule_states.lock(alert_engine.rule_ids(records))
+        evaluation = alert_engine.evaluate(records, rule_states)
+        await uow.readings.copy_many(records)
+        latest = await uow.sensor_latest.upsert_many(records)
+        alerts = await uow.alerts.insert_many(evaluation.alerts)
+        await uow.alert_rule_states.save(evaluation.states)
+        await uow.sensor_latest.notify(READINGS_CHANNEL, encode_readings(latest))
+        await uow.alerts.notify(ALERTS_CHANNEL, encode_alerts(AlertRead.model_validate(alert) for alert in alerts))
+    latest_values.update(latest)
+
+
+class IngestBuffer:
+    """
+    Write-behind buffer that coalesces readings from many producers into large COPY batches.
+
+    A batch is flushed once ``BATCH_SIZE`` records are waiting or the oldest waiting record is ``MAX_AGE_SECONDS``
+    old. Buffered and in-flight records never exceed ``MAX_PENDING``: ``put`` waits for room and eventually fails
+    with ``ServiceUnavailableException``, ``offer`` refuses immediately. Failed batches are retried with backoff and
+    keep occupying capacity, so a lagging database pushes back on producers instead of growing memory, until
+    ``RETRY_MAX_ATTEMPTS`` is exhausted and the batch is dropped. A batch the database rejects as invalid is split
+    until the offending readings are isolated; only those are dropped. Dropped readings are counted in ``rejected``.
+    """
+
+    def __init__(self, sink: ReadingSink = _write_readings, config: IngestConfig = settings.ingest) -> None:
+        self._sink = sink
+        self._config = config
+        self._records: list[ReadingRecord] = []
+        self._pending = 0
+        self._oldest_at = 0.0
+        self._has_records = asyncio.Event()
+        self._full = asyncio.Event()
+        self._space = asyncio.Condition()
+        self._closed = True
+        self._task: asyncio.Task | None = None
+        self.dropped = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._closed = False
+        if not self._records:
+            self._has_records.clear()
+            self._full.clear()
+        self._task = asyncio.create_task(self._run(), name="ingest-buffer")
+
+    async def stop(self) -> None:
+        """Stop accepting records and flush everything already buffered."""
+
+        if self._task is None:
+            return
+        self._closed = True
+        self._has_records.set()
+        self._full.set()
+        async with self._space:
+            self._space.notify_all()
+
+        try:
+            async with asyncio.timeout(self._config.DRAIN_TIMEOUT_SECONDS):
+                await asyncio.shield(self._task)
+        except TimeoutError:
+            logger.error("Ingest buffer drain timed out, {count} readings lost", count=self._pending)
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        finally:
+            self._task = None
+
+    async def put(self, records: Sequence[ReadingRecord], timeout: float | None = None) -> None:
+        """Buffer ``records``, waiting up to ``timeout`` seconds for room."""
+
+        count = len(records)
+        if count > self._config.MAX_PENDING:
+            raise BadRequestException(alias={"max_items": self._config.MAX_PENDING})
+
+        try:
+            async with asyncio.timeout(timeout if timeout is not None else self._config.PUT_TIMEOUT_SECONDS):
+                async with self._space:
+                    await self._space.wait_for(lambda: self._closed or self._has_room(count))
+        except TimeoutError:
+            raise ServiceUnavailableException()
+        if self._closed:
+            raise ServiceUnavailableException()
+
+        self._append(records)
+
+    def offer(self, records: Sequence[ReadingRecord]) -> bool:
+        """Buffer ``records`` only if there is room right now, for producers that cannot wait."""
+
+        if self._closed or not self._has_room(len(records)):
+            self.dropped += len(records)
+            return False
+
+        self._append(records)
+        return True
+
+    def _has_room(self, count: int) -> bool:
+        return self._pending + count <= self._config.MAX_PENDING
+
+    def _append(self, records: Sequence[ReadingRecord]) -> None:
+        if not self._records:
+            self._oldest_at = asyncio.get_running_loop().time()
+            self._has_records.set()
+
+        self._records.extend(records)
+        self._pending += len(records)
+        if len(self._records) >= self._config.BATCH_SIZE:
+            self._full.set()
+
+    async def _run(self) -> None:
+        while not (self._closed and not self._records):
+            await self._wait_for_batch()
+            if self._records:
+                await self._flush_batch()
+
+    async def _wait_for_batch(self) -> None:
+        await self._has_records.wait()
+        if self._closed:
+            return
+
+        remaining = self._oldest_at + self._config.MAX_AGE_SECONDS - asyncio.get_running_loop().time()
+        if remaining > 0:
+            with suppress(TimeoutError):
+                async with asyncio.timeout(remaining):
+                    await self._full.wait()
+
+    async def _flush_batch(self) -> None:
+        batch_size = self._config.BATCH_SIZE
+        batch, self._records = self._records[:batch_size], self._records[batch_size:]
+
+        if self._records:
+            self._oldest_at = asyncio.get_running_loop().time()
+            if len(self._records) < batch_size and not self._closed:
+                self._full.clear()
+        elif not self._closed:
+            self._has_records.clear()
+            self._full.clear()
+
+        await self._write(batch)
+
+        self._pending -= len(batch)
+        async with self._space:
+            self._space.notify_all()
+
+    async def _write(self, batch: list[ReadingRecord]) -> None:
+        delay = self._config.RETRY_MIN_SECONDS
+        for attempt in range(1, self._config.RETRY_MAX_ATTEMPTS + 1):
+            try:
+                await self._sink(batch)
+                return
+            except (IntegrityError, DataError) as e:
+                # Retrying cannot help; bisect so the offending readings do not hold back the rest.
+                if len(batch) == 1:
+                    logger.error("Dropping reading {record} rejected by the database: {e}", record=batch[0], e=e)
+                    self._reject(batch, "invalid")
+                    return
+                middle = len(batch) // 2
+                await self._write(batch[:middle])
+                await self._write(batch[middle:])
+                return
+            except Exception as e:
+                if attempt == self._config.RETRY_MAX_ATTEMPTS:
+                    logger.exception("Failed to flush {count} readings, dropping: {e}", count=len(batch), e=e)
+                    break
+                logger.exception("Failed to flush {count} readings, retrying: {e}", count=len(batch), e=e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._config.RETRY_MAX_SECONDS)
+
+        self._reject(batch, "retries_exhausted")
+
+    def _reject(self, batch: list[ReadingRecord], reason: str) -> None:
+        self.rejected += len(batch)
+        INGEST_REJECTED_READINGS.labels(reason).inc(len(batch))
+
+
+ingest_buffer = IngestBuffer()
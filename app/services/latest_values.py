@@ -0,0 +1,124 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from contextlib import suppress
+from datetime import datetime
+from typing import NamedTuple
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import Row
+
+from app.core import settings
+from app.core.config.latest_values import LatestValuesConfig
+from app.repositories import ReadingRecord
+from app.uow.sql import SQLUnitOfWork
+
+__all__ = ["LatestValue", "LatestValueStore", "latest_values"]
+
+SnapshotLoader = Callable[[], Awaitable[Sequence[Row]]]
+
+
+class LatestValue(NamedTuple):
+    time: datetime
+    value: float
+
+
+async def _load_snapshot() -> Sequence[Row]:
+    async with SQLUnitOfWork() as uow:
+        return await uow.sensor_latest.get_snapshot()
+
+
+class LatestValueStore:
+    """
+    In-process map of the most recent reading of every sensor, with sensor lists per OPC server and organization.
+
+    Readings flushed by this process, or announced by other processes over NOTIFY, are applied through ``update``.
+    The ``sensor_latest`` table is loaded on start, for a cold cache, and re-read every ``REFRESH_INTERVAL_SECONDS``
+    to pick up changes to the set of sensors and anything a missed notification carried. Lookups are plain dictionary
+    reads and never reach the database.
+    """
+
+    def __init__(self, loader: SnapshotLoader = _load_snapshot, config: LatestValuesConfig = settings.latest_values):
+        self._loader = loader
+        self._config = config
+        self._values: dict[UUID, LatestValue] = {}
+        self._by_server: dict[UUID, tuple[UUID, ...]] = {}
+        self._by_organization: dict[UUID, tuple[UUID, ...]] = {}
+        self._organizations: dict[UUID, UUID] = {}
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.exception("Failed to load latest sensor values: {e}", e=e)
+        self._task = asyncio.create_task(self._run(), name="latest-values")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def refresh(self) -> None:
+        self.load(await self._loader())
+
+    def load(self, rows: Iterable[Row]) -> None:
+        """Replace the sensor lists and merge the values of ``get_snapshot`` rows."""
+
+        by_server: defaultdict[UUID, list[UUID]] = defaultdict(list)
+        by_organization: defaultdict[UUID, list[UUID]] = defaultdict(list)
+        organizations: dict[UUID, UUID] = {}
+        values: list[ReadingRecord] = []
+        for row in rows:
+            organizations[row.sensor_id] = row.organization_id
+            by_server[row.opc_server_id].append(row.sensor_id)
+            by_organization[row.organization_id].append(row.sensor_id)
+            if row.time is not None:
+                values.append((row.time, row.sensor_id, row.value))
+
+        self._by_server = {key: tuple(sensor_ids) for key, sensor_ids in by_server.items()}
+        self._by_organization = {key: tuple(sensor_ids) for key, sensor_ids in by_organization.items()}
+        self._organizations = organizations
+        self.update(values)
+
+    def update(self, records: Iterable[ReadingRecord]) -> None:
+        """Apply readings, keeping whichever value is newer per sensor."""
+
+        values = self._values
+        for time, sensor_id, value in records:
+            current = values.get(sensor_id)
+            if current is None or time >= current.time:
+                values[sensor_id] = LatestValue(time, value)
+
+    def get(self, sensor_id: UUID) -> LatestValue | None:
+        return self._values.get(sensor_id)
+
+    def organization_of(self, sensor_id: UUID) -> UUID | None:
+        return self._organizations.get(sensor_id)
+
+    def get_many(self, sensor_ids: Iterable[UUID]) -> dict[UUID, LatestValue]:
+        values = self._values
+        return {sensor_id: values[sensor_id] for sensor_id in sensor_ids if sensor_id in values}
+
+    def get_by_server(self, opc_server_id: UUID) -> dict[UUID, LatestValue]:
+        return self.get_many(self._by_server.get(opc_server_id, ()))
+
+    def get_by_organization(self, organization_id: UUID) -> dict[UUID, LatestValue]:
+        return self.get_many(self._by_organization.get(organization_id, ()))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._config.REFRESH_INTERVAL_SECONDS)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.exception("Failed to refresh latest sensor values: {e}", e=e)
+
+
+latest_values = LatestValueStore()
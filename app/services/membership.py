@@ -0,0 +1,114 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from types import MappingProxyType
+from uuid import UUID
+
+from loguru import logger
+
+from app.core import settings
+from app.core.config.membership import MembershipConfig
+from app.core.constants import MEMBERSHIPS_CHANNEL
+from app.enums import UserRoleInOrgEnum
+from app.infra.database import NotificationListener, notification_listener
+from app.uow.sql import SQLUnitOfWork
+
+__all__ = ["MembershipCache", "membership_cache"]
+
+Roles = Mapping[UUID, UserRoleInOrgEnum]
+RolesLoader = Callable[[UUID], Awaitable[dict[UUID, UserRoleInOrgEnum]]]
+
+
+async def _load_roles(user_id: UUID) -> dict[UUID, UserRoleInOrgEnum]:
+    async with SQLUnitOfWork() as uow:
+        return await uow.memberships.get_roles(user_id)
+
+
+class MembershipCache:
+    """
+    TTL-bounded LRU of user -> {organization: role} used by authorization checks.
+
+    A miss costs one query per user per ``CACHE_TTL_SECONDS``; concurrent misses for the same user share it.
+    Entries are dropped explicitly through ``invalidate``, and in every worker when a trigger on
+    ``user_organization_association`` announces a change over NOTIFY. Everything is dropped after the listener
+    reconnects, since changes made in the meantime were not announced.
+    """
+
+    def __init__(
+        self,
+        loader: RolesLoader = _load_roles,
+        listener: NotificationListener = notification_listener,
+        config: MembershipConfig = settings.membership,
+    ) -> None:
+        self._loader = loader
+        self._listener = listener
+        self._config = config
+        self._entries: OrderedDict[UUID, tuple[float, Roles]] = OrderedDict()
+        self._loading: dict[UUID, asyncio.Future[Roles]] = {}
+        self._generation = 0
+
+    async def start(self) -> None:
+        """Register for invalidations; must run before the notification listener starts."""
+
+        self._listener.subscribe(MEMBERSHIPS_CHANNEL, self._on_notification)
+        self._listener.on_connect(self._on_connect)
+
+    async def get_roles(self, user_id: UUID) -> Roles:
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(user_id)
+            return entry[1]
+
+        loading = self._loading.get(user_id)
+        if loading is not None:
+            return await asyncio.shield(loading)
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[user_id] = future
+        generation = self._generation
+        try:
+            roles = MappingProxyType(await self._loader(user_id))
+        except BaseException as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark it retrieved so an unobserved failure is not logged as never retrieved.
+            future.exception()
+            raise
+        finally:
+            del self._loading[user_id]
+
+        future.set_result(roles)
+        # A result loaded while an invalidation came in may already be stale; serve it once but do not keep it.
+        if generation == self._generation:
+            self._store(user_id, roles)
+        return roles
+
+    async def get_role(self, user_id: UUID, organization_id: UUID) -> UserRoleInOrgEnum | None:
+        return (await self.get_roles(user_id)).get(organization_id)
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._generation += 1
+        self._entries.pop(user_id, None)
+
+    def invalidate_all(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def _store(self, user_id: UUID, roles: Roles) -> None:
+        self._entries[user_id] = (time.monotonic() + self._config.CACHE_TTL_SECONDS, roles)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self._config.CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+    def _on_notification(self, payload: str) -> None:
+        try:
+            self.invalidate(UUID(payload))
+        except ValueError:
+            logger.warning("Malformed membership notification {payload!r}, dropping all cached roles", payload=payload)
+            self.invalidate_all()
+
+    async def _on_connect(self) -> None:
+        self.invalidate_all()
+
+
+membership_cache = MembershipCache()
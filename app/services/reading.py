@@ -0,0 +1,301 @@
+import math
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import numpy as np
+import orjson
+import pyarrow as pa
+
+from app.core.constants import (
+    READINGS_AGGREGATE_VIEWS,
+    READINGS_GAPFILL_STEPS_SECONDS,
+    READINGS_MAX_POINTS_LIMIT,
+    READINGS_RAW_INTERVAL_SECONDS,
+)
+from app.core.exc import BadRequestException
+from app.enums import ReadingResolutionEnum
+from app.schemas.base import CursorPage
+from app.schemas.reading import (
+    ReadingGapfillSeries,
+    ReadingPoint,
+    ReadingRead,
+    ReadingSeries,
+    ReadingsIngest,
+    ReadingsDownsampleQuery,
+    ReadingsExportQuery,
+    ReadingsGapfill,
+    ReadingsGapfillQuery,
+    ReadingsIngestResult,
+    ReadingsMatrixQuery,
+    ReadingsPageQuery,
+    ReadingsSeries,
+    ReadingsSeriesQuery,
+)
+from app.services.ingest_buffer import ingest_buffer
+from app.uow.base import ABCUnitOfWork
+from app.utils.columnar import ColumnarStreamWriter
+from app.utils.downsampling import create_downsampler
+
+__all__ = ["ReadingService"]
+
+_RESOLUTION_SECONDS = {
+    ReadingResolutionEnum.RAW: READINGS_RAW_INTERVAL_SECONDS,
+    **{ReadingResolutionEnum(resolution): seconds for resolution, (_, seconds) in READINGS_AGGREGATE_VIEWS.items()},
+}
+
+# time_bucket origin for intervals without months: Monday 2000-01-03 UTC.
+_BUCKET_ORIGIN_TIMESTAMP = 946857600
+
+_EXPORT_SCHEMA = pa.schema(
+    [
+        ("time", pa.timestamp("us", tz="UTC")),
+        ("sensor_id", pa.dictionary(pa.int32(), pa.string())),
+        ("value", pa.float64()),
+    ]
+)
+
+
+def _validate_range(start: datetime, end: datetime) -> None:
+    if end <= start:
+        raise BadRequestException(alias={"start": start, "end": end})
+
+
+def _aggregate_resolution(start: datetime, step: int) -> ReadingResolutionEnum:
+    """Coarsest continuous aggregate whose buckets tile every ``step`` bucket counted from ``start`` exactly."""
+
+    resolution = ReadingResolutionEnum.RAW
+    for name, (_, seconds) in READINGS_AGGREGATE_VIEWS.items():
+        if step % seconds == 0 and start.timestamp() % seconds == 0:
+            resolution = ReadingResolutionEnum(name)
+    return resolution
+
+
+class ReadingService:
+    @staticmethod
+    async def ingest(data: ReadingsIngest) -> ReadingsIngestResult:
+        records = [(item.time, item.sensor_id, item.value) for item in data.items]
+        await ingest_buffer.put(records)
+
+        return ReadingsIngestResult(accepted=len(records))
+
+    @staticmethod
+    def pick_resolution(start: datetime, end: datetime, max_points: int) -> ReadingResolutionEnum:
+        """
+        Pick the finest resolution whose bucket count over ``[start, end)`` fits into ``max_points``.
+
+        Falls back to the coarsest aggregate when even that exceeds the budget.
+        """
+
+        span = (end - start).total_seconds()
+        for resolution, seconds in _RESOLUTION_SECONDS.items():
+            if span / seconds <= max_points:
+                return resolution
+        return ReadingResolutionEnum.DAY
+
+    @staticmethod
+    async def get_series(uow: ABCUnitOfWork, query: ReadingsSeriesQuery) -> ReadingsSeries:
+        """
+        Readings of several sensors over ``[start, end)`` at ``resolution``, or the finest one within ``max_points``.
+
+        An explicit resolution is held to the same budget: it is refused when its bucket count over the range exceeds
+        ``max_points``, raw readings counting one per ``READINGS_RAW_INTERVAL_SECONDS``.
+        """
+
+        _validate_range(query.start, query.end)
+        resolution = query.resolution
+        if resolution is None:
+            resolution = ReadingService.pick_resolution(query.start, query.end, query.max_points)
+        elif (query.end - query.start).total_seconds() / _RESOLUTION_SECONDS[resolution] > query.max_points:
+            raise BadRequestException(alias={"resolution": resolution, "max_points": query.max_points})
+
+        start = query.start
+        if resolution != ReadingResolutionEnum.RAW:
+            # Align to a bucket boundary so the partially covered first bucket is included.
+            start -= timedelta(seconds=start.timestamp() % _RESOLUTION_SECONDS[resolution])
+
+        rows = await uow.readings.get_series(query.sensor_ids, start, query.end, resolution)
+
+        points: dict[UUID, list[ReadingPoint]] = {sensor_id: [] for sensor_id in query.sensor_ids}
+        for row in rows:
+            points[row.sensor_id].append(
+                ReadingPoint(time=row.time, avg=row.avg, min=row.min, max=row.max, count=row.count)
+            )
+
+        return ReadingsSeries(
+            resolution=resolution,
+            series=[ReadingSeries(sensor_id=sensor_id, points=items) for sensor_id, items in points.items()],
+        )
+
+    @staticmethod
+    def pick_step(start: datetime, end: datetime, points: int) -> int:
+        """
+        Pick the smallest aligned bucket width, in seconds, that covers ``[start, end)`` in at most ``points`` buckets.
+
+        Ranges too long for the widest step get a whole number of weeks.
+        """
+
+        width = (end - start).total_seconds() / points
+        for step in READINGS_GAPFILL_STEPS_SECONDS:
+            if step >= width:
+                return step
+        widest = READINGS_GAPFILL_STEPS_SECONDS[-1]
+        return math.ceil(width / widest) * widest
+
+    @staticmethod
+    async def get_gapfilled(uow: ABCUnitOfWork, query: ReadingsGapfillQuery) -> ReadingsGapfill:
+        _validate_range(query.start, query.end)
+        step = ReadingService.pick_step(query.start, query.end, query.points)
+
+        # Snap to the bucket grid so the first bucket is complete and the axis is stable between requests.
+        start = query.start - timedelta(seconds=(query.start.timestamp() - _BUCKET_ORIGIN_TIMESTAMP) % step)
+        points = math.ceil((query.end - start).total_seconds() / step)
+        resolution = _aggregate_resolution(start, step)
+
+        rows = await uow.readings.get_gapfilled(query.sensor_ids, start, query.end, step, query.fill, resolution)
+
+        values: dict[UUID, list[float | None]] = {sensor_id: [None] * points for sensor_id in query.sensor_ids}
+        origin = start.timestamp()
+        for row in rows:
+            values[row.sensor_id][round((row.time.timestamp() - origin) / step)] = row.value
+
+        return ReadingsGapfill(
+            start=start,
+            step_seconds=step,
+            points=points,
+            fill=query.fill,
+            series=[ReadingGapfillSeries(sensor_id=sensor_id, values=items) for sensor_id, items in values.items()],
+        )
+
+    @staticmethod
+    async def get_matrix(uow: ABCUnitOfWork, query: ReadingsMatrixQuery) -> bytes:
+        """
+        Average readings of many sensors into ``step_seconds`` buckets from ``start`` and encode them as one matrix.
+
+        Without ``format`` the body is JSON shaped as ``ReadingsMatrix``; Arrow and Parquet bodies hold a ``time``
+        column plus one nullable column per sensor, named by its id.
+        """
+
+        _validate_range(query.start, query.end)
+        selectors = query.model_dump(include={"sensor_ids", "opc_server_id"}, exclude_none=True)
+        if len(selectors) != 1:
+            raise BadRequestException(alias={"selectors": ["sensor_ids", "opc_server_id"]})
+
+        points = math.ceil((query.end - query.start).total_seconds() / query.step_seconds)
+        if points > READINGS_MAX_POINTS_LIMIT:
+            raise BadRequestException(alias={"step_seconds": query.step_seconds})
+
+        if query.opc_server_id is not None:
+            sensors = await uow.sensors.get_multi_without_pagination(
+                order_by="name", columns=["id"], opc_server_id=query.opc_server_id, is_deleted=False
+            )
+            sensor_ids = [sensor.id for sensor in sensors]
+        else:
+            sensor_ids = list(dict.fromkeys(query.sensor_ids))
+
+        rows = await uow.readings.get_matrix(
+            sensor_ids,
+            query.start,
+            query.end,
+            query.step_seconds,
+            _aggregate_resolution(query.start, query.step_seconds),
+        )
+
+        positions = {sensor_id: position for position, sensor_id in enumerate(sensor_ids)}
+        matrix = np.full((len(sensor_ids), points), np.nan)
+        for row in rows:
+            matrix[positions[row.sensor_id], row.indexes] = np.array(row.values, dtype=np.float64)
+
+        start_ms = round(query.start.timestamp() * 1000)
+        timestamps = start_ms + np.arange(points, dtype=np.int64) * (query.step_seconds * 1000)
+
+        if query.format is None:
+            return orjson.dumps(
+                {
+                    "start": query.start,
+                    "step_seconds": query.step_seconds,
+                    "timestamps": timestamps,
+                    "series": [
+                        {"sensor_id": sensor_id, "values": values} for sensor_id, values in zip(sensor_ids, matrix)
+                    ],
+                },
+                option=orjson.OPT_SERIALIZE_NUMPY,
+            )
+
+        schema = pa.schema(
+            [("time", pa.timestamp("ms", tz="UTC")), *((str(sensor_id), pa.float64()) for sensor_id in sensor_ids)]
+        )
+        batch = pa.record_batch(
+            [
+                pa.array(timestamps, type=pa.int64()).cast(schema.field("time").type),
+                *(pa.array(values, from_pandas=True) for values in matrix),
+            ],
+            schema=schema,
+        )
+        writer = ColumnarStreamWriter(schema, query.format)
+        return writer.write_batch(batch) + writer.close()
+
+    @staticmethod
+    async def get_downsampled(uow: ABCUnitOfWork, query: ReadingsDownsampleQuery) -> bytes:
+        """
+        Reduce the raw readings of every sensor to at most ``max_points`` points and encode them as JSON shaped as
+        ``ReadingsDownsampled``.
+
+        Readings are streamed in chunks and fed to one downsampler per sensor as they arrive, so memory is bounded
+        by the chunk size and the buckets still open, not by the number of readings in the range.
+        """
+
+        _validate_range(query.start, query.end)
+        sensor_ids = list(dict.fromkeys(query.sensor_ids))
+        start, end = query.start.timestamp(), query.end.timestamp()
+        downsamplers = [create_downsampler(query.method, start, end, query.max_points) for _ in sensor_ids]
+
+        async for positions, epochs, values in uow.readings.stream_points(sensor_ids, query.start, query.end):
+            positions = np.asarray(positions, dtype=np.int64)
+            epochs = np.asarray(epochs, dtype=np.float64)
+            values = np.asarray(values, dtype=np.float64)
+            boundaries = np.flatnonzero(np.diff(positions)) + 1
+            for first, last in zip([0, *boundaries], [*boundaries, len(positions)]):
+                downsamplers[positions[first] - 1].feed(epochs[first:last], values[first:last])
+
+        series = []
+        for sensor_id, downsampler in zip(sensor_ids, downsamplers):
+            epochs, values = downsampler.finish()
+            timestamps = np.rint(epochs * 1000).astype(np.int64)
+            series.append({"sensor_id": sensor_id, "timestamps": timestamps, "values": values})
+
+        return orjson.dumps({"method": query.method, "series": series}, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    @staticmethod
+    async def get_page(uow: ABCUnitOfWork, query: ReadingsPageQuery) -> CursorPage[ReadingRead]:
+        filters = {"sensor_id": query.sensor_id, "time__ge": query.start, "time__lt": query.end}
+        readings, next_cursor, total = await uow.readings.get_multi_by_cursor(
+            limit=query.limit,
+            order_by="-time",
+            cursor=query.cursor,
+            count_mode=query.count_mode,
+            **{key: value for key, value in filters.items() if value is not None},
+        )
+
+        return CursorPage[ReadingRead](
+            items=[ReadingRead.model_validate(reading) for reading in readings], next_cursor=next_cursor, total=total
+        )
+
+    @staticmethod
+    def export(uow: ABCUnitOfWork, query: ReadingsExportQuery) -> AsyncIterator[bytes]:
+        """
+        Validate the export request and return a generator of encoded chunks.
+
+        The generator owns the unit of work, so the session outlives the request handler while the response streams.
+        """
+
+        _validate_range(query.start, query.end)
+        return ReadingService._export_chunks(uow, query)
+
+    @staticmethod
+    async def _export_chunks(uow: ABCUnitOfWork, query: ReadingsExportQuery) -> AsyncIterator[bytes]:
+        writer = ColumnarStreamWriter(_EXPORT_SCHEMA, query.format)
+        async with uow:
+            async for columns in uow.readings.stream_range(query.sensor_ids, query.start, query.end):
+                yield writer.write(columns)
+        yield writer.close()
@@ -0,0 +1,254 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from typing import Protocol
+
+import asyncpg
+from loguru import logger
+
+from app.core import settings
+from app.utils.metrics import SCHEDULER_JOB_DURATION, SCHEDULER_JOB_RUNS
+
+__all__ = ["Trigger", "IntervalTrigger", "CronTrigger", "Scheduler", "scheduler"]
+
+JobFunction = Callable[[], Awaitable[None]]
+
+# (low, high) of the minute, hour, day of month, month and day of week fields; 7 is another name for Sunday.
+_CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+_CRON_MAX_YEARS = 5
+
+
+class Trigger(Protocol):
+    def next_after(self, now: datetime) -> datetime: ...
+
+
+class IntervalTrigger:
+    """Fires every ``seconds``, counted from the end of the previous wait."""
+
+    def __init__(self, seconds: float) -> None:
+        if seconds <= 0:
+            raise ValueError(f"Interval must be positive, got {seconds}")
+        self._interval = timedelta(seconds=seconds)
+
+    def next_after(self, now: datetime) -> datetime:
+        return now + self._interval
+
+
+class CronTrigger:
+    """
+    Fires on the minutes matched by a five field cron expression, evaluated in UTC.
+
+    Fields support ``*``, values, ``a-b`` ranges, ``,`` lists and ``/step``. As in cron, when both the day of month
+    and the day of week are restricted a day matching either of them fires.
+    """
+
+    def __init__(self, expression: str) -> None:
+        fields = expression.split()
+        if len(fields) != len(_CRON_FIELDS):
+            raise ValueError(f"Cron expression must have {len(_CRON_FIELDS)} fields: {expression!r}")
+
+        minutes, hours, days, months, weekdays = (
+            self._parse_field(field, low, high) for field, (low, high) in zip(fields, _CRON_FIELDS)
+        )
+        self._expression = expression
+        self._minutes, self._hours, self._days, self._months = minutes, hours, days, months
+        self._weekdays = frozenset(weekday % 7 for weekday in weekdays)
+        self._any_day, self._any_weekday = fields[2].startswith("*"), fields[4].startswith("*")
+
+    def next_after(self, now: datetime) -> datetime:
+        moment = now.astimezone(timezone.utc).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment.year + _CRON_MAX_YEARS
+        # Skip whole months, days and hours that cannot match before stepping through minutes.
+        while moment.year <= limit:
+            if moment.month not in self._months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._matches_day(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self._hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self._minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment
+        raise ValueError(f"Cron expression {self._expression!r} does not fire within {_CRON_MAX_YEARS} years")
+
+    def _matches_day(self, moment: datetime) -> bool:
+        day = moment.day in self._days
+        # Python counts weekdays from Monday, cron from Sunday.
+        weekday = (moment.weekday() + 1) % 7 in self._weekdays
+        if self._any_day or self._any_weekday:
+            return day and weekday
+        return day or weekday
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> frozenset[int]:
+        values: set[int] = set()
+        for part in field.split(","):
+            base, _, step = part.partition("/")
+            try:
+                if base == "*":
+                    start, stop = low, high
+                elif "-" in base:
+                    start, stop = (int(bound) for bound in base.split("-", 1))
+                else:
+                    start = int(base)
+                    stop = high if step else start
+                increment = int(step) if step else 1
+            except ValueError:
+                raise ValueError(f"Invalid cron field {field!r}") from None
+            if not low <= start <= stop <= high or increment < 1:
+                raise ValueError(f"Cron field {field!r} is outside {low}-{high}")
+            values.update(range(start, stop + 1, increment))
+        return frozenset(values)
+
+
+class _Job:
+    def __init__(
+        self,
+        name: str,
+        function: JobFunction,
+        trigger: Trigger,
+        jitter_seconds: float,
+        timeout_seconds: float | None,
+        singleton: bool,
+    ) -> None:
+        self.name = name
+        self.function = function
+        self.trigger = trigger
+        self.jitter_seconds = jitter_seconds
+        self.timeout_seconds = timeout_seconds
+        self.singleton = singleton
+
+
+class Scheduler:
+    """
+    Runs registered jobs on their triggers from the application lifespan, one task per job.
+
+    Every run waits a random extra ``jitter_seconds`` so processes do not stampede the database, is cancelled after
+    ``timeout_seconds`` and is counted in the scheduler metrics; a failing run is logged and the job keeps its
+    schedule.
+
+    Singleton jobs run in one process across all workers and nodes. A process leads such a job while it holds a
+    session advisory lock for it on a dedicated connection, taken with ``pg_try_advisory_lock`` when the job is due
+    and kept afterwards, so the other processes skip the job for as long as the leader lives. When the leader's
+    connection is lost, Postgres releases the lock and the next process whose run comes due takes over. Processes
+    that lead nothing keep no connection open between attempts.
+    """
+
+    def __init__(self, dsn: str = settings.db.dsn) -> None:
+        self._dsn = dsn
+        self._jobs: dict[str, _Job] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._connection: asyncpg.Connection | None = None
+        self._connection_lock = asyncio.Lock()
+        self._leading: set[str] = set()
+
+    def add_job(
+        self,
+        name: str,
+        function: JobFunction,
+        trigger: Trigger,
+        *,
+        jitter_seconds: float = 0.0,
+        timeout_seconds: float | None = None,
+        singleton: bool = True,
+    ) -> None:
+        """
+        Register a job; jobs added after ``start`` run from the next start on.
+
+        Raises:
+            ValueError: If a job with the same name is already registered
+        """
+
+        if name in self._jobs:
+            raise ValueError(f"Job {name!r} is already scheduled")
+        self._jobs[name] = _Job(name, function, trigger, jitter_seconds, timeout_seconds, singleton)
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._run(job), name=f"job-{job.name}") for job in self._jobs.values()]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        self._leading.clear()
+        await self._close_connection()
+
+    async def _run(self, job: _Job) -> None:
+        while True:
+            now = datetime.now(timezone.utc)
+            delay = (job.trigger.next_after(now) - now).total_seconds() + random.uniform(0, job.jitter_seconds)
+            await asyncio.sleep(delay)
+
+            if job.singleton and not await self._lead(job.name):
+                SCHEDULER_JOB_RUNS.labels(job.name, "skipped").inc()
+                continue
+            await self._execute(job)
+
+    async def _execute(self, job: _Job) -> None:
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(job.timeout_seconds):
+                await job.function()
+        except TimeoutError:
+            outcome = "timeout"
+            logger.error("Job {name} timed out after {timeout}s", name=job.name, timeout=job.timeout_seconds)
+        except Exception as e:
+            outcome = "failure"
+            logger.exception("Job {name} failed: {e}", name=job.name, e=e)
+        else:
+            outcome = "success"
+
+        duration = time.perf_counter() - started
+        SCHEDULER_JOB_DURATION.labels(job.name).observe(duration)
+        SCHEDULER_JOB_RUNS.labels(job.name, outcome).inc()
+        logger.debug(
+            "Job {name} finished with {outcome} in {duration:.3f}s", name=job.name, outcome=outcome, duration=duration
+        )
+
+    async def _lead(self, name: str) -> bool:
+        """Whether this process leads job ``name``, taking the lead if no other process holds it."""
+
+        async with self._connection_lock:
+            try:
+                if self._connection is None or self._connection.is_closed():
+                    self._leading.clear()
+                    self._connection = await asyncpg.connect(self._dsn)
+                if name in self._leading:
+                    # A round trip proves the session, and with it every lock it holds, is still alive.
+                    await self._connection.execute("SELECT 1")
+                    return True
+                acquired = await self._connection.fetchval(
+                    "SELECT pg_try_advisory_lock(hashtext($1))", f"scheduler:{name}"
+                )
+            except Exception as e:
+                logger.warning("Scheduler lock connection failed: {e!r}", e=e)
+                await self._close_connection()
+                return False
+
+            if acquired:
+                self._leading.add(name)
+                logger.info("Leading scheduled job {name}", name=name)
+            elif not self._leading:
+                await self._close_connection()
+            return acquired
+
+    async def _close_connection(self) -> None:
+        if self._leading:
+            logger.warning("Gave up leading scheduled jobs {names}", names=sorted(self._leading))
+            self._leading.clear()
+        if self._connection is not None and not self._connection.is_closed():
+            with suppress(Exception):
+                await self._connection.close(timeout=1)
+        self._connection = None
+
+
+scheduler = Scheduler()
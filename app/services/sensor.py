@@ -0,0 +1,31 @@
+from app.core.exc import BadRequestException
+from app.schemas.sensor import SensorLatestQuery, SensorLatestRead
+from app.services.latest_values import latest_values
+
+__all__ = ["SensorService"]
+
+
+class SensorService:
+    @staticmethod
+    def get_latest(query: SensorLatestQuery) -> list[SensorLatestRead]:
+        """
+        Latest value of every sensor of one OPC server, one organization or an explicit list of sensors.
+
+        Served from the in-process latest value store; sensors without any reading are omitted.
+        """
+
+        selectors = query.model_dump(exclude_none=True)
+        if len(selectors) != 1:
+            raise BadRequestException(alias={"selectors": list(SensorLatestQuery.model_fields)})
+
+        if query.opc_server_id is not None:
+            values = latest_values.get_by_server(query.opc_server_id)
+        elif query.organization_id is not None:
+            values = latest_values.get_by_organization(query.organization_id)
+        else:
+            values = latest_values.get_many(query.sensor_ids)
+
+        return [
+            SensorLatestRead(sensor_id=sensor_id, time=latest.time, value=latest.value)
+            for sensor_id, latest in values.items()
+        ]
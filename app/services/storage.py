@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+
+from loguru import logger
+from sqlalchemy import Row
+
+from app.core import settings
+from app.core.exc import ObjectNotFoundException
+from app.schemas.storage import ChunkRead, ChunksDrop, ChunksDropResult, RetentionResult, StoragePolicies
+from app.uow.base import ABCUnitOfWork
+
+__all__ = ["StorageService"]
+
+
+class StorageService:
+    """
+    Compression, retention and chunk maintenance of the readings hypertable.
+    """
+
+    @staticmethod
+    async def sync_policies(uow: ABCUnitOfWork) -> StoragePolicies:
+        """Make the hypertable compression and retention policies match the storage settings."""
+
+        policies = StoragePolicies(
+            compress_after_days=settings.storage.COMPRESS_AFTER_DAYS, retention_days=settings.storage.RETENTION_DAYS
+        )
+        await uow.readings.set_policies(policies.compress_after_days, policies.retention_days)
+        return policies
+
+    @staticmethod
+    async def get_chunks(uow: ABCUnitOfWork) -> list[ChunkRead]:
+        return [ChunkRead.model_validate(chunk) for chunk in await uow.readings.get_chunks()]
+
+    @staticmethod
+    async def compress_chunk(uow: ABCUnitOfWork, chunk_name: str, recompress: bool = False) -> ChunkRead:
+        chunk = await StorageService._get_chunk(uow, chunk_name)
+        await uow.readings.compress_chunk(f"{chunk.chunk_schema}.{chunk.chunk_name}", recompress=recompress)
+        return ChunkRead.model_validate(await StorageService._get_chunk(uow, chunk_name))
+
+    @staticmethod
+    async def decompress_chunk(uow: ABCUnitOfWork, chunk_name: str) -> ChunkRead:
+        chunk = await StorageService._get_chunk(uow, chunk_name)
+        await uow.readings.decompress_chunk(f"{chunk.chunk_schema}.{chunk.chunk_name}")
+        return ChunkRead.model_validate(await StorageService._get_chunk(uow, chunk_name))
+
+    @staticmethod
+    async def drop_chunks(uow: ABCUnitOfWork, data: ChunksDrop) -> ChunksDropResult:
+        return ChunksDropResult(dropped=await uow.readings.drop_chunks(data.older_than))
+
+    @staticmethod
+    async def apply_organization_retention(uow: ABCUnitOfWork) -> RetentionResult:
+        """
+        Delete readings past the retention of organizations that keep them for less than the global policy.
+
+        Chunk-level retention can only apply to the whole hypertable, so per organization retention is row based. Rows
+        are deleted one chunk's time range at a time and committed after each, so no transaction holds more than one
+        chunk's worth of deleted rows and locks, and an interrupted run keeps what it already deleted.
+        """
+
+        now = datetime.now(timezone.utc)
+        retentions = [
+            (organization.id, now - timedelta(days=organization.readings_retention_days))
+            for organization in await uow.organizations.get_with_readings_retention()
+        ]
+        chunks = await uow.readings.get_chunks() if retentions else ()
+
+        deleted = 0
+        for organization_id, older_than in retentions:
+            count = 0
+            for chunk in chunks:
+                if chunk.range_start >= older_than:
+                    break
+                count += await uow.readings.delete_for_organization(
+                    organization_id, min(chunk.range_end, older_than), chunk.range_start
+                )
+                await uow.commit()
+            logger.info("Deleted {count} readings of organization {id}", count=count, id=organization_id)
+            deleted += count
+        return RetentionResult(deleted=deleted)
+
+    @staticmethod
+    async def _get_chunk(uow: ABCUnitOfWork, chunk_name: str) -> Row:
+        chunks = await uow.readings.get_chunks(chunk_name)
+        if not chunks:
+            raise ObjectNotFoundException(chunk_name, "Chunk")
+        return chunks[0]
@@ -0,0 +1,261 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+from uuid import UUID
+
+from fastapi import WebSocket, WebSocketDisconnect, status
+from loguru import logger
+
+from app.core import settings
+from app.core.config.stream import StreamConfig
+from app.core.constants import ALERTS_CHANNEL, READINGS_CHANNEL
+from app.core.exc import BadRequestException, ForbiddenException
+from app.infra.database import NotificationListener, notification_listener
+from app.repositories import ReadingRecord
+from app.schemas.alert import AlertRead
+from app.schemas.auth import Principal
+from app.schemas.sensor import SensorLatestRead
+from app.schemas.stream import StreamEvent, StreamQuery
+from app.services.access import AccessService
+from app.services.latest_values import LatestValue, LatestValueStore, latest_values
+from app.utils.notifications import decode_alerts, decode_readings
+
+__all__ = ["StreamSubscriber", "StreamHub", "StreamService", "stream_hub"]
+
+
+class StreamSubscriber:
+    """
+    Pending updates of one client connection.
+
+    Readings are coalesced per sensor, so a client only ever receives the newest value of a sensor per event no
+    matter how often it changed in between. Alerts are queued in full up to ``MAX_PENDING_ALERTS``.
+    """
+
+    def __init__(self, sensor_ids: frozenset[UUID], organization_id: UUID | None, config: StreamConfig) -> None:
+        self.sensor_ids = sensor_ids
+        self.organization_id = organization_id
+        self.evicted = False
+        self._config = config
+        self._readings: dict[UUID, LatestValue] = {}
+        self._alerts: list[AlertRead] = []
+        self._pending_since: float | None = None
+        self._ready = asyncio.Event()
+
+    def push_reading(self, sensor_id: UUID, latest: LatestValue, now: float) -> bool:
+        self._readings[sensor_id] = latest
+        return self._mark_pending(now)
+
+    def push_alert(self, alert: AlertRead, now: float) -> bool:
+        self._alerts.append(alert)
+        return self._mark_pending(now) and len(self._alerts) <= self._config.MAX_PENDING_ALERTS
+
+    def evict(self) -> None:
+        self.evicted = True
+        self._ready.set()
+
+    async def events(self) -> AsyncIterator[StreamEvent]:
+        """Yield coalesced events, and empty heartbeat events when idle, until the subscriber is evicted."""
+
+        while not self.evicted:
+            try:
+                async with asyncio.timeout(self._config.HEARTBEAT_SECONDS):
+                    await self._ready.wait()
+            except TimeoutError:
+                yield StreamEvent()
+                continue
+
+            await asyncio.sleep(self._config.COALESCE_SECONDS)
+            if self.evicted:
+                break
+            yield self._drain()
+
+    def _mark_pending(self, now: float) -> bool:
+        """Record that updates are waiting and report whether the consumer still keeps up."""
+
+        if self._pending_since is None:
+            self._pending_since = now
+            self._ready.set()
+            return True
+        return now - self._pending_since <= self._config.SLOW_CONSUMER_SECONDS
+
+    def _drain(self) -> StreamEvent:
+        readings, self._readings = self._readings, {}
+        alerts, self._alerts = self._alerts, []
+        self._pending_since = None
+        self._ready.clear()
+        return StreamEvent(
+            readings=[
+                SensorLatestRead(sensor_id=sensor_id, time=latest.time, value=latest.value)
+                for sensor_id, latest in readings.items()
+            ],
+            alerts=alerts,
+        )
+
+
+class StreamHub:
+    """
+    Fans readings and alerts out to the subscribers of this worker.
+
+    Events arrive over the worker's single LISTEN connection, so every process writing readings or alerts reaches
+    every connected client without any per-client database work. Subscribers are indexed by sensor and organization;
+    one that has not taken its pending updates for ``SLOW_CONSUMER_SECONDS`` is evicted.
+    """
+
+    def __init__(
+        self,
+        listener: NotificationListener = notification_listener,
+        store: LatestValueStore = latest_values,
+        config: StreamConfig = settings.stream,
+    ) -> None:
+        self._listener = listener
+        self._store = store
+        self._config = config
+        self._by_sensor: defaultdict[UUID, set[StreamSubscriber]] = defaultdict(set)
+        self._by_organization: defaultdict[UUID, set[StreamSubscriber]] = defaultdict(set)
+
+    async def start(self) -> None:
+        """Register for readings and alerts; must run before the notification listener starts."""
+
+        self._listener.subscribe(READINGS_CHANNEL, self._on_readings)
+        self._listener.subscribe(ALERTS_CHANNEL, self._on_alerts)
+        self._listener.on_connect(self._store.refresh)
+
+    async def stop(self) -> None:
+        for subscribers in [*self._by_sensor.values(), *self._by_organization.values()]:
+            for subscriber in list(subscribers):
+                self.unsubscribe(subscriber)
+                subscriber.evict()
+
+    def subscribe(self, sensor_ids: Iterable[UUID], organization_id: UUID | None) -> StreamSubscriber:
+        subscriber = StreamSubscriber(frozenset(sensor_ids), organization_id, self._config)
+        for sensor_id in subscriber.sensor_ids:
+            self._by_sensor[sensor_id].add(subscriber)
+        if organization_id is not None:
+            self._by_organization[organization_id].add(subscriber)
+
+        # Start every client from the current state instead of waiting for the next change.
+        now = asyncio.get_running_loop().time()
+        initial = self._store.get_many(subscriber.sensor_ids)
+        if organization_id is not None:
+            initial.update(self._store.get_by_organization(organization_id))
+        for sensor_id, latest in initial.items():
+            subscriber.push_reading(sensor_id, latest, now)
+        return subscriber
+
+    def unsubscribe(self, subscriber: StreamSubscriber) -> None:
+        for sensor_id in subscriber.sensor_ids:
+            self._discard(self._by_sensor, sensor_id, subscriber)
+        if subscriber.organization_id is not None:
+            self._discard(self._by_organization, subscriber.organization_id, subscriber)
+
+    def publish_readings(self, records: Iterable[ReadingRecord]) -> None:
+        now = asyncio.get_running_loop().time()
+        lagging: set[StreamSubscriber] = set()
+        for time, sensor_id, value in records:
+            latest = LatestValue(time, value)
+            for subscriber in self._subscribers_of(sensor_id):
+                if not subscriber.push_reading(sensor_id, latest, now):
+                    lagging.add(subscriber)
+        self._evict(lagging)
+
+    def publish_alerts(self, alerts: Iterable[AlertRead]) -> None:
+        now = asyncio.get_running_loop().time()
+        lagging: set[StreamSubscriber] = set()
+        for alert in alerts:
+            for subscriber in self._subscribers_of(alert.sensor_id):
+                if not subscriber.push_alert(alert, now):
+                    lagging.add(subscriber)
+        self._evict(lagging)
+
+    def _on_readings(self, payload: str) -> None:
+        records = decode_readings(payload)
+        self._store.update(records)
+        self.publish_readings(records)
+
+    def _on_alerts(self, payload: str) -> None:
+        self.publish_alerts(decode_alerts(payload))
+
+    def _subscribers_of(self, sensor_id: UUID) -> set[StreamSubscriber]:
+        subscribers = self._by_sensor.get(sensor_id, set())
+        organization_id = self._store.organization_of(sensor_id)
+        if organization_id in self._by_organization:
+            subscribers = subscribers | self._by_organization[organization_id]
+        return subscribers
+
+    def _evict(self, subscribers: Iterable[StreamSubscriber]) -> None:
+        for subscriber in subscribers:
+            logger.warning("Evicting slow stream subscriber {id}", id=id(subscriber))
+            self.unsubscribe(subscriber)
+            subscriber.evict()
+
+    @staticmethod
+    def _discard(index: defaultdict[UUID, set[StreamSubscriber]], key: UUID, subscriber: StreamSubscriber) -> None:
+        subscribers = index.get(key)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del index[key]
+
+
+stream_hub = StreamHub()
+
+
+class StreamService:
+    @staticmethod
+    async def subscribe(query: StreamQuery, principal: Principal) -> StreamSubscriber:
+        """
+        Subscribe to the sensors and the organization of ``query`` once the principal is a member of their
+        organizations.
+
+        Membership is checked when the stream opens; a client that loses access is cut off only when it reconnects.
+        """
+
+        if not query.sensor_ids and query.organization_id is None:
+            raise BadRequestException(alias={"selectors": list(StreamQuery.model_fields)})
+        if query.organization_id is not None:
+            await AccessService.authorize_organizations(principal, (query.organization_id,))
+        if query.sensor_ids:
+            await AccessService.authorize_sensors(principal, query.sensor_ids)
+        return stream_hub.subscribe(query.sensor_ids or (), query.organization_id)
+
+    @staticmethod
+    async def serve_websocket(websocket: WebSocket, query: StreamQuery, principal: Principal) -> None:
+        try:
+            subscriber = await StreamService.subscribe(query, principal)
+        except (BadRequestException, ForbiddenException):
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+
+        await websocket.accept()
+        try:
+            async for event in subscriber.events():
+                async with asyncio.timeout(settings.stream.SEND_TIMEOUT_SECONDS):
+                    await websocket.send_text(event.model_dump_json())
+        except TimeoutError:
+            subscriber.evict()
+        except WebSocketDisconnect:
+            return
+        finally:
+            stream_hub.unsubscribe(subscriber)
+
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+
+    @staticmethod
+    async def server_sent_events(query: StreamQuery, principal: Principal) -> AsyncIterator[str]:
+        """
+        Validate and authorize the subscription and return a generator of SSE frames.
+
+        The subscription is made before the response starts, so invalid or forbidden queries still fail with a
+        regular error.
+        """
+
+        return StreamService._sse_frames(await StreamService.subscribe(query, principal))
+
+    @staticmethod
+    async def _sse_frames(subscriber: StreamSubscriber) -> AsyncIterator[str]:
+        try:
+            async for event in subscriber.events():
+                yield f"data: {event.model_dump_json()}\n\n"
+            yield "event: evicted\ndata: {}\n\n"
+        finally:
+            stream_hub.unsubscribe(subscriber)
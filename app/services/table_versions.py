@@ -0,0 +1,68 @@
+from collections.abc import Awaitable, Callable
+
+from loguru import logger
+
+from app.core.constants import TABLE_VERSIONS_CHANNEL
+from app.infra.database import NotificationListener, notification_listener
+from app.uow.sql import SQLUnitOfWork
+
+__all__ = ["TableVersions", "table_versions"]
+
+VersionsLoader = Callable[[], Awaitable[dict[str, int]]]
+
+
+async def _load_versions() -> dict[str, int]:
+    async with SQLUnitOfWork() as uow:
+        return await uow.table_versions.get_versions()
+
+
+class TableVersions:
+    """
+    Current change counter of every versioned table, identical in every worker.
+
+    The counters live in ``table_versions`` and are advanced by statement triggers, which also announce the new value
+    over NOTIFY. They are read in full on every listener (re)connect and then kept current from notifications, so
+    ``get`` never queries the database. Until the first load, and whenever the listener is disconnected and changes
+    could be missed, versions are unknown.
+    """
+
+    def __init__(self, loader: VersionsLoader = _load_versions, listener: NotificationListener = notification_listener):
+        self._loader = loader
+        self._listener = listener
+        self._versions: dict[str, int] | None = None
+
+    async def start(self) -> None:
+        """Register for changes; must run before the notification listener starts."""
+
+        self._listener.subscribe(TABLE_VERSIONS_CHANNEL, self._on_notification)
+        self._listener.on_connect(self.refresh)
+        self._listener.on_disconnect(self.invalidate)
+
+    def invalidate(self) -> None:
+        self._versions = None
+
+    async def refresh(self) -> None:
+        self.invalidate()
+        try:
+            self._versions = await self._loader()
+        except Exception as e:
+            logger.exception("Failed to load table versions: {e}", e=e)
+
+    def get(self, *tables: str) -> tuple[int, ...] | None:
+        """Versions of ``tables`` in the given order, or None when any of them is not known."""
+
+        versions = self._versions
+        if versions is None:
+            return None
+        try:
+            return tuple(versions[table] for table in tables)
+        except KeyError:
+            return None
+
+    def _on_notification(self, payload: str) -> None:
+        table, _, version = payload.rpartition(":")
+        if self._versions is not None:
+            self._versions[table] = max(self._versions.get(table, 0), int(version))
+
+
+table_versions = TableVersions()
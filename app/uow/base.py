@@ -1,7 +1,33 @@
 from abc import ABC, abstractmethod
 
+from app.repositories import (
+    AlertRepository,
+    AlertRuleRepository,
+    AlertRuleStateRepository,
+    CollectorNodeRepository,
+    OpcServerRepository,
+    OrganizationRepository,
+    ReadingRepository,
+    SensorLatestRepository,
+    SensorRepository,
+    TableVersionRepository,
+    UserOrganizationRepository,
+)
+
 
 class ABCUnitOfWork(ABC):
+    organizations: OrganizationRepository
+    opc_servers: OpcServerRepository
+    sensors: SensorRepository
+    readings: ReadingRepository
+    sensor_latest: SensorLatestRepository
+    alerts: AlertRepository
+    alert_rules: AlertRuleRepository
+    alert_rule_states: AlertRuleStateRepository
+    memberships: UserOrganizationRepository
+    table_versions: TableVersionRepository
+    collector_nodes: CollectorNodeRepository
+
     @abstractmethod
     def __init__(self) -> None:
         raise NotImplementedError
@@ -13,3 +39,7 @@ class ABCUnitOfWork(ABC):
     @abstractmethod
     async def __aexit__(self, *args: any) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def commit(self) -> None:
+        raise NotImplementedError
@@ -1,28 +1,87 @@
 from loguru import logger
 
-from app.infra.database import get_session_maker
+from app.infra.database import get_session_maker, replica_router
+from app.repositories import (
+    AlertRepository,
+    AlertRuleRepository,
+    AlertRuleStateRepository,
+    CollectorNodeRepository,
+    OpcServerRepository,
+    OrganizationRepository,
+    ReadingRepository,
+    SensorLatestRepository,
+    SensorRepository,
+    TableVersionRepository,
+    UserOrganizationRepository,
+)
 from app.uow.base import ABCUnitOfWork
+from app.utils.metrics import UOW_TRANSACTIONS
+
+
+__all__ = ["SQLUnitOfWork", "ReadOnlySQLUnitOfWork"]
 
 
 class SQLUnitOfWork(ABCUnitOfWork):
+    read_only = False
+
     def __init__(self) -> None:
         self.session_maker = get_session_maker()
 
     async def __aenter__(self) -> "SQLUnitOfWork":
         self.session = self.session_maker()
+
+        self.organizations = OrganizationRepository(self.session)
+        self.opc_servers = OpcServerRepository(self.session)
+        self.sensors = SensorRepository(self.session)
+        self.readings = ReadingRepository(self.session)
+        self.sensor_latest = SensorLatestRepository(self.session)
+        self.alerts = AlertRepository(self.session)
+        self.alert_rules = AlertRuleRepository(self.session)
+        self.alert_rule_states = AlertRuleStateRepository(self.session)
+        self.memberships = UserOrganizationRepository(self.session)
+        self.table_versions = TableVersionRepository(self.session)
+        self.collector_nodes = CollectorNodeRepository(self.session)
         return self
 
     async def __aexit__(self, exc_type: any, exc: any, tb: any) -> None:
         if exc:
             logger.exception("An exception occurred during transaction: {exc}", exc=exc)
             await self.session.rollback()
+            UOW_TRANSACTIONS.labels("rollback").inc()
         else:
             await self.session.commit()
+            UOW_TRANSACTIONS.labels("commit").inc()
+            if not self.read_only:
+                replica_router.mark_write()
         await self.session.close()
         await logger.complete()
 
         if exc:
             raise exc
 
+    async def commit(self) -> None:
+        """Commit the work so far and continue in a new transaction, for jobs that write in batches."""
+
+        await self.session.commit()
+        UOW_TRANSACTIONS.labels("commit").inc()
+        if not self.read_only:
+            replica_router.mark_write()
+
     async def rollback(self):
         await self.session.rollback()
+        UOW_TRANSACTIONS.labels("rollback").inc()
+
+
+class ReadOnlySQLUnitOfWork(SQLUnitOfWork):
+    """
+    Unit of work for queries that never write.
+
+    The session comes from a read replica that is caught up with this request's own writes, or from a read-only
+    transaction on the primary when there is none.
+    """
+
+    read_only = True
+
+    async def __aenter__(self) -> "ReadOnlySQLUnitOfWork":
+        self.session_maker = replica_router.session_maker()
+        return await super().__aenter__()
@@ -0,0 +1,69 @@
+import io
+from collections.abc import Sequence
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.enums import ReadingExportFormatEnum
+
+__all__ = ["ColumnarStreamWriter"]
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose content is handed out and released chunk by chunk."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ColumnarStreamWriter:
+    """
+    Encodes record batches as an Arrow IPC stream or a Parquet file, returning the encoded bytes per batch.
+
+    Parquet gets one row group per batch, so memory stays bounded by the batch size instead of the export size.
+    """
+
+    MEDIA_TYPES = {
+        ReadingExportFormatEnum.ARROW: "application/vnd.apache.arrow.stream",
+        ReadingExportFormatEnum.PARQUET: "application/vnd.apache.parquet",
+    }
+
+    def __init__(self, schema: pa.Schema, export_format: ReadingExportFormatEnum) -> None:
+        self._schema = schema
+        self._sink = _ChunkSink()
+        if export_format == ReadingExportFormatEnum.PARQUET:
+            self._writer = pq.ParquetWriter(self._sink, schema, compression="zstd")
+        else:
+            self._writer = pa.ipc.new_stream(self._sink, schema)
+
+    def write(self, columns: Sequence[Sequence]) -> bytes:
+        batch = pa.record_batch(
+            [pa.array(values, type=field.type) for values, field in zip(columns, self._schema)], schema=self._schema
+        )
+        return self.write_batch(batch)
+
+    def write_batch(self, batch: pa.RecordBatch) -> bytes:
+        self._writer.write_batch(batch)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
@@ -0,0 +1,56 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Column
+
+from app.core.exc import BadRequestException
+
+__all__ = ["encode_cursor", "decode_cursor"]
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID | Decimal):
+        return str(value)
+    return value
+
+
+def _from_json(value: Any, column: Column) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(order_by: str, values: Sequence[Any]) -> str:
+    """Encode the keyset position after a row as an opaque, URL-safe string."""
+
+    payload = json.dumps({"o": order_by, "v": [_to_json(value) for value in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str, columns: Sequence[Column]) -> list[Any]:
+    """Decode a cursor produced by ``encode_cursor`` for the same ``order_by`` and keyset ``columns``."""
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if payload["o"] != order_by or len(payload["v"]) != len(columns):
+            raise ValueError
+        return [_from_json(value, column) for value, column in zip(payload["v"], columns)]
+    except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, ValueError):
+        raise BadRequestException(alias={"cursor": cursor})
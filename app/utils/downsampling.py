@@ -0,0 +1,186 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from app.enums import ReadingDownsampleEnum
+
+__all__ = ["Downsampler", "LTTBDownsampler", "MinMaxDownsampler", "create_downsampler"]
+
+_EMPTY = np.empty(0, dtype=np.float64)
+
+
+class Downsampler(ABC):
+    """
+    Reduces one time-ordered series, fed in chunks, to at most ``max_points`` points over ``[start, end)``.
+
+    The range is split into equal-width time buckets, so bucket boundaries are known before any data arrives and
+    every chunk can be processed as soon as it is read. Only the buckets still open at the end of a chunk are kept.
+    Times are Unix epoch seconds.
+    """
+
+    def __init__(self, start: float, end: float, max_points: int) -> None:
+        self._start = start
+        self._buckets = self._bucket_count(max_points)
+        self._width = (end - start) / self._buckets
+        self._pending_times = _EMPTY
+        self._pending_values = _EMPTY
+        self._times: list[np.ndarray] = []
+        self._values: list[np.ndarray] = []
+
+    def feed(self, times: np.ndarray, values: np.ndarray) -> None:
+        times = np.concatenate((self._pending_times, times))
+        values = np.concatenate((self._pending_values, values))
+        if not len(times):
+            return
+
+        starts, ends = self._groups(times)
+        self._pending_times, self._pending_values = self._process(times, values, starts, ends, final=False)
+
+    def finish(self) -> tuple[np.ndarray, np.ndarray]:
+        """Flush the open buckets and return the selected ``(times, values)``."""
+
+        times, values = self._pending_times, self._pending_values
+        if len(times):
+            starts, ends = self._groups(times)
+            self._process(times, values, starts, ends, final=True)
+        self._pending_times = self._pending_values = _EMPTY
+
+        if not self._times:
+            return _EMPTY, _EMPTY
+        return np.concatenate(self._times), np.concatenate(self._values)
+
+    def _groups(self, times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        buckets = np.clip(((times - self._start) // self._width).astype(np.int64), 0, self._buckets - 1)
+        boundaries = np.flatnonzero(np.diff(buckets)) + 1
+        return np.concatenate(([0], boundaries)), np.concatenate((boundaries, [len(times)]))
+
+    def _emit(self, times: np.ndarray, values: np.ndarray) -> None:
+        if len(times):
+            self._times.append(times)
+            self._values.append(values)
+
+    @staticmethod
+    @abstractmethod
+    def _bucket_count(max_points: int) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _process(
+        self, times: np.ndarray, values: np.ndarray, starts: np.ndarray, ends: np.ndarray, final: bool
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Emit the points of every bucket that can be decided and return the samples to keep for the next chunk."""
+
+        raise NotImplementedError
+
+
+class LTTBDownsampler(Downsampler):
+    """
+    Largest-Triangle-Three-Buckets: keeps the first and the last point and, per bucket, the point forming the largest
+    triangle with the previously kept point and the average of the next bucket, which preserves peaks and troughs.
+
+    A bucket is decided once the bucket after it is complete, so up to two buckets stay buffered between chunks.
+    """
+
+    def __init__(self, start: float, end: float, max_points: int) -> None:
+        super().__init__(start, end, max_points)
+        self._previous: tuple[float, float] | None = None
+
+    @staticmethod
+    def _bucket_count(max_points: int) -> int:
+        return max(max_points - 2, 1)
+
+    def feed(self, times: np.ndarray, values: np.ndarray) -> None:
+        if self._previous is None and len(times):
+            self._previous = (times[0], values[0])
+            self._emit(times[:1], values[:1])
+            times, values = times[1:], values[1:]
+        super().feed(times, values)
+
+    def _process(
+        self, times: np.ndarray, values: np.ndarray, starts: np.ndarray, ends: np.ndarray, final: bool
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if final:
+            # The last point is always kept and stands in for the bucket after the last one.
+            last_time, last_value = times[-1], values[-1]
+            if len(times) > 1:
+                starts, ends = self._groups(times[:-1])
+                self._select(times, values, starts, ends, last_time, last_value)
+            self._emit(times[-1:], values[-1:])
+            return _EMPTY, _EMPTY
+
+        # The last bucket may still grow and the one before it needs its average, so both wait for more data.
+        decided = len(starts) - 2
+        if decided <= 0:
+            return times, values
+        self._select(times, values, starts[: decided + 1], ends[: decided + 1])
+        return times[starts[decided] :], values[starts[decided] :]
+
+    def _select(
+        self,
+        times: np.ndarray,
+        values: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        last_time: float | None = None,
+        last_value: float | None = None,
+    ) -> None:
+        """Pick one point in each bucket but the last of ``starts``, or in every bucket if a last point is given."""
+
+        counts = ends - starts
+        average_times = np.add.reduceat(times[: ends[-1]], starts) / counts
+        average_values = np.add.reduceat(values[: ends[-1]], starts) / counts
+        if last_time is not None:
+            average_times = np.append(average_times, last_time)
+            average_values = np.append(average_values, last_value)
+
+        selected = np.empty(len(average_times) - 1, dtype=np.int64)
+        previous_time, previous_value = self._previous
+        for bucket in range(len(selected)):
+            start, end = starts[bucket], ends[bucket]
+            bucket_times, bucket_values = times[start:end], values[start:end]
+            # Twice the triangle area; the constant factor does not change the argmax.
+            areas = np.abs(
+                (previous_time - average_times[bucket + 1]) * (bucket_values - previous_value)
+                - (previous_time - bucket_times) * (average_values[bucket + 1] - previous_value)
+            )
+            index = start + int(np.argmax(areas))
+            selected[bucket] = index
+            previous_time, previous_value = times[index], values[index]
+
+        self._previous = (previous_time, previous_value)
+        self._emit(times[selected], values[selected])
+
+
+class MinMaxDownsampler(Downsampler):
+    """
+    Keeps the minimum and the maximum of every bucket in time order, so each pixel column still spans the full range
+    of values it covers. Buckets are reduced in one vectorised pass per chunk; only the open bucket's two extremes are
+    carried over.
+    """
+
+    @staticmethod
+    def _bucket_count(max_points: int) -> int:
+        return max(max_points // 2, 1)
+
+    def _process(
+        self, times: np.ndarray, values: np.ndarray, starts: np.ndarray, ends: np.ndarray, final: bool
+    ) -> tuple[np.ndarray, np.ndarray]:
+        buckets = np.repeat(np.arange(len(starts)), ends - starts)
+        # Sorting by bucket, then value, puts each bucket's minimum first and its maximum last.
+        order = np.lexsort((values, buckets))
+        extremes = np.unique(np.concatenate((order[starts], order[ends - 1])))
+
+        if final:
+            self._emit(times[extremes], values[extremes])
+            return _EMPTY, _EMPTY
+
+        # The open bucket shrinks to its two extremes, which are all it can contribute.
+        closed = extremes < starts[-1]
+        self._emit(times[extremes[closed]], values[extremes[closed]])
+        return times[extremes[~closed]], values[extremes[~closed]]
+
+
+def create_downsampler(method: ReadingDownsampleEnum, start: float, end: float, max_points: int) -> Downsampler:
+    if method == ReadingDownsampleEnum.MINMAX:
+        return MinMaxDownsampler(start, end, max_points)
+    return LTTBDownsampler(start, end, max_points)
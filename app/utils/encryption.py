@@ -0,0 +1,39 @@
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+
+from app.core import settings
+
+__all__ = ["SecretCipher", "password_cipher"]
+
+
+class SecretCipher:
+    """
+    Fernet encryption of secrets kept in the database, such as OPC server passwords.
+
+    ``keys`` is a comma separated list of urlsafe base64 Fernet keys. The first one encrypts and all of them decrypt,
+    so a key is rotated by prepending the new one and dropping the old one once everything is re-encrypted.
+    """
+
+    def __init__(self, keys: str | None) -> None:
+        self._fernet = MultiFernet([Fernet(key.strip()) for key in keys.split(",")]) if keys else None
+
+    def encrypt(self, plaintext: str) -> str:
+        return self._require_fernet().encrypt(plaintext.encode()).decode()
+
+    def decrypt(self, token: str) -> str:
+        """
+        Raises:
+            ValueError: If no key is configured or ``token`` was not encrypted with any of the keys
+        """
+
+        try:
+            return self._require_fernet().decrypt(token.encode()).decode()
+        except InvalidToken:
+            raise ValueError("Secret was not encrypted with any configured key") from None
+
+    def _require_fernet(self) -> MultiFernet:
+        if self._fernet is None:
+            raise ValueError("No encryption key is configured")
+        return self._fernet
+
+
+password_cipher = SecretCipher(settings.collector.PASSWORD_ENCRYPTION_KEYS)
@@ -0,0 +1,34 @@
+import bisect
+import hashlib
+from collections.abc import Iterable
+
+from app.core.constants import COLLECTOR_HASH_RING_REPLICAS
+
+__all__ = ["HashRing"]
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent hash ring mapping keys to nodes.
+
+    Every node is placed at ``replicas`` points on the ring and a key belongs to the first node point at or after its
+    own hash. Adding or removing a node only moves the keys of the arcs it gains or loses, about ``1 / len(nodes)`` of
+    them, and every process building the ring from the same nodes agrees on each key's owner.
+    """
+
+    def __init__(self, nodes: Iterable[str], replicas: int = COLLECTOR_HASH_RING_REPLICAS) -> None:
+        points = sorted((_hash(f"{node}#{replica}"), node) for node in set(nodes) for replica in range(replicas))
+        self._hashes = [point for point, _ in points]
+        self._nodes = [node for _, node in points]
+
+    def get(self, key: str) -> str | None:
+        """Node owning ``key``, or None on an empty ring."""
+
+        if not self._nodes:
+            return None
+        index = bisect.bisect_left(self._hashes, _hash(key)) % len(self._hashes)
+        return self._nodes[index]
@@ -0,0 +1,147 @@
+import os
+from collections.abc import Callable, Iterator
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+from sqlalchemy.pool import QueuePool
+
+from app.repositories.statement_cache import StatementCache
+
+__all__ = [
+    "HTTP_REQUEST_DURATION",
+    "SQL_STATEMENT_DURATION",
+    "POOL_WAIT_DURATION",
+    "UOW_TRANSACTIONS",
+    "INGEST_REJECTED_READINGS",
+    "SCHEDULER_JOB_RUNS",
+    "SCHEDULER_JOB_DURATION",
+    "PoolCollector",
+    "StatementCacheCollector",
+    "register_scrape_collector",
+    "generate_metrics",
+    "mark_process_dead",
+]
+
+# Buckets span sub-millisecond cache hits up to slow exports; every observation is one bisect and two additions.
+_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+    buckets=_LATENCY_BUCKETS,
+)
+SQL_STATEMENT_DURATION = Histogram(
+    "sql_statement_duration_seconds",
+    "Time spent executing SQL statements, by statement kind.",
+    ("operation",),
+    buckets=_LATENCY_BUCKETS,
+)
+POOL_WAIT_DURATION = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection, including opening a new one.",
+    buckets=_LATENCY_BUCKETS,
+)
+UOW_TRANSACTIONS = Counter(
+    "uow_transactions_total",
+    "Unit-of-work transactions by outcome.",
+    ("outcome",),
+)
+INGEST_REJECTED_READINGS = Counter(
+    "ingest_rejected_readings_total",
+    "Buffered readings dropped instead of written, by reason.",
+    ("reason",),
+)
+SCHEDULER_JOB_RUNS = Counter(
+    "scheduler_job_runs_total",
+    "Scheduled job runs by outcome; skipped runs were due while another process led the job.",
+    ("job", "outcome"),
+)
+SCHEDULER_JOB_DURATION = Histogram(
+    "scheduler_job_duration_seconds",
+    "Duration of scheduled job runs.",
+    ("job",),
+    buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0),
+)
+
+
+class PoolCollector(Collector):
+    """Reads the connection pool's counters at scrape time, so checkouts carry no extra cost."""
+
+    def __init__(self, pool: Callable[[], QueuePool]) -> None:
+        self._pool = pool
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        pool = self._pool()
+        yield GaugeMetricFamily("db_pool_size", "Configured number of persistent connections.", value=pool.size())
+        yield GaugeMetricFamily("db_pool_checked_out", "Connections currently in use.", value=pool.checkedout())
+        yield GaugeMetricFamily("db_pool_checked_in", "Idle connections held by the pool.", value=pool.checkedin())
+        yield GaugeMetricFamily(
+            "db_pool_overflow",
+            "Connections opened beyond the pool size; negative while the pool is not yet full.",
+            value=pool.overflow(),
+        )
+
+
+class StatementCacheCollector(Collector):
+    def __init__(self, cache: StatementCache) -> None:
+        self._cache = cache
+
+    def collect(self) -> Iterator[CounterMetricFamily | GaugeMetricFamily]:
+        stats = self._cache.stats()
+        for name in ("hits", "misses", "evictions"):
+            yield CounterMetricFamily(
+                f"repository_statement_cache_{name}", f"Repository statement cache {name}.", value=stats[name]
+            )
+        yield GaugeMetricFamily("repository_statement_cache_size", "Cached repository statements.", value=stats["size"])
+
+
+# Collectors that read in-process state when scraped, such as the connection pool of the answering worker.
+_scrape_collectors: list[Collector] = []
+
+
+def _multiprocess_dir() -> str | None:
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+
+class _ProcessCollector(Collector):
+    """Scrape-time collectors of this process, with a ``pid`` label so the samples of each worker stay apart."""
+
+    def collect(self) -> Iterator[Metric]:
+        pid = str(os.getpid())
+        for collector in _scrape_collectors:
+            for family in collector.collect():
+                family.samples = [sample._replace(labels={**sample.labels, "pid": pid}) for sample in family.samples]
+                yield family
+
+
+def register_scrape_collector(collector: Collector) -> None:
+    _scrape_collectors.append(collector)
+    if _multiprocess_dir() is None:
+        REGISTRY.register(collector)
+
+
+def generate_metrics() -> bytes:
+    """
+    Render every metric in the text exposition format.
+
+    With ``PROMETHEUS_MULTIPROC_DIR`` set, counters and histograms are read from the files every worker writes there
+    and summed, so any worker answers for all of them. Scrape-time collectors can only describe the answering worker
+    and are labelled with its pid.
+    """
+
+    if _multiprocess_dir() is None:
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    registry.register(_ProcessCollector())
+    return generate_latest(registry)
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from multiprocess metrics when it exits."""
+
+    if _multiprocess_dir() is not None:
+        multiprocess.mark_process_dead(os.getpid())
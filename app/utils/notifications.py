@@ -0,0 +1,72 @@
+import itertools
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from uuid import UUID
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.core.constants import NOTIFY_PAYLOAD_MAX_BYTES, NOTIFY_READINGS_BATCH_SIZE
+from app.repositories import ReadingRecord
+from app.schemas.alert import AlertRead
+
+__all__ = ["encode_readings", "decode_readings", "encode_alerts", "decode_alerts"]
+
+_ALERTS_ADAPTER = TypeAdapter(list[AlertRead])
+_ALERT_ADAPTER = TypeAdapter(AlertRead)
+
+
+def encode_readings(records: Iterable[ReadingRecord]) -> Iterator[str]:
+    """Pack readings into NOTIFY payloads of at most ``NOTIFY_READINGS_BATCH_SIZE`` records each."""
+
+    for batch in itertools.batched(records, NOTIFY_READINGS_BATCH_SIZE):
+        yield orjson.dumps([(str(sensor_id), time, value) for time, sensor_id, value in batch]).decode()
+
+
+def decode_readings(payload: str) -> list[ReadingRecord]:
+    return [(datetime.fromisoformat(time), UUID(sensor_id), value) for sensor_id, time, value in orjson.loads(payload)]
+
+
+def encode_alerts(alerts: Iterable[AlertRead]) -> Iterator[str]:
+    """
+    Pack alerts into JSON array NOTIFY payloads of at most ``NOTIFY_PAYLOAD_MAX_BYTES`` bytes each.
+
+    An alert too large for a payload of its own is sent with its message cut short, so a notification can never fail
+    the transaction that publishes it.
+    """
+
+    batch: list[bytes] = []
+    size = 1
+    for alert in alerts:
+        encoded = _encode_alert(alert, NOTIFY_PAYLOAD_MAX_BYTES - 2)
+        # One byte for the comma or the closing bracket.
+        if batch and size + len(encoded) + 1 > NOTIFY_PAYLOAD_MAX_BYTES:
+            yield _join(batch)
+            batch, size = [], 1
+        batch.append(encoded)
+        size += len(encoded) + 1
+    if batch:
+        yield _join(batch)
+
+
+def _encode_alert(alert: AlertRead, limit: int) -> bytes:
+    encoded = _ALERT_ADAPTER.dump_json(alert)
+    excess = len(encoded) - limit
+    if excess <= 0:
+        return encoded
+
+    # Characters take one to six bytes once escaped, so drop them from the end until the excess is covered.
+    message = alert.message
+    end = len(message)
+    while excess > 0 and end:
+        end -= 1
+        excess -= len(orjson.dumps(message[end])) - 2
+    return _ALERT_ADAPTER.dump_json(alert.model_copy(update={"message": message[:end]}))
+
+
+def _join(encoded: list[bytes]) -> str:
+    return (b"[" + b",".join(encoded) + b"]").decode()
+
+
+def decode_alerts(payload: str) -> list[AlertRead]:
+    return _ALERTS_ADAPTER.validate_json(payload)
@@ -1,13 +1,85 @@
+import hashlib
+import heapq
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 
 from jose import JWTError, jwt
 
 from app.core import settings
+from app.core.config.auth import AuthConfig
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of verified token payloads keyed by a digest of the token.
+
+    Entries expire at the token's ``exp`` claim, or after ``max_ttl`` seconds for tokens without one or with a
+    later one, so a cached payload is never served past the point where verification itself would fail.
+    """
+
+    def __init__(self, maxsize: int, max_ttl: float) -> None:
+        self.maxsize = maxsize
+        self.max_ttl = max_ttl
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._expiries: list[tuple[float, bytes]] = []
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> dict | None:
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= now:
+            self.misses += 1
+            self._purge(now)
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: bytes, payload: dict) -> None:
+        now = time.time()
+        expires_at = now + self.max_ttl
+        if isinstance(payload.get("exp"), int | float):
+            expires_at = min(expires_at, payload["exp"])
+        if expires_at <= now:
+            return
+
+        self._purge(now)
+        self._entries[key] = (expires_at, payload)
+        self._entries.move_to_end(key)
+        heapq.heappush(self._expiries, (expires_at, key))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        if len(self._expiries) > 2 * self.maxsize:
+            self._expiries = [(expires_at, key) for key, (expires_at, _) in self._entries.items()]
+            heapq.heapify(self._expiries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._expiries.clear()
+
+    def _purge(self, now: float) -> None:
+        expiries = self._expiries
+        while expiries and expiries[0][0] <= now:
+            expires_at, key = heapq.heappop(expiries)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == expires_at:
+                del self._entries[key]
 
 
 class JWTTokenManager:
-    def __init__(self):
-        self._config = settings.auth
+    def __init__(self, config: AuthConfig = settings.auth):
+        self._config = config
+        # Read once: pydantic settings attribute access is measurable on the per-request decode path.
+        self._secret_key = config.SECRET_KEY
+        self._algorithms = [config.ALGORITHM]
+        self._cache = VerifiedTokenCache(config.TOKEN_CACHE_SIZE, config.TOKEN_CACHE_MAX_TTL_SECONDS)
 
     def create_access_token(self, data: dict) -> str:
         return self._create_token(data, self._config.ACCESS_TOKEN_EXPIRE_HOURS)
@@ -20,18 +92,30 @@ class JWTTokenManager:
 
     def _create_token(self, data: dict, expire_hours: int | None = None) -> str:
         to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + timedelta(hours=expire_hours)
         if expire_hours:
-            to_encode.update({"exp": expire})
-        return jwt.encode(to_encode, self._config.SECRET_KEY, algorithm=self._config.ALGORITHM)
+            to_encode.update({"exp": datetime.now(timezone.utc) + timedelta(hours=expire_hours)})
+        return jwt.encode(to_encode, self._secret_key, algorithm=self._config.ALGORITHM)
 
     def decode_token(self, token: str) -> dict | None:
+        """
+        Verify ``token`` and return its payload, or None if it is invalid or expired.
+
+        Verified payloads are cached until they expire, so repeated requests with the same token skip the
+        signature and claims checks. The returned dict is shared and must not be modified.
+        """
+
+        key = self._cache.digest(token)
+        payload = self._cache.get(key)
+        if payload is not None:
+            return payload
+
         try:
-            return jwt.decode(
-                token, self._config.SECRET_KEY, algorithms=[self._config.ALGORITHM], options={"require": ["sub"]}
-            )
+            payload = jwt.decode(token, self._secret_key, algorithms=self._algorithms, options={"require": ["sub"]})
         except JWTError:
             return None
 
+        self._cache.set(key, payload)
+        return payload
+
 
 jwt_token_manager = JWTTokenManager()
@@ -0,0 +1,75 @@
+"""
+Repository and ingest benchmarks against a local TimescaleDB.
+
+Usage::
+
+    docker compose up -d db
+    python -m benchmarks --readings 1000000 --output head.json
+    python -m benchmarks.compare base.json head.json
+
+The suite migrates and seeds its own database, ``--database``, on the configured server and never touches
+``POSTGRES_DB``. A dataset is reseeded only when its size changes.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the repository benchmarks.")
+    parser.add_argument("--database", default="control_system_benchmark", help="database created for the suite")
+    parser.add_argument("--readings", type=int, default=1_000_000, help="synthetic readings to seed")
+    parser.add_argument("--sensors", type=int, default=100, help="sensors the readings are spread over")
+    parser.add_argument("--interval", type=int, default=10, help="seconds between readings of one sensor")
+    parser.add_argument("--iterations", type=int, default=10, help="timed runs per scenario")
+    parser.add_argument("--warmup", type=int, default=2, help="untimed runs per scenario")
+    parser.add_argument("--only", action="append", default=[], help="run scenarios whose name starts with this")
+    parser.add_argument("--output", type=Path, help="write JSON results here instead of stdout")
+    return parser.parse_args()
+
+
+async def _main(args: argparse.Namespace) -> dict:
+    from app.infra.database.db import engine
+    from benchmarks.dataset import ensure_dataset
+    from benchmarks.runner import environment, run_scenarios
+    from benchmarks.scenarios import SCENARIOS
+
+    dataset = await ensure_dataset(args.readings, args.sensors, args.interval)
+    scenarios = [s for s in SCENARIOS if not args.only or any(s.name.startswith(prefix) for prefix in args.only)]
+    try:
+        return {
+            "environment": await environment(dataset),
+            "results": await run_scenarios(scenarios, dataset, args.iterations, args.warmup),
+        }
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    args = _parse_args()
+    # Settings are read on import, so the database has to be switched before anything from ``app`` is loaded.
+    os.environ["POSTGRES_DB"] = args.database
+    os.environ.setdefault("METRICS_ENABLED", "false")
+
+    from alembic import command
+    from alembic.config import Config
+
+    from benchmarks.dataset import ensure_database
+
+    asyncio.run(ensure_database(args.database))
+    command.upgrade(Config("alembic.ini"), "head")
+
+    report = json.dumps(asyncio.run(_main(args)), indent=2)
+    if args.output is None:
+        sys.stdout.write(report + "\n")
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Compare two result files of ``python -m benchmarks`` by median time.
+
+Exits with status 1 when any scenario is slower than the baseline by more than ``--threshold``.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def _load(path: Path) -> dict:
+    return json.loads(path.read_text())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed relative slowdown of the median")
+    args = parser.parse_args()
+
+    baseline, candidate = _load(args.baseline), _load(args.candidate)
+    if baseline["environment"]["dataset"] != candidate["environment"]["dataset"]:
+        sys.exit("Results were measured on different datasets and are not comparable")
+
+    baseline_medians = {result["name"]: result["seconds"]["median"] for result in baseline["results"]}
+    regressions = 0
+    print(f"{'scenario':<40} {'baseline':>12} {'candidate':>12} {'change':>9}")
+    for result in candidate["results"]:
+        name, median = result["name"], result["seconds"]["median"]
+        before = baseline_medians.get(name)
+        if before is None:
+            print(f"{name:<40} {'-':>12} {median:>12.6f} {'new':>9}")
+            continue
+
+        change = median / before - 1 if before else 0.0
+        regressed = change > args.threshold
+        regressions += regressed
+        print(f"{name:<40} {before:>12.6f} {median:>12.6f} {change:>+8.1%}{' !' if regressed else ''}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
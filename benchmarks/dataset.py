@@ -0,0 +1,142 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+
+import asyncpg
+from loguru import logger
+
+from app.core import settings
+from app.core.constants import READINGS_AGGREGATE_VIEWS
+from app.enums import AuthMethodEnum, SecurityPolicyEnum
+
+__all__ = ["Dataset", "ensure_database", "ensure_dataset"]
+
+# Fixed ids and start time make every seeded dataset of the same size identical, so runs are comparable.
+_NAMESPACE = uuid.UUID("6c6a3f9e-2f0b-4a8e-9a57-3d1f6d0b7c21")
+_START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+_SEED_BATCH_ROWS = 1_000_000
+
+
+class Dataset(NamedTuple):
+    readings: int
+    sensors: int
+    interval_seconds: int
+    sensor_ids: list[uuid.UUID]
+    start: datetime
+
+    @property
+    def readings_per_sensor(self) -> int:
+        return self.readings // self.sensors
+
+    @property
+    def end(self) -> datetime:
+        return self.start + timedelta(seconds=self.readings_per_sensor * self.interval_seconds)
+
+
+def _sensor_ids(sensors: int) -> list[uuid.UUID]:
+    return [uuid.uuid5(_NAMESPACE, f"sensor-{index}") for index in range(sensors)]
+
+
+async def ensure_database(database: str) -> None:
+    """Create the benchmark database next to the configured one if it does not exist yet."""
+
+    connection = await asyncpg.connect(
+        host=settings.db.HOST,
+        port=settings.db.PORT,
+        user=settings.db.USER,
+        password=settings.db.PASSWORD,
+        database="postgres",
+    )
+    try:
+        exists = await connection.fetchval("SELECT 1 FROM pg_database WHERE datname = $1", database)
+        if not exists:
+            logger.info("Creating benchmark database {database}", database=database)
+            await connection.execute(f'CREATE DATABASE "{database}"')
+    finally:
+        await connection.close()
+
+
+async def ensure_dataset(readings: int, sensors: int, interval_seconds: int) -> Dataset:
+    """
+    Seed ``readings`` synthetic readings spread evenly over ``sensors`` sensors, unless exactly that dataset exists.
+
+    Readings are generated inside Postgres, one batch of about a million rows per statement, so even 100M readings
+    never pass through the client. Continuous aggregates are refreshed and statistics collected before returning.
+    """
+
+    dataset = Dataset(readings, sensors, interval_seconds, _sensor_ids(sensors), _START)
+    connection = await asyncpg.connect(settings.db.dsn)
+    try:
+        await connection.execute(
+            "CREATE TABLE IF NOT EXISTS benchmark_dataset "
+            "(readings bigint NOT NULL, sensors int NOT NULL, interval_seconds int NOT NULL, seeded_at timestamptz)"
+        )
+        current = await connection.fetchrow("SELECT readings, sensors, interval_seconds FROM benchmark_dataset")
+        if current is not None and tuple(current) == (readings, sensors, interval_seconds):
+            logger.info("Reusing seeded dataset of {readings} readings", readings=readings)
+            return dataset
+
+        await _seed(connection, dataset)
+    finally:
+        await connection.close()
+    return dataset
+
+
+async def _seed(connection: asyncpg.Connection, dataset: Dataset) -> None:
+    logger.info("Seeding {readings} readings for {sensors} sensors", readings=dataset.readings, sensors=dataset.sensors)
+    async with connection.transaction():
+        await connection.execute("TRUNCATE benchmark_dataset, organizations CASCADE")
+        organization_id = uuid.uuid5(_NAMESPACE, "organization")
+        opc_server_id = uuid.uuid5(_NAMESPACE, "opc-server")
+        await connection.execute(
+            "INSERT INTO organizations (id, name, is_deleted, created_at) VALUES ($1, 'benchmark', false, now())",
+            organization_id,
+        )
+        await connection.execute(
+            "INSERT INTO opc_servers (id, organization_id, name, url, security_policy, authentication_method, "
+            "is_deleted, created_at) VALUES ($1, $2, 'benchmark', 'opc.tcp://benchmark:4840', $3, $4, false, now())",
+            opc_server_id,
+            organization_id,
+            SecurityPolicyEnum.NONE.name,
+            AuthMethodEnum.ANONYMOUS.name,
+        )
+        await connection.executemany(
+            "INSERT INTO sensors (id, opc_server_id, name, node_id, is_deleted, created_at) "
+            "VALUES ($1, $2, $3, $4, false, now())",
+            [
+                (sensor_id, opc_server_id, f"sensor-{index}", f"ns=2;i={index}")
+                for index, sensor_id in enumerate(dataset.sensor_ids)
+            ],
+        )
+
+    # One transaction per batch keeps WAL and lock usage bounded for the largest datasets.
+    steps_per_batch = max(_SEED_BATCH_ROWS // dataset.sensors, 1)
+    for first_step in range(0, dataset.readings_per_sensor, steps_per_batch):
+        last_step = min(first_step + steps_per_batch, dataset.readings_per_sensor)
+        await connection.execute(
+            "INSERT INTO readings (time, sensor_id, value) "
+            "SELECT $1::timestamptz + make_interval(secs => step * $3::int), sensor.id, "
+            "50 + 50 * sin(step / 360.0 + sensor.n) "
+            "FROM generate_series($4::int, $5::int - 1) AS step "
+            "CROSS JOIN unnest($2::uuid[]) WITH ORDINALITY AS sensor(id, n)",
+            dataset.start,
+            dataset.sensor_ids,
+            dataset.interval_seconds,
+            first_step,
+            last_step,
+        )
+        logger.info("Seeded {done}/{total} steps", done=last_step, total=dataset.readings_per_sensor)
+
+    await connection.execute(
+        "INSERT INTO sensor_latest (sensor_id, time, value) "
+        "SELECT DISTINCT ON (sensor_id) sensor_id, time, value FROM readings ORDER BY sensor_id, time DESC"
+    )
+    for name, _ in READINGS_AGGREGATE_VIEWS.values():
+        await connection.execute(f"CALL refresh_continuous_aggregate('{name}', NULL, NULL)")
+    await connection.execute("ANALYZE")
+    await connection.execute(
+        "INSERT INTO benchmark_dataset (readings, sensors, interval_seconds, seeded_at) VALUES ($1, $2, $3, now())",
+        dataset.readings,
+        dataset.sensors,
+        dataset.interval_seconds,
+    )
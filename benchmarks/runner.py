@@ -0,0 +1,102 @@
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import text
+
+from app.infra.database import get_session_maker
+from benchmarks.dataset import Dataset
+from benchmarks.scenarios import Scenario
+
+__all__ = ["run_scenarios", "environment"]
+
+
+def _git(*args: str) -> str | None:
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _summary(timings: list[float]) -> dict[str, float]:
+    ordered = sorted(timings)
+    return {
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "p95": ordered[min(round(0.95 * (len(ordered) - 1)), len(ordered) - 1)],
+        "max": ordered[-1],
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+async def environment(dataset: Dataset) -> dict[str, Any]:
+    """Everything needed to tell whether two result files are comparable."""
+
+    async with get_session_maker()() as session:
+        postgres = (await session.execute(text("SHOW server_version"))).scalar()
+        timescaledb = (
+            await session.execute(text("SELECT extversion FROM pg_extension WHERE extname = 'timescaledb'"))
+        ).scalar()
+
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "postgres": postgres,
+        "timescaledb": timescaledb,
+        "dataset": {
+            "readings": dataset.readings,
+            "sensors": dataset.sensors,
+            "interval_seconds": dataset.interval_seconds,
+        },
+    }
+
+
+async def run_scenarios(
+    scenarios: list[Scenario], dataset: Dataset, iterations: int, warmup: int
+) -> list[dict[str, Any]]:
+    """
+    Time every scenario ``iterations`` times after ``warmup`` untimed runs.
+
+    Only the repository call is timed; opening the session happens before and the rollback of write scenarios after.
+    """
+
+    session_maker = get_session_maker()
+    results = []
+    for scenario in scenarios:
+        timings: list[float] = []
+        rows = 0
+        for iteration in range(warmup + iterations):
+            async with session_maker() as session:
+                started = time.perf_counter()
+                affected = await scenario.run(session, dataset, iteration)
+                elapsed = time.perf_counter() - started
+                if scenario.writes:
+                    await session.rollback()
+                else:
+                    await session.commit()
+
+            if iteration >= warmup:
+                timings.append(elapsed)
+                rows += affected
+
+        summary = _summary(timings)
+        logger.info("{name}: median {median:.4f}s", name=scenario.name, median=summary["median"])
+        results.append(
+            {
+                "name": scenario.name,
+                "iterations": iterations,
+                "seconds": summary,
+                "rows_per_iteration": rows / iterations,
+                "rows_per_second": rows / sum(timings) if sum(timings) else None,
+            }
+        )
+    return results
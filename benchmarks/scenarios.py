@@ -0,0 +1,160 @@
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.enums import ReadingResolutionEnum
+from app.repositories import ReadingRecord, ReadingRepository, SensorLatestRepository
+from benchmarks.dataset import Dataset
+
+__all__ = ["Scenario", "SCENARIOS"]
+
+ScenarioRun = Callable[[AsyncSession, Dataset, int], Awaitable[int]]
+
+_PAGE_SIZE = 100
+_WRITE_ROWS = 1_000
+_COPY_ROWS = 50_000
+
+
+class Scenario(NamedTuple):
+    """
+    One measured operation.
+
+    ``run`` receives a fresh session, the dataset and the iteration number, and returns the number of rows it read
+    or wrote. Iterations rotate through sensors so repeated runs do not only measure a hot buffer cache. Write
+    scenarios are rolled back after every iteration and leave the dataset unchanged.
+    """
+
+    name: str
+    run: ScenarioRun
+    writes: bool = False
+
+
+def _new_records(dataset: Dataset, rows: int) -> list[ReadingRecord]:
+    """Readings after the end of the dataset, so they never conflict with seeded rows."""
+
+    sensors = dataset.sensor_ids
+    return [
+        (
+            dataset.end + timedelta(seconds=(index // len(sensors)) * dataset.interval_seconds),
+            sensors[index % len(sensors)],
+            float(index),
+        )
+        for index in range(rows)
+    ]
+
+
+def _existing_records(dataset: Dataset, iteration: int, rows: int) -> list[ReadingRecord]:
+    sensors = dataset.sensor_ids
+    first_step = (iteration * rows // len(sensors)) % max(dataset.readings_per_sensor - rows, 1)
+    return [
+        (
+            dataset.start + timedelta(seconds=(first_step + index // len(sensors)) * dataset.interval_seconds),
+            sensors[index % len(sensors)],
+            -1.0,
+        )
+        for index in range(rows)
+    ]
+
+
+def _as_rows(records: list[ReadingRecord]) -> list[dict]:
+    return [{"time": time, "sensor_id": sensor_id, "value": value} for time, sensor_id, value in records]
+
+
+async def _create_many(session: AsyncSession, dataset: Dataset, _iteration: int) -> int:
+    await ReadingRepository(session).create_many(_as_rows(_new_records(dataset, _WRITE_ROWS)))
+    return _WRITE_ROWS
+
+
+async def _create_many_or_update(session: AsyncSession, dataset: Dataset, iteration: int) -> int:
+    await ReadingRepository(session).create_many_or_update(
+        _as_rows(_existing_records(dataset, iteration, _WRITE_ROWS)),
+        conflict_columns=["time", "sensor_id"],
+        update_columns=["value"],
+    )
+    return _WRITE_ROWS
+
+
+async def _copy_many(session: AsyncSession, dataset: Dataset, _iteration: int) -> int:
+    return await ReadingRepository(session).copy_many(_new_records(dataset, _COPY_ROWS))
+
+
+async def _upsert_latest(session: AsyncSession, dataset: Dataset, _iteration: int) -> int:
+    records = _new_records(dataset, len(dataset.sensor_ids))
+    return len(await SensorLatestRepository(session).upsert_many(records))
+
+
+def _sensor(dataset: Dataset, iteration: int) -> UUID:
+    return dataset.sensor_ids[iteration % len(dataset.sensor_ids)]
+
+
+async def _get_multi_shallow(session: AsyncSession, dataset: Dataset, iteration: int) -> int:
+    readings, _ = await ReadingRepository(session).get_multi(
+        offset=0, limit=_PAGE_SIZE, order_by="-time", sensor_id__eq=_sensor(dataset, iteration)
+    )
+    return len(readings)
+
+
+async def _get_multi_deep(session: AsyncSession, dataset: Dataset, iteration: int) -> int:
+    readings, _ = await ReadingRepository(session).get_multi(
+        offset=max(dataset.readings_per_sensor - _PAGE_SIZE, 0),
+        limit=_PAGE_SIZE,
+        order_by="-time",
+        sensor_id__eq=_sensor(dataset, iteration),
+    )
+    return len(readings)
+
+
+async def _get_multi_by_cursor(session: AsyncSession, dataset: Dataset, iteration: int) -> int:
+    readings, _, _ = await ReadingRepository(session).get_multi_by_cursor(
+        limit=_PAGE_SIZE, order_by="-time", sensor_id__eq=_sensor(dataset, iteration)
+    )
+    return len(readings)
+
+
+async def _count_sensor(session: AsyncSession, dataset: Dataset, iteration: int) -> int:
+    await ReadingRepository(session).count({"sensor_id__eq": _sensor(dataset, iteration)})
+    return 1
+
+
+async def _count_all(session: AsyncSession, _dataset: Dataset, _iteration: int) -> int:
+    await ReadingRepository(session).count({})
+    return 1
+
+
+def _series(sensors: int, span: timedelta, resolution: ReadingResolutionEnum) -> ScenarioRun:
+    async def run(session: AsyncSession, dataset: Dataset, iteration: int) -> int:
+        sensor_ids = [_sensor(dataset, iteration + index) for index in range(sensors)]
+        end = min(dataset.start + span, dataset.end)
+        rows = await ReadingRepository(session).get_series(sensor_ids, dataset.start, end, resolution)
+        return len(rows)
+
+    return run
+
+
+async def _stream_range(session: AsyncSession, dataset: Dataset, iteration: int) -> int:
+    sensor_ids = [_sensor(dataset, iteration + index) for index in range(10)]
+    end = min(dataset.start + timedelta(days=1), dataset.end)
+    rows = 0
+    async for times, _, _ in ReadingRepository(session).stream_range(sensor_ids, dataset.start, end):
+        rows += len(times)
+    return rows
+
+
+SCENARIOS: list[Scenario] = [
+    Scenario("create_many[1k]", _create_many, writes=True),
+    Scenario("create_many_or_update[1k]", _create_many_or_update, writes=True),
+    Scenario("copy_many[50k]", _copy_many, writes=True),
+    Scenario("sensor_latest.upsert_many", _upsert_latest, writes=True),
+    Scenario("get_multi[shallow]", _get_multi_shallow),
+    Scenario("get_multi[deep]", _get_multi_deep),
+    Scenario("get_multi_by_cursor[first]", _get_multi_by_cursor),
+    Scenario("count[sensor]", _count_sensor),
+    Scenario("count[all]", _count_all),
+    Scenario("get_series[raw,sensors=1,span=1h]", _series(1, timedelta(hours=1), ReadingResolutionEnum.RAW)),
+    Scenario("get_series[raw,sensors=10,span=1d]", _series(10, timedelta(days=1), ReadingResolutionEnum.RAW)),
+    Scenario("get_series[1h,sensors=10,span=all]", _series(10, timedelta(days=3650), ReadingResolutionEnum.HOUR)),
+    Scenario("stream_range[sensors=10,span=1d]", _stream_range),
+]
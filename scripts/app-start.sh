@@ -46,4 +46,5 @@ sleep 2
 # Execute the main process
 alembic upgrade head
 echo "Migrations applied."
-python -m app.main
+# exec hands signals to the server so workers run their shutdown hooks on container stop
+exec python -m app.main
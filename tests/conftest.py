@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+# Settings are read on import of the app package; tests that do not touch these services only need them present.
+for _name, _value in {
+    "SERVER_HOST": "127.0.0.1",
+    "SERVER_PORT": "8000",
+    "FRONTEND_URL": '["*"]',
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_PASSWORD": "postgres",
+    "POSTGRES_DB": "postgres",
+    "AUTH_SECRET_KEY": "test",
+    "AUTH_MINUTES_BETWEEN_REQUESTS": "1",
+    "SWAGGER_USERNAME": "test",
+    "SWAGGER_PASSWORD": "test",
+    "ADMIN_USERNAME": "test",
+    "ADMIN_PASSWORD": "test",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
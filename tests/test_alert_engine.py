@@ -0,0 +1,126 @@
+import uuid
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from app.enums import AlertRuleKindEnum
+from app.models import AlertRule
+from app.repositories import ReadingRecord
+from app.services.alert_engine import AlertEngine
+
+SENSOR = uuid.uuid4()
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+async def _no_rules() -> list[AlertRule]:
+    return []
+
+
+def _rule(kind: AlertRuleKindEnum, threshold: float, hysteresis: float = 0.0, duration: float = 0.0) -> AlertRule:
+    return AlertRule(
+        id=uuid.uuid4(),
+        sensor_id=SENSOR,
+        name="rule",
+        kind=kind,
+        threshold=threshold,
+        hysteresis=hysteresis,
+        duration_seconds=duration,
+        is_active=True,
+    )
+
+
+def _engine(*rules: AlertRule) -> AlertEngine:
+    engine = AlertEngine(loader=_no_rules)
+    engine.load(rules)
+    return engine
+
+
+def _records(values: Sequence[float], sensor_id: UUID = SENSOR, step: float = 1.0) -> list[ReadingRecord]:
+    return [(START + timedelta(seconds=index * step), sensor_id, value) for index, value in enumerate(values)]
+
+
+def _fired(engine: AlertEngine, records: Sequence[ReadingRecord], stored: dict[UUID, Any] | None = None) -> list:
+    return [(alert["created_at"], alert["triggered_value"]) for alert in engine.evaluate(records, stored or {}).alerts]
+
+
+def _rows(states: list[dict[str, Any]]) -> dict[UUID, Any]:
+    """State rows as ``AlertRuleStateRepository.lock`` returns them."""
+
+    return {state["rule_id"]: SimpleNamespace(**state) for state in states}
+
+
+def test_threshold_fires_once_and_rearms_past_hysteresis() -> None:
+    engine = _engine(_rule(AlertRuleKindEnum.ABOVE, 10.0, hysteresis=1.0))
+    records = _records([5, 11, 12, 9.5, 11, 8.5, 11])
+
+    # 9.5 is still within the hysteresis band, so only the drop to 8.5 re-arms the rule.
+    assert _fired(engine, records) == [(records[1][0], 11), (records[6][0], 11)]
+
+
+def test_below_rule_watches_the_other_side() -> None:
+    engine = _engine(_rule(AlertRuleKindEnum.BELOW, 0.0, hysteresis=2.0))
+    records = _records([1, -1, 1, 3, -0.5])
+
+    assert _fired(engine, records) == [(records[1][0], -1), (records[4][0], -0.5)]
+
+
+def test_duration_requires_the_condition_to_hold() -> None:
+    engine = _engine(_rule(AlertRuleKindEnum.ABOVE, 10.0, duration=10.0))
+    # Held for 5 seconds, interrupted, then held for 10 seconds.
+    records = _records([11, 11, 5, 11, 11, 11, 11], step=5.0)
+
+    assert _fired(engine, records) == [(records[5][0], 11)]
+
+
+def test_rate_compares_the_change_per_second() -> None:
+    engine = _engine(_rule(AlertRuleKindEnum.RATE_ABOVE, 1.0))
+    records = _records([0, 0.5, 3, 3.5, 0], step=1.0)
+
+    # The first reading has no predecessor; the rise to 3 and the drop to 0 are both faster than 1 per second.
+    assert _fired(engine, records) == [(records[2][0], 3), (records[4][0], 0)]
+
+
+def test_readings_of_sensors_without_rules_are_ignored() -> None:
+    engine = _engine(_rule(AlertRuleKindEnum.ABOVE, 10.0))
+    records = _records([20, 30], sensor_id=uuid.uuid4())
+
+    evaluation = engine.evaluate(records, {})
+
+    assert evaluation.alerts == [] and evaluation.states == []
+    assert engine.rule_ids(records) == []
+
+
+def test_unordered_batch_is_evaluated_in_time_order() -> None:
+    engine = _engine(_rule(AlertRuleKindEnum.ABOVE, 10.0))
+    records = _records([5, 11, 12])
+
+    assert _fired(engine, records[::-1]) == [(records[1][0], 11)]
+
+
+@pytest.mark.parametrize("split", [1, 2, 3, 5, 8])
+def test_state_carries_between_batches(split: int) -> None:
+    rules = [
+        _rule(AlertRuleKindEnum.ABOVE, 10.0, hysteresis=1.0, duration=2.0),
+        _rule(AlertRuleKindEnum.BELOW, 6.0),
+        _rule(AlertRuleKindEnum.RATE_ABOVE, 2.0),
+    ]
+    engine = _engine(*rules)
+    records = _records([5, 11, 12, 13, 9.5, 11, 14, 8, 4, 11, 12, 13])
+
+    expected = engine.evaluate(records, {})
+    alerts, stored = [], {}
+    for index in range(0, len(records), split):
+        evaluation = engine.evaluate(records[index : index + split], stored)
+        alerts.extend(evaluation.alerts)
+        stored.update(_rows(evaluation.states))
+
+    def key(alert: dict[str, Any]) -> tuple:
+        return alert["rule_id"], alert["created_at"]
+
+    assert sorted(map(key, alerts)) == sorted(map(key, expected.alerts))
+    assert sorted(engine.rule_ids(records)) == sorted(rule.id for rule in rules)
+    assert stored == _rows(expected.states)
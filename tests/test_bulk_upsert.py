@@ -0,0 +1,115 @@
+import uuid
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.enums import SecurityPolicyEnum
+from app.repositories import OpcServerRepository, SensorRepository, UpsertResult
+
+pytestmark = pytest.mark.anyio
+
+SERVER = uuid.uuid4()
+
+
+class _Result:
+    def __init__(self, flags: list[bool]) -> None:
+        self._flags = flags
+
+    def scalars(self) -> "_Result":
+        return self
+
+    def all(self) -> list[bool]:
+        return self._flags
+
+
+class _Session:
+    """
+    Session stand-in for a table whose conflict key is the first two columns of every statement.
+
+    Each execution reports, per row, whether the key was new, the way ``RETURNING xmax = 0`` does.
+    """
+
+    def __init__(self, existing: set[tuple[Any, Any]] = frozenset()) -> None:
+        self.keys = set(existing)
+        self.executed: list[tuple[str, dict[str, Any]]] = []
+
+    async def execute(self, statement: Any, params: dict[str, Any]) -> _Result:
+        self.executed.append((str(statement.compile(dialect=postgresql.dialect())), params))
+        flags = []
+        for key in zip(params["column_0"], params["column_1"]):
+            flags.append(key not in self.keys)
+            self.keys.add(key)
+        return _Result(flags)
+
+
+def _sensor(name: str, node_id: str = "ns=2;s=Node") -> dict[str, Any]:
+    return {"opc_server_id": SERVER, "name": name, "node_id": node_id}
+
+
+async def test_rows_are_sent_as_one_array_per_column() -> None:
+    session = _Session()
+
+    await SensorRepository(session).bulk_upsert(
+        [_sensor("a"), _sensor("b")], conflict_columns=["opc_server_id", "name"], update_columns=["node_id"]
+    )
+
+    ((sql, params),) = session.executed
+    assert "FROM unnest(%(column_0)s::UUID[], %(column_1)s::VARCHAR(255)[], %(column_2)s::VARCHAR(255)[]" in sql
+    assert "ON CONFLICT (opc_server_id, name) DO UPDATE SET node_id = excluded.node_id" in sql
+    assert sql.endswith("RETURNING xmax = 0 AS inserted")
+    assert params["column_1"] == ["a", "b"]
+    # The id default is generated per row rather than once for the statement.
+    assert len(set(params["column_3"])) == 2
+
+
+async def test_enum_arrays_are_sent_by_name_and_cast() -> None:
+    session = _Session()
+    row = {"organization_id": uuid.uuid4(), "name": "plc", "url": "opc.tcp://plc:4840/"}
+
+    await OpcServerRepository(session).bulk_upsert(
+        [{**row, "security_policy": SecurityPolicyEnum.NONE}], conflict_columns=["organization_id", "name"]
+    )
+
+    ((sql, params),) = session.executed
+    assert "CAST(anon_1.column_3 AS securitypolicyenum)" in sql
+    assert "ON CONFLICT (organization_id, name) DO NOTHING" in sql
+    assert params["column_3"] == [SecurityPolicyEnum.NONE.name]
+
+
+async def test_counts_inserted_and_updated_rows_across_batches() -> None:
+    session = _Session(existing={(SERVER, "b"), (SERVER, "d")})
+    rows = [_sensor(name) for name in "abcde"]
+
+    result = await SensorRepository(session).bulk_upsert(
+        rows, conflict_columns=["opc_server_id", "name"], update_columns=["node_id"], batch_size=2
+    )
+
+    assert result == UpsertResult(inserted=3, updated=2)
+    assert len(session.executed) == 3
+    # Every batch reuses the one compiled statement.
+    assert len({sql for sql, _ in session.executed}) == 1
+
+
+async def test_repeated_conflict_keys_keep_the_last_row() -> None:
+    session = _Session()
+
+    result = await SensorRepository(session).bulk_upsert(
+        [_sensor("a", "first"), _sensor("b"), _sensor("a", "last")],
+        conflict_columns=["opc_server_id", "name"],
+        update_columns=["node_id"],
+    )
+
+    assert result == UpsertResult(inserted=2, updated=0)
+    ((_, params),) = session.executed
+    assert list(zip(params["column_1"], params["column_2"])) == [("a", "last"), ("b", "ns=2;s=Node")]
+
+
+async def test_empty_and_mismatched_rows() -> None:
+    session = _Session()
+    repository = SensorRepository(session)
+
+    assert await repository.bulk_upsert([], conflict_columns=["opc_server_id", "name"]) == UpsertResult(0, 0)
+    with pytest.raises(ValueError):
+        await repository.bulk_upsert([_sensor("a"), {"name": "b"}], conflict_columns=["opc_server_id", "name"])
+    assert session.executed == []
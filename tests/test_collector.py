@@ -0,0 +1,214 @@
+import asyncio
+import socket
+import uuid
+from collections.abc import AsyncIterator, Iterable, Sequence
+
+import pytest
+from asyncua import Server, ua
+from asyncua.crypto.permission_rules import User, UserRole
+from cryptography.fernet import Fernet
+from loguru import logger
+
+from app.enums import AuthMethodEnum, SecurityPolicyEnum
+from app.models import OpcServer, Sensor
+from app.repositories import ReadingRecord
+from app.schemas.collector import CollectorTarget
+from app.services import collector as collector_module
+from app.services.collector import CollectorService, load_collector_targets
+from app.utils.encryption import SecretCipher
+
+pytestmark = pytest.mark.anyio
+
+USERNAME = "operator"
+PASSWORD = "s3cret"
+NODE_ID = "ns=2;s=Line1.Temperature"
+
+
+class _UserManager:
+    def get_user(self, iserver, username=None, password=None, certificate=None) -> User | None:
+        if (username, password) == (USERNAME, PASSWORD):
+            return User(role=UserRole.User)
+        return None
+
+
+class _Buffer:
+    """Ingest buffer stand-in that keeps every offered reading."""
+
+    def __init__(self) -> None:
+        self.records: list[ReadingRecord] = []
+        self.received = asyncio.Event()
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def offer(self, records: Iterable[ReadingRecord]) -> None:
+        self.records.extend(records)
+        self.received.set()
+
+
+class _Engine:
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class _OpcServers:
+    def __init__(self, servers: Sequence[OpcServer]) -> None:
+        self._servers = servers
+
+    async def get_active_with_sensors(self) -> Sequence[OpcServer]:
+        return self._servers
+
+
+class _UnitOfWork:
+    """Unit of work stand-in whose OPC server repository returns fixed rows."""
+
+    def __init__(self, servers: Sequence[OpcServer]) -> None:
+        self.opc_servers = _OpcServers(servers)
+
+    async def __aenter__(self) -> "_UnitOfWork":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        pass
+
+
+@pytest.fixture
+def cipher(monkeypatch: pytest.MonkeyPatch) -> SecretCipher:
+    cipher = SecretCipher(Fernet.generate_key().decode())
+    monkeypatch.setattr(collector_module, "password_cipher", cipher)
+    return cipher
+
+
+def _stub_servers(monkeypatch: pytest.MonkeyPatch, *servers: OpcServer) -> None:
+    monkeypatch.setattr(collector_module, "SQLUnitOfWork", lambda: _UnitOfWork(servers))
+
+
+def _server_row(url: str, encrypted_password: str | None) -> OpcServer:
+    return OpcServer(
+        id=uuid.uuid4(),
+        url=url,
+        security_policy=SecurityPolicyEnum.NONE,
+        authentication_method=AuthMethodEnum.USERNAME,
+        username=USERNAME,
+        encrypted_password=encrypted_password,
+        sensors=[Sensor(id=uuid.uuid4(), node_id=NODE_ID)],
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+async def opc_server() -> AsyncIterator[tuple[str, object]]:
+    """In-process OPC UA server accepting ``USERNAME``/``PASSWORD`` with one writable temperature variable."""
+
+    server = Server(user_manager=_UserManager())
+    await server.init()
+    url = f"opc.tcp://127.0.0.1:{_free_port()}/"
+    server.set_endpoint(url)
+    server.set_security_policy([ua.SecurityPolicyType.NoSecurity])
+    server.set_security_IDs(["Username"])
+
+    namespace = await server.register_namespace("urn:control-system:test")
+    device = await server.nodes.objects.add_object(namespace, "Line1")
+    variable = await device.add_variable(ua.NodeId("Line1.Temperature", namespace), "Temperature", 20.0)
+
+    async with server:
+        yield url, variable
+
+
+def _target(url: str, password: str | None) -> CollectorTarget:
+    return CollectorTarget(
+        id=uuid.uuid4(),
+        url=url,
+        security_policy=SecurityPolicyEnum.NONE,
+        authentication_method=AuthMethodEnum.USERNAME,
+        username=USERNAME,
+        password=password,
+        sensors={NODE_ID: uuid.uuid4()},
+    )
+
+
+async def _collect(target: CollectorTarget, buffer: _Buffer) -> asyncio.Task:
+    async def load() -> list[CollectorTarget]:
+        return [target]
+
+    service = CollectorService(buffer=buffer, targets_loader=load, engine=_Engine())
+    return asyncio.create_task(service.run())
+
+
+async def test_targets_carry_decrypted_passwords(monkeypatch, cipher) -> None:
+    stored = _server_row("opc.tcp://plc-1:4840/", cipher.encrypt(PASSWORD))
+    foreign = _server_row("opc.tcp://plc-2:4840/", SecretCipher(Fernet.generate_key().decode()).encrypt(PASSWORD))
+    anonymous = _server_row("opc.tcp://plc-3:4840/", None)
+    _stub_servers(monkeypatch, stored, foreign, anonymous)
+    messages: list[str] = []
+    sink = logger.add(messages.append, level="ERROR", format="{message}")
+
+    try:
+        targets = await load_collector_targets()
+    finally:
+        logger.remove(sink)
+
+    assert [(target.id, target.password) for target in targets] == [(stored.id, PASSWORD), (anonymous.id, None)]
+    assert targets[0].sensors == {NODE_ID: stored.sensors[0].id}
+    assert len(messages) == 1 and foreign.url in messages[0]
+
+
+def test_cipher_round_trip_and_rotation() -> None:
+    old_key, new_key = Fernet.generate_key().decode(), Fernet.generate_key().decode()
+    token = SecretCipher(old_key).encrypt(PASSWORD)
+
+    assert token != PASSWORD
+    assert SecretCipher(f"{new_key},{old_key}").decrypt(token) == PASSWORD
+    with pytest.raises(ValueError):
+        SecretCipher(new_key).decrypt(token)
+    with pytest.raises(ValueError):
+        SecretCipher(None).decrypt(token)
+
+
+async def test_collector_authenticates_with_decrypted_password(opc_server, monkeypatch, cipher) -> None:
+    url, variable = opc_server
+    row = _server_row(url, cipher.encrypt(PASSWORD))
+    _stub_servers(monkeypatch, row)
+    buffer = _Buffer()
+
+    service = CollectorService(buffer=buffer, targets_loader=load_collector_targets, engine=_Engine())
+    task = asyncio.create_task(service.run())
+    try:
+        # The subscription reports the initial value first, then every change.
+        await asyncio.wait_for(buffer.received.wait(), 10)
+        buffer.received.clear()
+        await variable.write_value(21.5)
+        await asyncio.wait_for(buffer.received.wait(), 10)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    sensor_id = row.sensors[0].id
+    assert [(record[1], record[2]) for record in buffer.records[-1:]] == [(sensor_id, 21.5)]
+    assert {record[1] for record in buffer.records} == {sensor_id}
+
+
+async def test_collector_is_rejected_with_encrypted_password(opc_server) -> None:
+    url, _ = opc_server
+    cipher = SecretCipher(Fernet.generate_key().decode())
+    buffer = _Buffer()
+
+    task = await _collect(_target(url, cipher.encrypt(PASSWORD)), buffer)
+    try:
+        await asyncio.sleep(2)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert buffer.records == []
@@ -0,0 +1,118 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.exc import BadRequestException
+from app.models import Alert
+from app.repositories import AlertRepository
+from app.utils.cursor import decode_cursor, encode_cursor
+
+pytestmark = pytest.mark.anyio
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+KEY_COLUMNS = [Alert.__table__.c.created_at, Alert.__table__.c.id]
+
+
+class _Result:
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+
+    def scalars(self) -> "_Result":
+        return self
+
+    def all(self) -> list[Any]:
+        return self._rows
+
+
+class _Session:
+    """Session stand-in that records executed statements and answers with fixed rows."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+        self.executed: list[tuple[str, dict[str, Any]]] = []
+
+    async def execute(self, statement: Any, params: dict[str, Any] | None = None) -> _Result:
+        self.executed.append((str(statement.compile(dialect=postgresql.dialect())), params or {}))
+        return _Result(self.rows)
+
+
+def _alerts(count: int) -> list[Alert]:
+    sensor_id = uuid.uuid4()
+    return [
+        Alert(
+            id=uuid.uuid4(),
+            sensor_id=sensor_id,
+            message="alert",
+            triggered_value=float(index),
+            created_at=START - timedelta(minutes=index),
+        )
+        for index in range(count)
+    ]
+
+
+def test_cursor_round_trip() -> None:
+    values = [START, uuid.uuid4()]
+
+    cursor = encode_cursor("-created_at", values)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "-created_at", KEY_COLUMNS) == values
+
+
+@pytest.mark.parametrize(
+    ("cursor", "order_by", "columns"),
+    [
+        (encode_cursor("-created_at", [START.isoformat(), str(uuid.uuid4())]), "created_at", KEY_COLUMNS),
+        (encode_cursor("-created_at", [START.isoformat()]), "-created_at", KEY_COLUMNS),
+        (encode_cursor("-created_at", ["yesterday", str(uuid.uuid4())]), "-created_at", KEY_COLUMNS),
+        ("not a cursor", "-created_at", KEY_COLUMNS),
+    ],
+    ids=["other order", "wrong length", "bad value", "garbage"],
+)
+def test_invalid_cursor_is_a_bad_request(cursor: str, order_by: str, columns: list) -> None:
+    with pytest.raises(BadRequestException):
+        decode_cursor(cursor, order_by, columns)
+
+
+async def test_page_returns_cursor_of_its_last_row() -> None:
+    alerts = _alerts(3)
+    session = _Session(alerts)
+
+    page, next_cursor, total = await AlertRepository(session).get_multi_by_cursor(limit=2, order_by="-created_at")
+
+    assert page == alerts[:2] and total is None
+    assert decode_cursor(next_cursor, "-created_at", KEY_COLUMNS) == [alerts[1].created_at, alerts[1].id]
+    (sql, params), *_ = session.executed
+    assert "ORDER BY alerts.created_at DESC, alerts.id DESC" in sql
+    assert params["limit"] == 3
+
+
+async def test_last_page_has_no_cursor() -> None:
+    alerts = _alerts(2)
+
+    page, next_cursor, _ = await AlertRepository(_Session(alerts)).get_multi_by_cursor(limit=2, order_by="-created_at")
+
+    assert page == alerts and next_cursor is None
+
+
+@pytest.mark.parametrize(
+    ("order_by", "operator", "direction"), [("-created_at", "<", "DESC"), ("created_at", ">", "ASC")]
+)
+async def test_next_page_continues_after_the_cursor(order_by: str, operator: str, direction: str) -> None:
+    position = [START, uuid.uuid4()]
+    session = _Session([])
+    sensor_id = uuid.uuid4()
+
+    await AlertRepository(session).get_multi_by_cursor(
+        limit=2, order_by=order_by, cursor=encode_cursor(order_by, position), sensor_id=sensor_id
+    )
+
+    (sql, params), *_ = session.executed
+    # A row-value comparison continues strictly after the last row, also between rows with equal timestamps.
+    assert f"(alerts.created_at, alerts.id) {operator} (%(key_0)s::TIMESTAMP WITH TIME ZONE, %(key_1)s::UUID)" in sql
+    assert f"ORDER BY alerts.created_at {direction}, alerts.id {direction}" in sql
+    assert [params["key_0"], params["key_1"]] == position
+    assert sensor_id in params.values()
@@ -0,0 +1,161 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config.ingest import IngestConfig
+from app.core.exc import BadRequestException, ServiceUnavailableException
+from app.repositories import ReadingRecord
+from app.services.ingest_buffer import IngestBuffer
+
+pytestmark = pytest.mark.anyio
+
+SENSOR = uuid.uuid4()
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _config(**overrides: float) -> IngestConfig:
+    defaults = {
+        "BATCH_SIZE": 4,
+        "MAX_AGE_SECONDS": 60.0,
+        "MAX_PENDING": 8,
+        "PUT_TIMEOUT_SECONDS": 0.1,
+        "RETRY_MIN_SECONDS": 0.0,
+        "RETRY_MAX_SECONDS": 0.0,
+        "RETRY_MAX_ATTEMPTS": 3,
+        "DRAIN_TIMEOUT_SECONDS": 5.0,
+    }
+    return IngestConfig().model_copy(update={**defaults, **overrides})
+
+
+def _records(count: int, offset: int = 0) -> list[ReadingRecord]:
+    return [(START + timedelta(seconds=offset + index), SENSOR, float(offset + index)) for index in range(count)]
+
+
+class _Sink:
+    """Keeps every written batch; can be held closed, or fail the first calls or batches containing given values."""
+
+    def __init__(self, failures: int = 0, invalid: frozenset[float] = frozenset()) -> None:
+        self.batches: list[list[ReadingRecord]] = []
+        self.calls = 0
+        self.open = asyncio.Event()
+        self.open.set()
+        self._failures = failures
+        self._invalid = invalid
+
+    @property
+    def written(self) -> list[ReadingRecord]:
+        return [record for batch in self.batches for record in batch]
+
+    async def __call__(self, batch: list[ReadingRecord]) -> None:
+        self.calls += 1
+        await self.open.wait()
+        if self.calls <= self._failures:
+            raise ConnectionError("database unavailable")
+        if any(record[2] in self._invalid for record in batch):
+            raise IntegrityError("INSERT", {}, Exception("violates check constraint"))
+        self.batches.append(batch)
+
+
+async def test_full_batches_flush_without_waiting_for_max_age() -> None:
+    sink = _Sink()
+    buffer = IngestBuffer(sink, _config())
+    await buffer.start()
+
+    await buffer.put(_records(6))
+    await asyncio.sleep(0.05)
+
+    assert [len(batch) for batch in sink.batches] == [4]
+    await buffer.stop()
+    assert [len(batch) for batch in sink.batches] == [4, 2]
+    assert sink.written == _records(6) and buffer.pending == 0
+
+
+async def test_partial_batch_flushes_after_max_age() -> None:
+    sink = _Sink()
+    buffer = IngestBuffer(sink, _config(MAX_AGE_SECONDS=0.05))
+    await buffer.start()
+
+    await buffer.put(_records(2))
+    await asyncio.sleep(0.2)
+
+    assert sink.written == _records(2)
+    await buffer.stop()
+
+
+async def test_backpressure_while_the_database_lags() -> None:
+    sink = _Sink()
+    sink.open.clear()
+    buffer = IngestBuffer(sink, _config())
+    await buffer.start()
+
+    await buffer.put(_records(8))
+    with pytest.raises(ServiceUnavailableException):
+        await buffer.put(_records(1, offset=8))
+    assert not buffer.offer(_records(1, offset=8))
+    assert buffer.dropped == 1 and buffer.pending == 8
+
+    # A put waiting for room goes through once the stuck batch is written.
+    waiting = asyncio.create_task(buffer.put(_records(1, offset=9), timeout=5))
+    await asyncio.sleep(0.05)
+    assert not waiting.done()
+    sink.open.set()
+    await waiting
+
+    await buffer.stop()
+    assert sorted(record[2] for record in sink.written) == [*range(8), 9]
+
+
+async def test_put_larger_than_capacity_is_refused() -> None:
+    buffer = IngestBuffer(_Sink(), _config())
+    await buffer.start()
+
+    with pytest.raises(BadRequestException):
+        await buffer.put(_records(9))
+    await buffer.stop()
+
+
+async def test_stopped_buffer_refuses_records() -> None:
+    buffer = IngestBuffer(_Sink(), _config())
+
+    with pytest.raises(ServiceUnavailableException):
+        await buffer.put(_records(1))
+    assert not buffer.offer(_records(1))
+
+
+async def test_transient_failures_are_retried() -> None:
+    sink = _Sink(failures=2)
+    buffer = IngestBuffer(sink, _config())
+    await buffer.start()
+
+    await buffer.put(_records(4))
+    await buffer.stop()
+
+    assert sink.calls == 3
+    assert sink.written == _records(4) and buffer.rejected == 0
+
+
+async def test_batch_is_dropped_after_the_last_attempt() -> None:
+    sink = _Sink(failures=10)
+    buffer = IngestBuffer(sink, _config())
+    await buffer.start()
+
+    await buffer.put(_records(4))
+    await buffer.stop()
+
+    assert sink.calls == 3
+    assert sink.written == [] and buffer.rejected == 4 and buffer.pending == 0
+
+
+async def test_rejected_batch_is_split_down_to_the_invalid_readings() -> None:
+    sink = _Sink(invalid=frozenset({1.0, 6.0}))
+    buffer = IngestBuffer(sink, _config(BATCH_SIZE=8))
+    await buffer.start()
+
+    await buffer.put(_records(8))
+    await buffer.stop()
+
+    assert sorted(record[2] for record in sink.written) == [0, 2, 3, 4, 5, 7]
+    assert buffer.rejected == 2 and buffer.pending == 0
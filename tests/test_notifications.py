@@ -0,0 +1,40 @@
+import uuid
+from datetime import datetime, timezone
+
+from app.core.constants import NOTIFY_PAYLOAD_MAX_BYTES
+from app.schemas.alert import AlertRead
+from app.utils.notifications import decode_alerts, encode_alerts
+
+
+def _alert(message: str) -> AlertRead:
+    return AlertRead(
+        id=uuid.uuid4(),
+        sensor_id=uuid.uuid4(),
+        rule_id=uuid.uuid4(),
+        message=message,
+        triggered_value=1.5,
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_alerts_are_packed_by_size() -> None:
+    # Messages carry rule names of up to 255 characters, which no fixed count of alerts per payload can bound.
+    alerts = [_alert(f"Rule {index} " + "é" * 255) for index in range(100)]
+
+    payloads = list(encode_alerts(alerts))
+
+    assert len(payloads) > 1
+    assert all(len(payload.encode()) <= NOTIFY_PAYLOAD_MAX_BYTES for payload in payloads)
+    assert [alert for payload in payloads for alert in decode_alerts(payload)] == alerts
+
+
+def test_oversized_alert_is_cut_to_fit() -> None:
+    alert = _alert('"' * (2 * NOTIFY_PAYLOAD_MAX_BYTES))
+
+    (payload,) = encode_alerts([alert])
+
+    assert len(payload.encode()) <= NOTIFY_PAYLOAD_MAX_BYTES
+    (decoded,) = decode_alerts(payload)
+    assert decoded.id == alert.id
+    assert alert.message.startswith(decoded.message)
+    assert len(decoded.message) > NOTIFY_PAYLOAD_MAX_BYTES // 3